@@ -1,15 +1,20 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
+from flask import Flask, Request, render_template, request, redirect, url_for, flash, jsonify, session, Response
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.utils import secure_filename
 from datetime import datetime
 import os
 import json
+import tempfile
+import threading
 # Using enhanced custom implementation for transliteration
 from custom_indicate import enhanced_hindi2english, enhanced_marathi2english
 from custom_indicate.exception_detection import learn_from_corrections
-from googletrans import Translator
+from custom_indicate.warmup import start_warm_up, warm_up, warmup_status
+from custom_indicate.sharding import transliterate_parallel
+from custom_indicate.documents import check_document, document_extension, stream_transliterated_document
 
 # Initialize Flask application
 app = Flask(__name__)
@@ -22,11 +27,24 @@ db_path = os.path.join(os.path.dirname(__file__), 'database')
 if not os.path.exists(db_path):
     os.makedirs(db_path)
 
-# Configure database URI with absolute path
+# Configure database URI with absolute path (TRANSLITERATE_DATABASE_URI overrides it,
+# e.g. for load tests against a scratch database)
 db_file = os.path.join(db_path, 'transliterate.db')
-app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_file}'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('TRANSLITERATE_DATABASE_URI', f'sqlite:///{db_file}')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Worker processes for transliterating large documents in sentence shards
+# (0 or 1 transliterates every request in the serving process)
+SHARD_WORKERS = int(os.environ.get('TRANSLITERATE_SHARD_WORKERS', '0'))
+
+# Largest request body accepted by /process_file (uploads are streamed to
+# disk and processed paragraph by paragraph, so larger limits are safe).
+# Other routes have no request size cap.
+app.config['MAX_UPLOAD_BYTES'] = int(float(os.environ.get('TRANSLITERATE_MAX_UPLOAD_MB', '2')) * 1024 * 1024)
+
+# Worker processes extracting and transliterating PDF pages (0: one per CPU)
+PDF_WORKERS = int(os.environ.get('TRANSLITERATE_PDF_WORKERS', '0'))
+
 # Initialize database
 db = SQLAlchemy(app)
 login_manager = LoginManager()
@@ -54,9 +72,35 @@ class TransliterationHistory(db.Model):
 def load_user(user_id):
     return User.query.get(int(user_id))
 
-# Create database tables
-with app.app_context():
-    db.create_all()
+# Create database tables on first use rather than at import, so importing
+# the app (CLI tools, workers, tests) does not touch the database
+_db_initialized = False
+_db_lock = threading.Lock()
+
+def init_db():
+    global _db_initialized
+    if _db_initialized:
+        return
+    with _db_lock:
+        if not _db_initialized:
+            with app.app_context():
+                db.create_all()
+            _db_initialized = True
+
+@app.before_request
+def ensure_db():
+    init_db()
+
+# Translation client, created on the first /translate request
+_translator = None
+
+def get_translator():
+    global _translator
+    if _translator is None:
+        # googletrans is only needed for /translate; import it on first use
+        from googletrans import Translator
+        _translator = Translator()
+    return _translator
 
 # Add datetime utility for templates
 @app.context_processor
@@ -128,6 +172,16 @@ def dashboard():
     history = TransliterationHistory.query.filter_by(user_id=current_user.id).order_by(TransliterationHistory.created_at.desc()).limit(10).all()
     return render_template('dashboard.html', history=history)
 
+def request_features():
+    """Feature flags from the submitted form (all enabled unless set to 'false')"""
+    return {
+        'context_aware': request.form.get('context_aware', 'true').lower() == 'true',
+        'statistical_schwa': request.form.get('statistical_schwa', 'true').lower() == 'true',
+        'auto_exceptions': request.form.get('auto_exceptions', 'true').lower() == 'true',
+        'phonetic_refinement': request.form.get('phonetic_refinement', 'true').lower() == 'true',
+        'auto_capitalization': request.form.get('auto_capitalization', 'true').lower() == 'true'
+    }
+
 @app.route('/transliterate', methods=['POST'])
 def transliterate_text():
     print("Received transliteration request")
@@ -149,16 +203,13 @@ def transliterate_text():
     print(f"Language: {language}")
     
     # Get feature flags from form if available
-    features = {
-        'context_aware': request.form.get('context_aware', 'true').lower() == 'true',
-        'statistical_schwa': request.form.get('statistical_schwa', 'true').lower() == 'true',
-        'auto_exceptions': request.form.get('auto_exceptions', 'true').lower() == 'true',
-        'phonetic_refinement': request.form.get('phonetic_refinement', 'true').lower() == 'true',
-        'auto_capitalization': request.form.get('auto_capitalization', 'true').lower() == 'true'
-    }
+    features = request_features()
     
     try:
-        if language == 'hindi':
+        if language in ('hindi', 'marathi') and SHARD_WORKERS > 1:
+            # Short texts are still transliterated in this process
+            output_text = transliterate_parallel(input_text, language, features, SHARD_WORKERS)
+        elif language == 'hindi':
             output_text = enhanced_hindi2english(input_text, features)
         elif language == 'marathi':
             output_text = enhanced_marathi2english(input_text, features)
@@ -188,6 +239,71 @@ def transliterate_text():
     
     return jsonify({'output': output_text})
 
+class SpoolingRequest(Request):
+    """
+    Request whose file uploads are parsed straight into named temporary files,
+    so an upload can be handed to the document pipeline without copying it again.
+    Files a view does not claim (by removing them from spooled_paths) are
+    deleted when the request ends.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spooled_paths = []
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        suffix = os.path.splitext(filename or '')[1].lower()
+        spooled = tempfile.NamedTemporaryFile('w+b', suffix=suffix, delete=False)
+        self.spooled_paths.append(spooled.name)
+        return spooled
+
+app.request_class = SpoolingRequest
+
+@app.teardown_request
+def remove_unclaimed_uploads(exception=None):
+    for path in getattr(request, 'spooled_paths', ()):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+# Upload a .txt, .docx or .pdf file and download the transliterated text as it is produced
+@app.route('/process_file', methods=['POST'])
+def process_file():
+    # Check the size before request.files makes Werkzeug read the whole body
+    max_bytes = app.config['MAX_UPLOAD_BYTES']
+    if request.content_length is None:
+        return jsonify({'error': 'Content-Length required'}), 411
+    if request.content_length > max_bytes:
+        return jsonify({'error': f"Upload is larger than {max_bytes} bytes"}), 413
+    
+    upload = request.files.get('file')
+    if upload is None or not upload.filename:
+        return jsonify({'error': 'No file uploaded'}), 400
+    language = request.form.get('language', 'hindi')
+    if language not in ('hindi', 'marathi'):
+        return jsonify({'error': f"Unsupported language: {language}"}), 400
+    
+    try:
+        extension = document_extension(upload.filename)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    # Werkzeug parsed the upload into this file (see SpoolingRequest)
+    upload.stream.flush()
+    path = upload.stream.name
+    try:
+        check_document(path, extension)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # The generator removes the spooled file when the download finishes or is aborted
+    request.spooled_paths.remove(path)
+    stem = os.path.splitext(secure_filename(upload.filename))[0] or 'document'
+    return Response(stream_transliterated_document(path, extension, language, request_features(),
+                                                   pdf_workers=PDF_WORKERS or None),
+                    mimetype='text/plain; charset=utf-8',
+                    headers={'Content-Disposition': f'attachment; filename="{stem}_transliterated.txt"'})
+
 # Legacy route for backwards compatibility
 @app.route('/indicate', methods=['POST'])
 def indicate_text():
@@ -200,7 +316,7 @@ def translate_text():
     target_lang = request.form.get('target_lang', 'en')
     
     try:
-        translator = Translator()
+        translator = get_translator()
         translation = translator.translate(input_text, src=source_lang, dest=target_lang)
         return jsonify({'translation': translation.text})
     except Exception as e:
@@ -229,6 +345,16 @@ def batch_process():
 def analytics():
     return jsonify({'status': 'premium_required'})
 
+# Readiness probe: 200 once the engines are warmed up (see wsgi.py), 503 until then.
+# When the app is served without wsgi.py, the first probe starts warm-up in the background.
+@app.route('/ready')
+def ready():
+    if not warmup_status()['ready']:
+        start_warm_up(freeze=False)
+    status = warmup_status()
+    status['status'] = 'ready' if status['ready'] else 'warming_up'
+    return jsonify(status), 200 if status['ready'] else 503
+
 # API endpoint for submitting corrections and feedback
 @app.route('/feedback', methods=['POST'])
 def submit_feedback():
@@ -256,4 +382,6 @@ def submit_feedback():
 # Main application entry point
 
 if __name__ == '__main__':
+    init_db()
+    warm_up(freeze=False)
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the custom_indicate transliteration engine.
+Run individual benchmarks from the repository root, e.g.
+    python -m benchmarks.bench_gazetteer
+"""
@@ -0,0 +1,98 @@
+"""
+Edit distance benchmark: the full-matrix Levenshtein the evaluator used to
+compute, against the bit-parallel scalar and NumPy batch implementations,
+on (actual, expected) pairs shaped like transliteration results.
+
+Usage: python -m benchmarks.bench_edit_distance [--pairs 100000] [--max-words 8]
+"""
+
+import argparse
+import random
+import time
+from itertools import islice
+
+from custom_indicate.edit_distance import levenshtein, levenshtein_batch, np
+from custom_indicate.transliterate import hindi2english
+
+from .synthetic import SyntheticCorpus
+
+
+def build_pairs(count, max_words, seed=0):
+    """Transliterated phrases paired with copies carrying about 10% character edits"""
+    rnd = random.Random(seed)
+    words = SyntheticCorpus(vocabulary_size=20000, seed=seed).words()
+    letters = 'abcdefghijklmnopqrstuvwxyz '
+    actuals, expecteds = [], []
+    for _ in range(count):
+        actual = hindi2english(' '.join(islice(words, rnd.randint(1, max_words))))
+        expected = list(actual)
+        for _ in range(max(1, len(expected) // 10)):
+            op = rnd.random()
+            pos = rnd.randrange(len(expected) + 1)
+            if op < 0.4 and pos < len(expected):
+                expected[pos] = rnd.choice(letters)
+            elif op < 0.7:
+                expected.insert(pos, rnd.choice(letters))
+            elif pos < len(expected):
+                del expected[pos]
+        actuals.append(actual)
+        expecteds.append(''.join(expected))
+    return actuals, expecteds
+
+
+def matrix_levenshtein(actual, expected):
+    """The evaluator's original full (m+1) x (n+1) matrix implementation"""
+    m, n = len(actual), len(expected)
+    distance = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
+    for i in range(m + 1):
+        distance[i][0] = i
+    for j in range(n + 1):
+        distance[0][j] = j
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if actual[i-1] == expected[j-1]:
+                distance[i][j] = distance[i-1][j-1]
+            else:
+                distance[i][j] = min(distance[i-1][j] + 1, distance[i][j-1] + 1,
+                                     distance[i-1][j-1] + 1)
+    return distance[m][n]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pairs', type=int, default=100000)
+    parser.add_argument('--max-words', type=int, default=8)
+    parser.add_argument('--skip-matrix', action='store_true',
+                        help='Skip the slow full-matrix baseline')
+    args = parser.parse_args()
+
+    actuals, expecteds = build_pairs(args.pairs, args.max_words)
+    average = sum(map(len, actuals)) / len(actuals)
+    print(f"{args.pairs} pairs, average length {average:.1f} characters")
+
+    runs = []
+    if not args.skip_matrix:
+        runs.append(('full matrix', lambda: [matrix_levenshtein(a, b) for a, b in zip(actuals, expecteds)]))
+    runs.append(('bit-parallel', lambda: [levenshtein(a, b) for a, b in zip(actuals, expecteds)]))
+    if np is not None:
+        runs.append(('numpy batch', lambda: levenshtein_batch(actuals, expecteds)))
+    else:
+        print("NumPy not installed; skipping the batch run")
+
+    reference = None
+    for name, func in runs:
+        result, seconds = timed(func)
+        if reference is None:
+            reference = result
+        status = 'ok' if result == reference else 'MISMATCH'
+        print(f"  {name:13} {seconds:8.2f} s  {args.pairs / seconds:>10.0f} pairs/s  {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Gazetteer benchmark: memory footprint and per-token lookup time for
+in-memory and memory-mapped name lists, compared with the regex alternation
+that capitalize_proper_nouns used before the gazetteer.
+
+Usage: python -m benchmarks.bench_gazetteer [--names 50000] [--lookups 200000]
+"""
+
+import argparse
+import os
+import random
+import re
+import tempfile
+import time
+import tracemalloc
+
+from custom_indicate.gazetteer import Gazetteer, compile_gazetteer
+
+SYLLABLES = ['ra', 'ma', 'shya', 'kri', 'shna', 'su', 'de', 'vi', 'ja', 'ya',
+             'pra', 'kash', 'a', 'nil', 'sun', 'dar', 'lak', 'shmi', 'go', 'pal']
+PLACE_SUFFIXES = ['nagar', 'pur', 'garh', 'pattan', 'bad']
+
+
+def generate_names(count, seed=0):
+    """Generate a reproducible list of distinct name-like tokens"""
+    rnd = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        names.add(''.join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 5))))
+    return sorted(names)
+
+
+def time_lookups(check, tokens):
+    """Return the mean lookup time in nanoseconds"""
+    start = time.perf_counter()
+    for token in tokens:
+        check(token)
+    return (time.perf_counter() - start) / len(tokens) * 1e9
+
+
+def measure_build(build):
+    """Return (result, bytes allocated while building)"""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--names', type=int, default=50000)
+    parser.add_argument('--lookups', type=int, default=200000)
+    parser.add_argument('--regex-names', type=int, default=2000,
+                        help='Name count for the regex baseline (it grows slowly)')
+    args = parser.parse_args()
+
+    names = generate_names(args.names)
+    rnd = random.Random(1)
+    # Half hits, half misses (misses include place-suffix tokens)
+    tokens = [rnd.choice(names) for _ in range(args.lookups // 2)]
+    tokens += [rnd.choice(SYLLABLES) + rnd.choice(PLACE_SUFFIXES + ['xyz', 'q'])
+               for _ in range(args.lookups - len(tokens))]
+    rnd.shuffle(tokens)
+
+    print(f"Gazetteer benchmark: {len(names)} names, {len(tokens)} lookups")
+    print(f"{'structure':<28}{'memory (KiB)':>14}{'lookup (ns)':>14}")
+
+    in_memory, mem = measure_build(lambda: Gazetteer(names, PLACE_SUFFIXES))
+    lookup = time_lookups(in_memory.is_proper_noun, tokens)
+    print(f"{'frozenset + suffix trie':<28}{mem / 1024:>14.1f}{lookup:>14.0f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'names.gaz')
+        compile_gazetteer(names, PLACE_SUFFIXES, path)
+        mapped, mem = measure_build(lambda: Gazetteer.from_compiled(path))
+        lookup = time_lookups(mapped.is_proper_noun, tokens)
+        size = os.path.getsize(path)
+        print(f"{'mmap hash table':<28}{mem / 1024:>14.1f}{lookup:>14.0f}"
+              f"   (file {size / 1024:.1f} KiB, shared via page cache)")
+        mapped._table.close()
+
+    # Regex baseline: one alternation over the names, substituted over running
+    # text the way capitalize_proper_nouns used to do it
+    subset = names[:args.regex_names]
+    pattern, mem = measure_build(lambda: re.compile(
+        '|'.join(fr'\b{name}\b' for name in subset), re.IGNORECASE))
+    regex_tokens = tokens[:min(len(tokens), 20000)]
+    text = ' '.join(regex_tokens)
+    start = time.perf_counter()
+    pattern.sub(lambda m: m.group(0).capitalize(), text)
+    lookup = (time.perf_counter() - start) / len(regex_tokens) * 1e9
+    print(f"{f'regex alternation ({len(subset)})':<28}{mem / 1024:>14.1f}{lookup:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Phonetic refinement benchmark: cost per call of apply_refined_phonetic_rules
+with the original per-call refiner construction and uncompiled re.sub loop,
+against the cached refiner with precompiled, merged rules.
+
+Usage: python -m benchmarks.bench_phonetic [--calls 5000]
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from custom_indicate.phonetic_refinement import (
+    PhoneticRuleRefiner,
+    apply_refined_phonetic_rules
+)
+
+SAMPLE = "namaste duniyaa meraa naam raahul hai main bhaarat se hoon kshatriya dharma"
+
+
+def legacy_apply(text, language='hindi'):
+    """apply_refined_phonetic_rules as it was before compiled rules"""
+    refiner = PhoneticRuleRefiner(language)
+    result = text
+    for category in refiner.refined_rules.keys():
+        for pattern, replacement in sorted(
+            refiner.refined_rules[category],
+            key=lambda x: refiner.rule_weights.get((category, x[0]), 0.0),
+            reverse=True
+        ):
+            prev_result = result
+            result = re.sub(pattern, replacement, result)
+            if prev_result != result:
+                refiner.rule_stats[(category, pattern)] += 1
+    return result
+
+
+def per_call_us(func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        result = func(SAMPLE)
+    return result, (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=5000)
+    args = parser.parse_args()
+
+    # Rules files are resolved relative to the working directory; write the
+    # default rules out as a trained deployment would have them
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            PhoneticRuleRefiner('hindi').save_rules()
+            expected, legacy = per_call_us(legacy_apply, args.calls)
+            result, compiled = per_call_us(apply_refined_phonetic_rules, args.calls)
+        finally:
+            os.chdir(cwd)
+
+    if result != expected:
+        raise SystemExit("Compiled phonetic rules produced different output")
+
+    print(f"Phonetic refinement: {args.calls} calls on {len(SAMPLE.split())} words")
+    print(f"{'legacy (new refiner, re.sub)':<32}{legacy:>10.1f} us/call")
+    print(f"{'cached refiner, compiled rules':<32}{compiled:>10.1f} us/call")
+    print(f"Speedup: {legacy / compiled:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
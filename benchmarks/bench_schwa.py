@@ -0,0 +1,95 @@
+"""
+Schwa deletion benchmark: per-word cost of the original pattern-by-pattern
+implementation against the compiled, memoized engine used by apply_schwa_rules,
+plus per-position against batch scoring for the statistical syllable model.
+
+Usage: python -m benchmarks.bench_schwa [--words 200000] [--vocabulary 5000]
+"""
+
+import argparse
+import random
+import time
+
+from custom_indicate import schwa_deletion
+from custom_indicate.schwa_deletion import (
+    apply_schwa_rules,
+    apply_statistical_schwa_deletion,
+    calculate_schwa_deletion_probability,
+    delete_schwa,
+    score_schwa_deletion,
+    syllabify
+)
+from custom_indicate.transliterate import HINDI_CHARS, hindi2english
+
+# Single consonant/consonant+matra keys make plausible word building blocks
+SYLLABLES = sorted(key for key in HINDI_CHARS if 1 <= len(key) <= 2 and 'क' <= key[0] <= 'ह')
+
+
+def build_corpus(word_count, vocabulary_size, seed=0):
+    """Return (transliterated text, original text) with repeated vocabulary"""
+    rnd = random.Random(seed)
+    vocabulary = []
+    for _ in range(vocabulary_size):
+        original = ''.join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(1, 4)))
+        vocabulary.append((hindi2english(original).lower(), original))
+
+    pairs = [rnd.choice(vocabulary) for _ in range(word_count)]
+    return ' '.join(p[0] for p in pairs), ' '.join(p[1] for p in pairs)
+
+
+def legacy_schwa_rules(text, original_text=None):
+    """apply_schwa_rules as it was before the compiled engine"""
+    words = text.split()
+    original_words = original_text.split() if original_text else [None] * len(words)
+    for i, (word, original) in enumerate(zip(words, original_words)):
+        words[i] = apply_statistical_schwa_deletion(word, original)
+    return ' '.join(words)
+
+
+def per_word_ns(func, text, original, word_count):
+    start = time.perf_counter()
+    result = func(text, original)
+    return result, (time.perf_counter() - start) / word_count * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=200000)
+    parser.add_argument('--vocabulary', type=int, default=5000)
+    args = parser.parse_args()
+
+    text, original = build_corpus(args.words, args.vocabulary)
+
+    expected, legacy = per_word_ns(legacy_schwa_rules, text, original, args.words)
+    delete_schwa.cache_clear()
+    cold_result, cold = per_word_ns(apply_schwa_rules, text, original, args.words)
+    warm_result, warm = per_word_ns(apply_schwa_rules, text, original, args.words)
+
+    if not expected == cold_result == warm_result:
+        raise SystemExit("Compiled schwa engine produced different output")
+
+    print(f"Schwa deletion: {args.words} words, {args.vocabulary} distinct")
+    print(f"{'legacy (5 x re.sub per word)':<34}{legacy:>10.0f} ns/word")
+    print(f"{'compiled engine, first pass':<34}{cold:>10.0f} ns/word")
+    print(f"{'compiled engine, warm cache':<34}{warm:>10.0f} ns/word")
+    print(f"Speedup (warm): {legacy / warm:.1f}x   cache: {delete_schwa.cache_info()}")
+
+    # Statistical model: per-position scoring against the batch scorer
+    words = original.split()
+    start = time.perf_counter()
+    for word in words:
+        for position in range(len(syllabify(word))):
+            calculate_schwa_deletion_probability(word, position)
+    scalar = (time.perf_counter() - start) / len(words) * 1e9
+    # The first call imports NumPy
+    score_schwa_deletion(words[:1])
+    start = time.perf_counter()
+    score_schwa_deletion(words)
+    batch = (time.perf_counter() - start) / len(words) * 1e9
+    mode = 'NumPy' if schwa_deletion.np is not None else 'pure Python fallback'
+    print(f"{'syllable scoring, per position':<34}{scalar:>10.0f} ns/word")
+    print(f"{f'syllable scoring, batch ({mode})':<34}{batch:>10.0f} ns/word")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Sentence-sharded transliteration benchmark: one large document transliterated
+serially against in sentence shards across worker processes, checking that
+both give the same output.
+
+Usage: python -m benchmarks.bench_sharding [--size-mb 2] [--workers 4] [--language hindi]
+"""
+
+import argparse
+import time
+
+from custom_indicate.enhanced_transliteration import get_transliterator
+from custom_indicate.parallel import default_workers
+from custom_indicate.sharding import get_pool, shard_size, transliterate_parallel
+
+from .corpora import document
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=float, default=2)
+    parser.add_argument('--workers', type=int, default=default_workers())
+    parser.add_argument('--language', choices=['hindi', 'marathi'], default='hindi')
+    args = parser.parse_args()
+
+    text = document(args.size_mb)[0]
+    workers = max(args.workers, 2)
+    print(f"{len(text):,} characters, {workers} workers, "
+          f"shards of ~{shard_size(len(text), workers):,} characters")
+
+    # Start the pool (and warm its engines) outside the measurement
+    transliterator = get_transliterator(args.language)
+    pool = get_pool(args.language, workers)
+    list(pool.map(abs, range(workers)))
+
+    start = time.perf_counter()
+    serial = transliterator.transliterate(text)
+    serial_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sharded = transliterate_parallel(text, args.language, workers=workers)
+    sharded_seconds = time.perf_counter() - start
+
+    print(f"{'serial':10}{serial_seconds:>10.2f} s")
+    print(f"{'sharded':10}{sharded_seconds:>10.2f} s  ({serial_seconds / sharded_seconds:.2f}x)")
+    print(f"identical output: {serial == sharded}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Startup benchmark: time to import the package entry points in a fresh
+interpreter, and a budget check for the basic converter, which short-lived
+batch workers and CLI tools import on their own.
+
+Usage: python -m benchmarks.bench_startup [--runs 15] [--budget-ms 30]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from .synthetic import REPO_DIR
+
+# Name -> statement whose cost is measured after interpreter startup
+STATEMENTS = {
+    'hindi2english': 'from custom_indicate import hindi2english',
+    'EnhancedTransliterator': 'from custom_indicate import EnhancedTransliterator',
+    'engine construction': ("from custom_indicate import EnhancedTransliterator; "
+                            "EnhancedTransliterator('hindi')"),
+    'language pack': ("from custom_indicate.language_pack import load_language_pack; "
+                      "load_language_pack('hindi')"),
+    'web app': 'import app',
+}
+
+BUDGET_STATEMENT = 'hindi2english'
+
+_TIMER_SOURCE = r'''
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'modules': sorted(sys.modules)}))
+'''
+
+
+def time_statement(statement):
+    """
+    Seconds spent running statement in a fresh interpreter
+
+    Returns:
+        (seconds, loaded module names), or None if the statement failed
+    """
+    process = subprocess.run([sys.executable, '-c', _TIMER_SOURCE, statement],
+                             capture_output=True, text=True, cwd=REPO_DIR)
+    if process.returncode != 0:
+        error = process.stderr.strip().splitlines()
+        print(f"Error running {statement!r}: {error[-1] if error else process.returncode}")
+        return None
+    result = json.loads(process.stdout.splitlines()[-1])
+    return result['seconds'], result['modules']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=30,
+                        help=f'Median budget for importing {BUDGET_STATEMENT}')
+    args = parser.parse_args()
+
+    medians = {}
+    for name, statement in STATEMENTS.items():
+        runs = []
+        for _ in range(args.runs):
+            run = time_statement(statement)
+            if run is None:
+                break
+            runs.append(run)
+        if len(runs) < args.runs:
+            continue
+        medians[name] = statistics.median(seconds for seconds, _ in runs) * 1000
+        modules = runs[0][1]
+        package = sum(1 for module in modules if module.startswith('custom_indicate'))
+        heavy = [module for module in ('numpy', 'flask', 'sqlalchemy', 'googletrans')
+                 if module in modules]
+        print(f"  {name:24}{medians[name]:>8.1f} ms  {package:>3} package modules"
+              f"  {', '.join(heavy) or 'no heavy dependencies'}")
+
+    median = medians.get(BUDGET_STATEMENT)
+    if median is None:
+        return 1
+    if median > args.budget_ms:
+        print(f"FAIL: {BUDGET_STATEMENT} import takes {median:.1f} ms, budget {args.budget_ms:.0f} ms")
+        return 1
+    print(f"OK: {BUDGET_STATEMENT} import within {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
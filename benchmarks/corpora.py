@@ -0,0 +1,87 @@
+"""
+Reproducible benchmark corpora.
+Every corpus is generated from a fixed seed and the tracked source data
+only (not the learned exception files, which change with user feedback),
+so results from different commits are measured on exactly the same input.
+"""
+
+import random
+from itertools import islice
+
+from custom_indicate.exceptions import HINDI_EXCEPTIONS
+
+from .synthetic import SyntheticCorpus
+
+CORPUS_NAMES = ['short', 'paragraph', 'document', 'adversarial']
+
+
+def short_strings(count=1000, seed=0):
+    """One to three word inputs, like form fields and chat messages"""
+    rnd = random.Random(seed)
+    words = SyntheticCorpus(vocabulary_size=2000, seed=seed, latin_rate=0, digit_rate=0).words()
+    return [' '.join(islice(words, rnd.randint(1, 3))) for _ in range(count)]
+
+
+def paragraphs(count=100, seed=0):
+    """Paragraphs of several sentences (about 50 words each)"""
+    corpus = SyntheticCorpus(vocabulary_size=5000, seed=seed + 1, paragraph_sentences=(3, 6))
+    return list(islice(corpus.paragraphs(), count))
+
+
+def document(size_mb=10, seed=0):
+    """A single document of paragraphs separated by newlines, about size_mb of UTF-8"""
+    corpus = SyntheticCorpus(vocabulary_size=50000, seed=seed + 2)
+    return [corpus.text(int(size_mb * 1024 * 1024))]
+
+
+def adversarial(scale=1000, seed=0):
+    """Inputs that stress worst cases in the pipeline"""
+    rnd = random.Random(seed + 3)
+    vocabulary = SyntheticCorpus(vocabulary_size=2000, seed=seed + 3).vocabulary
+    return [
+        '',
+        'क',
+        # One very long token of conjuncts
+        'क्' * (scale * 5) + 'क',
+        # Matras and marks with no consonant to attach to
+        'ािीुूेैोौंःँ' * scale,
+        # Nukta characters, both precomposed and decomposed
+        ' '.join(['क़ ख़ ग़ ज़ ड़ ढ़ फ़', 'क़ ख़ ग़ ज़ ड़ ढ़ फ़'] * (scale // 7)),
+        # Every word ends a sentence
+        ' '.join(rnd.choice(vocabulary) + '।' for _ in range(scale)),
+        # Repeated context-sensitive words over the whole text
+        ' '.join(['कल', 'आज', 'कल', 'है', 'था'] * (scale // 5)),
+        # Mixed scripts, digits and punctuation between every word
+        ' '.join(f"{rnd.choice(vocabulary)} word{i} {i}, ({rnd.choice(vocabulary)})"
+                 for i in range(scale // 4)),
+        # Whitespace runs, tabs and blank lines
+        '\n\n\t  '.join(rnd.choice(vocabulary) for _ in range(scale)),
+        # Characters outside the character maps
+        ' '.join(['नमस्ते', '😀', 'தமிழ்', 'ÄÖÜ', '١٢٣'] * (scale // 5)),
+        # Known exceptions only
+        ' '.join(rnd.choice(sorted(HINDI_EXCEPTIONS)) for _ in range(scale)),
+    ]
+
+
+def build_corpus(name, seed=0, document_mb=10, scale=1.0):
+    """
+    Build a named corpus
+
+    Args:
+        name: One of CORPUS_NAMES
+        seed: Random seed
+        document_mb: Size of the document corpus in megabytes
+        scale: Multiplier for the number of items in the other corpora
+
+    Returns:
+        List of input strings
+    """
+    if name == 'short':
+        return short_strings(max(int(1000 * scale), 1), seed)
+    if name == 'paragraph':
+        return paragraphs(max(int(100 * scale), 1), seed)
+    if name == 'document':
+        return document(document_mb, seed)
+    if name == 'adversarial':
+        return adversarial(max(int(1000 * scale), 10), seed)
+    raise ValueError(f"Unknown corpus: {name}")
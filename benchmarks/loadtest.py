@@ -0,0 +1,438 @@
+"""
+HTTP load test for the web app.
+Starts app.py under a local threaded WSGI server, with a scratch database and
+working directory and a stand-in for the external translation service, then
+drives /transliterate, /api/batch and /feedback from concurrent sessions and
+reports throughput, p50/p95/p99 latency and error rates per endpoint.
+
+Usage:
+    python -m benchmarks.loadtest run --concurrency 8 --duration 30
+    python -m benchmarks.loadtest run --url http://127.0.0.1:5000 --requests 2000
+"""
+
+import argparse
+import glob
+import http.client
+import http.cookiejar
+import itertools
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from custom_indicate.profiling import percentile
+from custom_indicate.transliterate import hindi2english, marathi2english
+
+from .suite import FEATURE_FLAGS, git_commit
+from .synthetic import REPO_DIR, SyntheticCorpus
+
+ENDPOINTS = {
+    'transliterate': '/transliterate',
+    'batch': '/api/batch',
+    'feedback': '/feedback',
+    'translate': '/translate',
+}
+LOGIN_REQUIRED = {'batch'}
+DEFAULT_MIX = 'transliterate=0.85,batch=0.05,feedback=0.1'
+
+# Files the app reads or writes relative to its working directory
+_WORKDIR_FILES = ['*_exceptions.json', '*_refined_rules.json']
+
+_PASSWORD = 'load-test-password'
+
+_CONNECTION_ERRORS = (OSError, http.client.HTTPException)
+
+
+def parse_mix(spec):
+    """Parse 'name=weight,...' into a dict of endpoint weights"""
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint in mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class StandInTranslator:
+    """Replaces googletrans.Translator so /translate never leaves the machine"""
+
+    latency = 0.0
+
+    def translate(self, text, src='auto', dest='en'):
+        if self.latency:
+            time.sleep(self.latency)
+        return types.SimpleNamespace(text=text, src=src, dest=dest)
+
+
+def serve(port, workdir, translate_latency_ms=0.0):
+    """
+    Run app.py on 127.0.0.1:port until killed
+
+    The database lives in workdir, which is also the working directory for
+    the exception files the feedback endpoint learns into.
+    """
+    os.environ['TRANSLITERATE_DATABASE_URI'] = 'sqlite:///' + os.path.join(workdir, 'loadtest.db')
+    StandInTranslator.latency = translate_latency_ms / 1000
+    sys.modules['googletrans'] = types.SimpleNamespace(Translator=StandInTranslator)
+    sys.path.insert(0, REPO_DIR)
+    os.chdir(workdir)
+
+    import app as webapp
+    from custom_indicate.warmup import warm_up
+    from werkzeug.serving import make_server
+
+    # Measure steady state rather than the first requests building the engines
+    warm_up(freeze=False)
+
+    print(f"Serving on http://127.0.0.1:{port}", flush=True)
+    make_server('127.0.0.1', port, webapp.app, threaded=True).serve_forever()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(translate_latency_ms=0.0, timeout=60):
+    """
+    Start the app in a subprocess with a scratch working directory
+
+    Returns:
+        (process, base_url, workdir), or None if the server did not come up
+    """
+    workdir = tempfile.mkdtemp(prefix='indicode-loadtest-')
+    for pattern in _WORKDIR_FILES:
+        for path in glob.glob(os.path.join(REPO_DIR, pattern)):
+            shutil.copy(path, workdir)
+
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.loadtest', 'serve', '--port', str(port),
+         '--workdir', workdir, '--translate-latency-ms', str(translate_latency_ms)],
+        cwd=REPO_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    base_url = f'http://127.0.0.1:{port}'
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            print(f"Error starting the app: {process.stderr.read().decode('utf-8', 'replace').strip()}")
+            shutil.rmtree(workdir, ignore_errors=True)
+            return None
+        try:
+            with urllib.request.urlopen(base_url + '/', timeout=1):
+                return process, base_url, workdir
+        except OSError:
+            time.sleep(0.2)
+
+    print("Error starting the app: not ready in time")
+    stop_server(process, workdir)
+    return None
+
+
+def stop_server(process, workdir):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+class Payloads:
+    """Pre-generated request bodies of mixed language, size and feature flags"""
+
+    def __init__(self, seed=0, paragraph_rate=0.2, flag_rate=0.2, count=1000):
+        """
+        Args:
+            seed: Random seed
+            paragraph_rate: Share of transliteration requests sending a paragraph
+            flag_rate: Share of transliteration requests with random feature flags
+            count: Texts generated per language and size
+        """
+        self.paragraph_rate = paragraph_rate
+        self.flag_rate = flag_rate
+        self.texts = {}
+        self.corrections = {}
+        for offset, (language, convert) in enumerate((('hindi', hindi2english),
+                                                      ('marathi', marathi2english))):
+            corpus = SyntheticCorpus(language, vocabulary_size=20000, seed=seed + offset)
+            self.texts[language] = (list(itertools.islice(corpus.sentences(), count)),
+                                    list(itertools.islice(corpus.paragraphs(), count)))
+            # Feedback pairs: a word, its basic transliteration and a plausible correction
+            words = itertools.islice(corpus.words(), count)
+            self.corrections[language] = [
+                (word, auto, auto[:-1] if auto.endswith('a') else auto + 'a')
+                for word, auto in ((word, convert(word)) for word in words) if auto
+            ]
+
+    def form(self, endpoint, rnd):
+        """Form fields for one request"""
+        language = 'hindi' if rnd.random() < 0.8 else 'marathi'
+        if endpoint == 'feedback':
+            original, auto, corrected = rnd.choice(self.corrections[language])
+            return {'original_text': original, 'auto_transliteration': auto,
+                    'corrected_transliteration': corrected, 'language': language}
+
+        sentences, paragraphs = self.texts[language]
+        text = rnd.choice(paragraphs if rnd.random() < self.paragraph_rate else sentences)
+        if endpoint == 'translate':
+            return {'input_text': text, 'source_lang': 'hi', 'target_lang': 'en'}
+
+        form = {'input_text': text, 'language': language}
+        if rnd.random() < self.flag_rate:
+            for flag in FEATURE_FLAGS:
+                form[flag] = rnd.choice(['true', 'false'])
+        return form
+
+
+class Session:
+    """One client with its own cookie jar, so logins persist across requests"""
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def post(self, path, form):
+        """
+        POST a form, following redirects
+
+        Returns:
+            (status, body bytes, final URL)
+        """
+        data = urllib.parse.urlencode(form).encode('utf-8')
+        try:
+            with self.opener.open(self.base_url + path, data, self.timeout) as response:
+                return response.status, response.read(), response.geturl()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read(), e.geturl()
+
+    def login(self, email):
+        """Register and log in; returns True when the session is authenticated"""
+        self.post('/register', {'email': email, 'password': _PASSWORD, 'name': 'Load Test'})
+        status, _, url = self.post('/login', {'email': email, 'password': _PASSWORD})
+        return status == 200 and urllib.parse.urlparse(url).path == '/dashboard'
+
+
+def classify(endpoint, status, body, url):
+    """Error kind of a response, or None when it succeeded"""
+    if status >= 400:
+        return f'http_{status}'
+    if urllib.parse.urlparse(url).path != ENDPOINTS[endpoint]:
+        # Redirected, e.g. to the login page
+        return 'redirected'
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return 'bad_json'
+    if payload.get('error') or payload.get('status') == 'error':
+        return 'app_error'
+    return None
+
+
+def run_load(base_url, concurrency=8, duration=None, requests=None, mix=None,
+             logged_in=1.0, seed=0, warmup=0, payloads=None, timeout=30):
+    """
+    Drive the app from concurrent sessions
+
+    Args:
+        base_url: Server URL
+        concurrency: Number of client threads, each with its own session
+        duration: Seconds to run (used when requests is None)
+        requests: Total number of timed requests
+        mix: Dict of endpoint weights (default: DEFAULT_MIX)
+        logged_in: Share of sessions that register and log in first
+        seed: Random seed
+        warmup: Untimed requests per session before measuring
+        payloads: Payloads instance (built from seed when None)
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        (records, elapsed seconds) where records are (endpoint, ms, error kind)
+    """
+    mix = mix or parse_mix(DEFAULT_MIX)
+    payloads = payloads or Payloads(seed)
+    budget = itertools.count() if requests else None
+    run_id = f'{os.getpid()}-{int(time.time())}'
+    records = []
+    lock = threading.Lock()
+    ready = threading.Barrier(concurrency + 1)
+    timing = {}
+
+    def client(index):
+        rnd = random.Random(seed * 1000 + index)
+        session = Session(base_url, timeout)
+        local = []
+        authenticated = False
+        if index < round(concurrency * logged_in):
+            try:
+                authenticated = session.login(f'load-{run_id}-{index}@example.com')
+            except _CONNECTION_ERRORS:
+                pass
+            if not authenticated:
+                local.append(('login', 0.0, 'login_failed'))
+        allowed = {name: weight for name, weight in mix.items()
+                   if authenticated or name not in LOGIN_REQUIRED}
+        names, weights = list(allowed), list(allowed.values())
+
+        for _ in range(warmup):
+            endpoint = rnd.choices(names, weights)[0]
+            try:
+                session.post(ENDPOINTS[endpoint], payloads.form(endpoint, rnd))
+            except _CONNECTION_ERRORS:
+                pass
+
+        ready.wait()
+        while True:
+            if budget is not None:
+                if next(budget) >= requests:
+                    break
+            elif time.perf_counter() >= timing['deadline']:
+                break
+            endpoint = rnd.choices(names, weights)[0]
+            form = payloads.form(endpoint, rnd)
+            start = time.perf_counter()
+            try:
+                error = classify(endpoint, *session.post(ENDPOINTS[endpoint], form))
+            except _CONNECTION_ERRORS as e:
+                error = type(e).__name__
+            local.append((endpoint, (time.perf_counter() - start) * 1000, error))
+
+        with lock:
+            records.extend(local)
+
+    threads = [threading.Thread(target=client, args=(index,), daemon=True)
+               for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    start = time.perf_counter()
+    timing['deadline'] = start + (duration or 0)
+    for thread in threads:
+        thread.join()
+    return records, time.perf_counter() - start
+
+
+def summarize(records, elapsed):
+    """Throughput, latency percentiles and error rates per endpoint and in total"""
+    groups = {}
+    for endpoint, ms, error in records:
+        groups.setdefault(endpoint, []).append((ms, error))
+    groups['total'] = [(ms, error) for endpoint, ms, error in records if endpoint != 'login']
+
+    summary = {}
+    for name, items in groups.items():
+        latencies = sorted(ms for ms, _ in items)
+        errors = {}
+        for _, error in items:
+            if error:
+                errors[error] = errors.get(error, 0) + 1
+        failed = sum(errors.values())
+        summary[name] = {
+            'requests': len(items),
+            'requests_per_sec': len(items) / elapsed if elapsed > 0 else 0.0,
+            'p50_ms': percentile(latencies, 0.50),
+            'p95_ms': percentile(latencies, 0.95),
+            'p99_ms': percentile(latencies, 0.99),
+            'error_rate': failed / len(items) if items else 0.0,
+            'errors': errors,
+        }
+    return summary
+
+
+def format_summary(summary, elapsed):
+    lines = [f"{'Endpoint':15}{'Requests':>10}{'Req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+             f"{'p99 ms':>10}{'Errors':>9}"]
+    for name, stats in summary.items():
+        lines.append(f"{name:15}{stats['requests']:>10}{stats['requests_per_sec']:>10.1f}"
+                     f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+                     f"{stats['error_rate']:>9.1%}")
+        for kind, count in sorted(stats['errors'].items()):
+            lines.append(f"  {kind}: {count}")
+    lines.append(f"{elapsed:.1f} s")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Web app load test')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Run a load test')
+    run.add_argument('--url', help='Test a running server instead of starting one')
+    run.add_argument('--concurrency', type=int, default=8)
+    run.add_argument('--duration', type=float, default=30, help='Seconds to run')
+    run.add_argument('--requests', type=int, help='Total requests (instead of --duration)')
+    run.add_argument('--mix', default=DEFAULT_MIX,
+                     help=f'Endpoint weights (default: {DEFAULT_MIX}); endpoints: {", ".join(ENDPOINTS)}')
+    run.add_argument('--logged-in', type=float, default=1.0,
+                     help='Share of sessions that log in, so history is written')
+    run.add_argument('--paragraph-rate', type=float, default=0.2)
+    run.add_argument('--flag-rate', type=float, default=0.2,
+                     help='Share of requests with random feature flags')
+    run.add_argument('--warmup', type=int, default=5, help='Untimed requests per session')
+    run.add_argument('--translate-latency-ms', type=float, default=0.0,
+                     help='Simulated latency of the translation stand-in')
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--max-error-rate', type=float, default=0.01,
+                     help='Exit with an error status above this overall error rate')
+    run.add_argument('--output', help='Save the summary as JSON')
+
+    serve_parser = commands.add_parser('serve', help='Run the app for a load test (used by run)')
+    serve_parser.add_argument('--port', type=int, required=True)
+    serve_parser.add_argument('--workdir', required=True)
+    serve_parser.add_argument('--translate-latency-ms', type=float, default=0.0)
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.port, args.workdir, args.translate_latency_ms)
+        return 0
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = start_server(args.translate_latency_ms)
+        if server is None:
+            return 1
+        base_url = server[1]
+
+    try:
+        payloads = Payloads(args.seed, args.paragraph_rate, args.flag_rate)
+        records, elapsed = run_load(base_url, args.concurrency, args.duration, args.requests,
+                                    mix, args.logged_in, args.seed, args.warmup, payloads)
+    finally:
+        if server is not None:
+            stop_server(server[0], server[2])
+
+    summary = summarize(records, elapsed)
+    print(format_summary(summary, elapsed))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'meta': {'commit': git_commit(), 'url': args.url,
+                                'concurrency': args.concurrency, 'mix': mix},
+                       'summary': summary}, f, indent=2)
+    return 1 if summary['total']['error_rate'] > args.max_error_rate else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
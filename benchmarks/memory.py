@@ -0,0 +1,320 @@
+"""
+Memory report for the transliteration engine.
+Uses tracemalloc to measure the import-time footprint of the engine's data
+(character maps, exception dictionaries, ...), the memory its caches hold in
+steady state, and the peak allocation of each stage of
+EnhancedTransliterator.transliterate on a large document.
+
+Usage: python -m benchmarks.memory [--document-mb 1] [--output memory.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import re
+import subprocess
+import sys
+import tracemalloc
+from functools import wraps
+
+from custom_indicate import enhanced_transliteration
+from custom_indicate.enhanced_transliteration import EnhancedTransliterator
+from custom_indicate.profiling import PIPELINE_STAGES
+
+from .corpora import document
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module-level data measured in the import footprint, as module: [names]
+ENGINE_DATA = {
+    'custom_indicate.language_pack': ['_packs'],
+    'custom_indicate.exceptions': ['HINDI_EXCEPTIONS', 'MARATHI_EXCEPTIONS',
+                                   'NAMED_ENTITIES', 'SCHWA_EXCEPTIONS'],
+    'custom_indicate.context_aware': ['CONTEXT_RULES', 'CONTEXT_DISAMBIGUATIONS'],
+    'custom_indicate.schwa_deletion': ['SCHWA_EXCEPTIONS_TABLE', 'DEVANAGARI_CATEGORIES'],
+    'custom_indicate.auto_capitalization': ['COMMON_CAPITALIZED_WORDS'],
+}
+
+# Run in a fresh interpreter so the import is measured from a clean start
+_IMPORT_SOURCE = r'''
+import gc, json, sys, tracemalloc
+sys.path.insert(0, sys.argv[1])
+tracemalloc.start()
+import custom_indicate.enhanced_transliteration
+imported = tracemalloc.get_traced_memory()[0]
+snapshot = tracemalloc.take_snapshot()
+
+from custom_indicate.enhanced_transliteration import EnhancedTransliterator
+engines = {}
+for language in ('hindi', 'marathi'):
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    engine = EnhancedTransliterator(language)
+    engines[language] = tracemalloc.get_traced_memory()[0] - before
+tracemalloc.stop()
+
+from benchmarks.memory import data_sizes, files_by_size
+print(json.dumps({
+    'total': imported,
+    'files': files_by_size(snapshot),
+    'data': data_sizes(),
+    'engine_init': engines,
+}))
+'''
+
+
+def deep_sizeof(obj):
+    """
+    Size of an object and everything it references through containers
+
+    Objects reached more than once are counted once. Strings shared with
+    other structures are included, so sizes of separate structures overlap.
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__dict__') and not isinstance(item, type):
+            stack.append(vars(item))
+    return total
+
+
+def data_sizes():
+    """Deep size in bytes of each structure in ENGINE_DATA"""
+    sizes = {}
+    for module_name, names in ENGINE_DATA.items():
+        module = sys.modules.get(module_name) or __import__(module_name, fromlist=['_'])
+        for name in names:
+            if hasattr(module, name):
+                sizes[name] = deep_sizeof(getattr(module, name))
+    return sizes
+
+
+def files_by_size(snapshot, limit=15):
+    """
+    Bytes allocated per source file in a snapshot
+
+    Package files are listed individually; everything else is grouped by
+    top-level third-party package, with the standard library as one group.
+    """
+    package_dir = os.path.join(REPO_DIR, 'custom_indicate')
+    files = {}
+    others = {}
+    for stat in snapshot.statistics('filename'):
+        filename = stat.traceback[0].filename
+        if filename.startswith(package_dir):
+            files[os.path.relpath(filename, REPO_DIR)] = stat.size
+            continue
+        parts = filename.split(os.sep)
+        if 'site-packages' in parts[:-1]:
+            group = parts[parts.index('site-packages') + 1].split('.')[0]
+        else:
+            group = 'stdlib'
+        others[f'({group})'] = others.get(f'({group})', 0) + stat.size
+
+    largest = lambda sizes: sorted(sizes.items(), key=lambda item: -item[1])[:limit]
+    return dict(largest(files) + largest(others))
+
+
+def import_footprint():
+    """
+    Import-time memory of the package and of constructing each engine
+
+    Returns:
+        Dict with the traced total after import, bytes per source file,
+        deep sizes of the engine data and per-language engine init cost
+    """
+    process = subprocess.run([sys.executable, '-c', _IMPORT_SOURCE, REPO_DIR],
+                             capture_output=True, text=True, cwd=REPO_DIR)
+    if process.returncode != 0:
+        print(f"Error measuring import footprint: {process.stderr.strip()}")
+        return None
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def cache_sizes(transliterator):
+    """Entry counts of the engine's long-lived caches"""
+    from custom_indicate import gazetteer, phonetic_refinement, schwa_lexicon
+    from custom_indicate.schwa_deletion import delete_schwa
+
+    schwa_cache = delete_schwa.cache_info()
+    return {
+        'delete_schwa': schwa_cache.currsize,
+        'delete_schwa_max': schwa_cache.maxsize,
+        're_module': len(getattr(re, '_cache', ())),
+        'schwa_lexicons': len(schwa_lexicon._lexicons),
+        'phonetic_refiners': len(phonetic_refinement._refiners),
+        'gazetteer_loaded': gazetteer._default_gazetteer is not None,
+        'learned_exceptions': len(transliterator.exception_detector.exceptions),
+        'learned_exceptions_bytes': deep_sizeof(transliterator.exception_detector.exceptions),
+    }
+
+
+def _traced(func, stats):
+    """Wrap func to record its peak traced allocation above the memory in use at entry"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            peak = tracemalloc.get_traced_memory()[1]
+            stats['calls'] += 1
+            stats['peak'] = max(stats['peak'], peak - before)
+    return wrapper
+
+
+def stage_peaks(transliterator, text, feature_flags=None):
+    """
+    Peak traced allocation of each pipeline stage for one transliterate() call
+
+    The stage functions EnhancedTransliterator calls are wrapped for the
+    duration of the call. Must be called while tracemalloc is tracing.
+
+    Returns:
+        Dict of stage name -> {'calls': n, 'peak': bytes}
+    """
+    stages = {}
+    originals = {}
+    for name, stage in PIPELINE_STAGES.items():
+        func = getattr(enhanced_transliteration, name, None)
+        if func is None:
+            continue
+        originals[name] = func
+        stats = stages.setdefault(stage, {'calls': 0, 'peak': 0})
+        setattr(enhanced_transliteration, name, _traced(func, stats))
+    try:
+        transliterator.transliterate(text, feature_flags)
+    finally:
+        for name, func in originals.items():
+            setattr(enhanced_transliteration, name, func)
+    return stages
+
+
+def _call_peak(transliterator, text, feature_flags):
+    """Retained and peak traced bytes of one transliterate() call"""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    transliterator.transliterate(text, feature_flags)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    return current - before, peak - before
+
+
+def memory_report(document_mb=1, seed=0, language='hindi', feature_flags=None, imports=True):
+    """
+    Build the memory report
+
+    Args:
+        document_mb: Size of the document transliterated in one call
+        seed: Corpus seed
+        language: Engine language
+        feature_flags: Feature flags for transliterate()
+        imports: Whether to measure the import footprint (in a subprocess)
+
+    Returns:
+        Report dict; sizes are in bytes
+    """
+    text = document(document_mb, seed)[0]
+    transliterator = EnhancedTransliterator(language)
+    report = {
+        'language': language,
+        'input_bytes': sys.getsizeof(text),
+        'import': import_footprint() if imports else None,
+    }
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        # The first call fills the caches; what it retains is their steady-state cost
+        retained, cold_peak = _call_peak(transliterator, text, feature_flags)
+        _, warm_peak = _call_peak(transliterator, text, feature_flags)
+        stages = stage_peaks(transliterator, text, feature_flags)
+    finally:
+        tracemalloc.stop()
+
+    report['caches'] = dict(cache_sizes(transliterator), retained_bytes=retained)
+    report['transliterate'] = {'cold_peak': cold_peak, 'warm_peak': warm_peak}
+    report['stages'] = stages
+    return report
+
+
+def memory_metrics(report):
+    """Flatten a report into {name: bytes} for comparisons across commits"""
+    metrics = {}
+    footprint = report.get('import') or {}
+    if 'total' in footprint:
+        metrics['import/total'] = footprint['total']
+    for name, size in footprint.get('data', {}).items():
+        metrics[f'import/data/{name}'] = size
+    for language, size in footprint.get('engine_init', {}).items():
+        metrics[f'import/engine_init/{language}'] = size
+    metrics['caches/retained'] = report['caches']['retained_bytes']
+    for name, size in report['transliterate'].items():
+        metrics[f'transliterate/{name}'] = size
+    for stage, stats in report['stages'].items():
+        metrics[f'stages/{stage}'] = stats['peak']
+    return metrics
+
+
+def format_report(report):
+    """Human-readable tables for a report"""
+    kib = lambda size: f"{size / 1024:>12.1f} KiB"
+    lines = []
+    footprint = report.get('import')
+    if footprint:
+        lines.append(f"Import footprint {kib(footprint['total'])}")
+        for filename, size in footprint['files'].items():
+            lines.append(f"  {filename:44}{kib(size)}")
+        lines.append("Engine data (deep size)")
+        for name, size in footprint['data'].items():
+            lines.append(f"  {name:44}{kib(size)}")
+        for language, size in footprint['engine_init'].items():
+            lines.append(f"  {'EnhancedTransliterator(' + repr(language) + ')':44}{kib(size)}")
+
+    caches = report['caches']
+    lines.append(f"Caches after one document {kib(caches['retained_bytes'])} retained")
+    for name, value in caches.items():
+        if name != 'retained_bytes':
+            lines.append(f"  {name:44}{value:>12}")
+
+    lines.append(f"transliterate() on {report['input_bytes'] / 1024:.0f} KiB of text")
+    for name, size in report['transliterate'].items():
+        lines.append(f"  {name:44}{kib(size)}")
+    lines.append("Stage peaks")
+    for stage, stats in sorted(report['stages'].items(), key=lambda item: -item[1]['peak']):
+        lines.append(f"  {stage:30}{stats['calls']:>8} calls{kib(stats['peak'])}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--document-mb', type=float, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--language', default='hindi', choices=['hindi', 'marathi'])
+    parser.add_argument('--flags', type=json.loads, help='Feature flags as JSON')
+    parser.add_argument('--output', help='Also save the report as JSON')
+    args = parser.parse_args()
+
+    report = memory_report(args.document_mb, args.seed, args.language, args.flags)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+"""
+Benchmark suite for the transliteration engine.
+Measures words/sec, p50/p99 latency per call and peak traced memory for the
+basic converters and for EnhancedTransliterator under feature-flag
+combinations, and compares saved results across commits.
+
+Usage:
+    python -m benchmarks.suite run [--output results.json] [--full] [--quick] [--profile PREFIX]
+                                   [--memory-report]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.1]
+"""
+
+import argparse
+import datetime
+import gc
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from custom_indicate.enhanced_transliteration import EnhancedTransliterator
+from custom_indicate.profiling import percentile, profile_call
+from custom_indicate.transliterate import hindi2english, marathi2english
+
+from .corpora import CORPUS_NAMES, build_corpus
+from .memory import format_report, memory_metrics, memory_report
+
+FEATURE_FLAGS = ['context_aware', 'statistical_schwa', 'auto_exceptions',
+                 'phonetic_refinement', 'auto_capitalization', 'schwa_model']
+
+# Flag sets used on the document corpus unless --full is given; the whole
+# matrix over 10 MB takes far longer than the other corpora combined
+DOCUMENT_FLAG_SETS = ['default', 'all', 'none']
+
+RESULTS_VERSION = 1
+
+# Memory report entries smaller than this are too noisy to gate on
+MEMORY_GATE_KIB = 16
+
+
+def flag_combinations():
+    """Every on/off combination of FEATURE_FLAGS"""
+    for values in itertools.product([False, True], repeat=len(FEATURE_FLAGS)):
+        yield dict(zip(FEATURE_FLAGS, values))
+
+
+def flags_label(flags):
+    """Short stable name for a flag set"""
+    if flags is None:
+        return 'default'
+    enabled = [name for name in FEATURE_FLAGS if flags.get(name)]
+    if not enabled:
+        return 'none'
+    if len(enabled) == len(FEATURE_FLAGS):
+        return 'all'
+    return '+'.join(enabled)
+
+
+def measure(func, inputs, repeat=1, memory=True):
+    """
+    Time func over every input and optionally trace its peak memory
+
+    Args:
+        func: Function taking one input string
+        inputs: List of input strings
+        repeat: Number of timed passes over the inputs
+        memory: Whether to run an extra traced pass for peak memory
+
+    Returns:
+        Dict of measurements
+    """
+    word_count = sum(len(text.split()) for text in inputs)
+
+    # Warm up caches and lazily loaded data on a few inputs
+    for text in inputs[:20]:
+        func(text)
+
+    latencies = []
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in inputs:
+            call_start = time.perf_counter_ns()
+            func(text)
+            latencies.append(time.perf_counter_ns() - call_start)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            for text in inputs:
+                func(text)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'calls': len(latencies),
+        'words': word_count * repeat,
+        'seconds': elapsed,
+        'words_per_sec': word_count * repeat / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': percentile(latencies, 0.50) / 1e6,
+        'p99_ms': percentile(latencies, 0.99) / 1e6,
+        'peak_kib': peak / 1024 if peak is not None else None,
+    }
+
+
+def benchmark_cases(corpora, full=False):
+    """Yield (target, flags label, corpus name, function) for every benchmark"""
+    engines = {language: EnhancedTransliterator(language) for language in ('hindi', 'marathi')}
+    flag_sets = [None] + list(flag_combinations())
+
+    for corpus in corpora:
+        yield 'hindi2english', 'none', corpus, hindi2english
+        yield 'marathi2english', 'none', corpus, marathi2english
+        for language, engine in engines.items():
+            for flags in flag_sets:
+                label = flags_label(flags)
+                if corpus == 'document' and not full and label not in DOCUMENT_FLAG_SETS:
+                    continue
+                yield (f'enhanced_{language}', label, corpus,
+                       lambda text, engine=engine, flags=flags: engine.transliterate(text, flags))
+
+
+def git_commit():
+    """Current commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(corpora=CORPUS_NAMES, seed=0, document_mb=10, scale=1.0, repeat=1,
+              full=False, memory=True, targets=None, progress=True, report_mb=None):
+    """
+    Run the benchmark suite
+
+    Args:
+        report_mb: When given, also build the per-stage memory report on a
+            document of this size
+
+    Returns:
+        Results dict ready to be saved as JSON
+    """
+    inputs = {name: build_corpus(name, seed, document_mb, scale) for name in corpora}
+    results = []
+
+    for target, label, corpus, func in benchmark_cases(corpora, full):
+        if targets and target not in targets:
+            continue
+        result = measure(func, inputs[corpus], repeat, memory)
+        result.update({'target': target, 'flags': label, 'corpus': corpus})
+        results.append(result)
+        if progress:
+            peak = f"{result['peak_kib']:.0f} KiB" if result['peak_kib'] is not None else '-'
+            print(f"{target:18} {corpus:11} {label:60} {result['words_per_sec']:>10.0f} words/s "
+                  f"p50 {result['p50_ms']:.3f} ms  p99 {result['p99_ms']:.3f} ms  peak {peak}")
+
+    report = None
+    if report_mb:
+        report = memory_report(report_mb, seed)
+        if progress:
+            print(format_report(report))
+
+    return {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'document_mb': document_mb,
+            'scale': scale,
+            'repeat': repeat,
+        },
+        'results': results,
+        'memory_report': report,
+    }
+
+
+def _result_key(result):
+    return result['target'], result['corpus'], result['flags']
+
+
+def compare_results(baseline, current, threshold=0.1):
+    """
+    Compare two result sets
+
+    A benchmark regresses when its throughput drops, or its peak memory
+    grows, by more than threshold (a fraction of the baseline). Entries of
+    the memory report, when both sets have one, are gated the same way.
+
+    Returns:
+        (rows, regressions) where rows are (key, metric, old, new, change) tuples
+    """
+    old_results = {_result_key(r): r for r in baseline['results']}
+    rows = []
+    regressions = []
+
+    for result in current['results']:
+        key = _result_key(result)
+        old = old_results.get(key)
+        if old is None:
+            continue
+        for metric, higher_is_better in (('words_per_sec', True), ('p99_ms', False), ('peak_kib', False)):
+            old_value, new_value = old.get(metric), result.get(metric)
+            if not old_value or new_value is None:
+                continue
+            change = (new_value - old_value) / old_value
+            rows.append((key, metric, old_value, new_value, change))
+            # p99 of a single pass is too noisy to gate on
+            if metric == 'p99_ms':
+                continue
+            worse = -change if higher_is_better else change
+            if worse > threshold:
+                regressions.append((key, metric, old_value, new_value, change))
+
+    if baseline.get('memory_report') and current.get('memory_report'):
+        old_metrics = memory_metrics(baseline['memory_report'])
+        for name, size in memory_metrics(current['memory_report']).items():
+            old_size = old_metrics.get(name)
+            if old_size is None or old_size < MEMORY_GATE_KIB * 1024:
+                continue
+            change = (size - old_size) / old_size
+            row = (('memory', name), 'kib', old_size / 1024, size / 1024, change)
+            rows.append(row)
+            if change > threshold:
+                regressions.append(row)
+
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Transliteration engine benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Run the benchmarks')
+    run.add_argument('--output', default='benchmark_results.json', help='Results file')
+    run.add_argument('--corpus', action='append', choices=CORPUS_NAMES,
+                     help='Corpus to run (repeatable; default: all)')
+    run.add_argument('--target', action='append',
+                     help='Only run this target, e.g. hindi2english or enhanced_hindi (repeatable)')
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--document-mb', type=float, default=10)
+    run.add_argument('--repeat', type=int, default=1, help='Timed passes over each corpus')
+    run.add_argument('--full', action='store_true',
+                     help='Run every flag combination on the document corpus too')
+    run.add_argument('--quick', action='store_true',
+                     help='Smaller corpora (1 MB document, a tenth of the other inputs)')
+    run.add_argument('--no-memory', action='store_true', help='Skip the traced memory pass')
+    run.add_argument('--profile', metavar='PREFIX',
+                     help='Profile the run (without the memory pass), writing '
+                          'PREFIX.pstats and PREFIX.collapsed')
+    run.add_argument('--memory-report', action='store_true',
+                     help='Add import, cache and per-stage memory figures to the results')
+    run.add_argument('--memory-report-mb', type=float, default=1,
+                     help='Document size for the per-stage memory report')
+    run.add_argument('--top', type=int, default=20, help='Hot functions to list with --profile')
+
+    compare = commands.add_parser('compare', help='Compare two results files')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.1,
+                         help='Allowed fractional regression (default: 0.1)')
+    compare.add_argument('--verbose', action='store_true', help='Show every comparison')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        suite = lambda: run_suite(
+            corpora=args.corpus or CORPUS_NAMES,
+            seed=args.seed,
+            document_mb=1 if args.quick else args.document_mb,
+            scale=0.1 if args.quick else 1.0,
+            repeat=args.repeat,
+            full=args.full,
+            # tracemalloc hooks every allocation and would dominate the profile
+            memory=not (args.no_memory or args.profile),
+            targets=args.target,
+            report_mb=args.memory_report_mb if args.memory_report else None,
+        )
+        if args.profile:
+            results = profile_call(suite, args.profile, top=args.top)
+        else:
+            results = suite()
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved {len(results['results'])} results to {args.output}")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+
+    rows, regressions = compare_results(baseline, current, args.threshold)
+    for key, metric, old, new, change in (rows if args.verbose else regressions):
+        print(f"{'/'.join(key):90} {metric:14} {old:>12.3f} -> {new:>12.3f} ({change:+.1%})")
+    print(f"{len(rows)} comparisons, {len(regressions)} regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Synthetic Hindi/Marathi corpus generator.
+Builds text from the project's own data (character maps, exception lists,
+named entities and, on request, the learned exception files) with a Zipf word
+distribution, so benchmarks and load tests never need real user text.
+Output is deterministic for a given seed and learned word list, and can be
+streamed lazily at any size.
+
+Usage: python -m benchmarks.synthetic --size 1GB --output corpus.txt [--language hindi]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from itertools import accumulate
+
+from custom_indicate.exceptions import HINDI_EXCEPTIONS, MARATHI_EXCEPTIONS, NAMED_ENTITIES
+from custom_indicate.transliterate import HINDI_CHARS, MARATHI_CHARS
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SENTENCE_ENDS = ['।', '।', '।', '?', '!']
+CLAUSE_MARKS = [',', ',', ';', ':']
+LATIN_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+# Words drawn from the sampler per batch
+_BATCH = 4096
+
+_SIZE_UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def _char_groups(char_map):
+    """Split a character map's single-character keys into consonants, matras and marks"""
+    consonants, matras, marks = [], [], []
+    for key in char_map:
+        if len(key) != 1:
+            continue
+        if 'क' <= key <= 'ह':
+            consonants.append(key)
+        elif 'ा' <= key <= 'ौ':
+            matras.append(key)
+        elif key in 'ंँ':
+            marks.append(key)
+    return sorted(consonants), sorted(matras), sorted(marks)
+
+
+def load_learned_words(language='hindi', path=None):
+    """Words from a learned exception file ({language}_exceptions.json), if present"""
+    path = path or os.path.join(REPO_DIR, f'{language}_exceptions.json')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return sorted(json.load(f))
+    except (OSError, json.JSONDecodeError):
+        return []
+
+
+def parse_size(text):
+    """Parse sizes such as '512KB', '10MB' or '1GB' into bytes"""
+    match = re.fullmatch(r'\s*([\d.]+)\s*([KMG]?B?)\s*', text.upper())
+    if not match:
+        raise ValueError(f"Invalid size: {text}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+class SyntheticCorpus:
+    """
+    Seeded generator of Zipf-distributed Devanagari text
+
+    Word ranks are assigned once from the seed; the word at rank r is drawn
+    with probability proportional to 1 / r ** exponent. Larger exponents or
+    smaller vocabularies give more repetition.
+    """
+
+    def __init__(self, language='hindi', vocabulary_size=50000, exponent=1.1, seed=0,
+                 latin_rate=0.01, digit_rate=0.01, clause_rate=0.05,
+                 sentence_length=(6, 14), paragraph_sentences=(3, 8), learned_words=()):
+        """
+        Initialize the generator
+
+        Args:
+            language: 'hindi' or 'marathi'
+            vocabulary_size: Number of distinct Devanagari words
+            exponent: Zipf exponent (about 1.0 for natural text)
+            seed: Random seed; the same settings always produce the same text
+            latin_rate: Fraction of tokens replaced by Latin-script words
+            digit_rate: Fraction of tokens replaced by numbers
+            clause_rate: Fraction of words followed by a comma or similar mark
+            sentence_length: (min, max) words per sentence
+            paragraph_sentences: (min, max) sentences per paragraph
+            learned_words: Extra known words, e.g. load_learned_words(language);
+                the learned exception files change with user feedback, so they
+                are only used when passed here
+        """
+        self.language = language
+        self.exponent = exponent
+        self.seed = seed
+        self.latin_rate = latin_rate
+        self.digit_rate = digit_rate
+        self.clause_rate = clause_rate
+        self.sentence_length = sentence_length
+        self.paragraph_sentences = paragraph_sentences
+        self.learned_words = list(learned_words)
+
+        self.vocabulary = self._build_vocabulary(vocabulary_size)
+        self._cum_weights = list(accumulate(1.0 / rank ** exponent
+                                            for rank in range(1, len(self.vocabulary) + 1)))
+
+    def _build_vocabulary(self, size):
+        rnd = random.Random(self.seed)
+        if self.language == 'hindi':
+            char_map, exceptions = HINDI_CHARS, HINDI_EXCEPTIONS
+        else:
+            char_map, exceptions = MARATHI_CHARS, MARATHI_EXCEPTIONS
+
+        known = list(dict.fromkeys(sorted(exceptions) + sorted(NAMED_ENTITIES)
+                                   + sorted(self.learned_words)))
+        words = known[:size]
+        seen = set(words)
+
+        consonants, matras, marks = _char_groups(char_map)
+        while len(words) < size:
+            syllables = []
+            for _ in range(rnd.randint(1, 4)):
+                syllable = rnd.choice(consonants)
+                if rnd.random() < 0.1:
+                    syllable += '्' + rnd.choice(consonants)
+                if rnd.random() < 0.5:
+                    syllable += rnd.choice(matras)
+                if rnd.random() < 0.05:
+                    syllable += rnd.choice(marks)
+                syllables.append(syllable)
+            word = ''.join(syllables)
+            if word not in seen:
+                seen.add(word)
+                words.append(word)
+
+        # Known words get random ranks, so common vocabulary is spread over the distribution
+        rnd.shuffle(words)
+        return words
+
+    def _tokens(self, rnd):
+        """Endless stream of tokens: vocabulary words, Latin words and numbers"""
+        vocabulary = self.vocabulary
+        cum_weights = self._cum_weights
+        latin_rate = self.latin_rate
+        other_rate = self.latin_rate + self.digit_rate
+        while True:
+            for word in rnd.choices(vocabulary, cum_weights=cum_weights, k=_BATCH):
+                roll = rnd.random()
+                if roll < latin_rate:
+                    yield ''.join(rnd.choice(LATIN_LETTERS) for _ in range(rnd.randint(2, 9)))
+                elif roll < other_rate:
+                    yield str(rnd.randint(0, 10 ** rnd.randint(1, 6)))
+                else:
+                    yield word
+
+    def words(self):
+        """Endless stream of words with the Zipf distribution"""
+        return self._tokens(random.Random(self.seed))
+
+    def _sentences(self, rnd):
+        tokens = self._tokens(rnd)
+        low, high = self.sentence_length
+        while True:
+            words = []
+            for _ in range(rnd.randint(low, high)):
+                word = next(tokens)
+                if rnd.random() < self.clause_rate:
+                    word += rnd.choice(CLAUSE_MARKS)
+                words.append(word)
+            yield ' '.join(words) + rnd.choice(SENTENCE_ENDS)
+
+    def sentences(self):
+        """Endless stream of sentences"""
+        return self._sentences(random.Random(self.seed))
+
+    def _paragraphs(self, rnd):
+        sentences = self._sentences(rnd)
+        low, high = self.paragraph_sentences
+        while True:
+            yield ' '.join(next(sentences) for _ in range(rnd.randint(low, high)))
+
+    def paragraphs(self):
+        """Endless stream of paragraphs"""
+        return self._paragraphs(random.Random(self.seed))
+
+    def stream(self, size_bytes=None, chunk_bytes=1 << 20):
+        """
+        Stream newline-separated paragraphs in chunks
+
+        Args:
+            size_bytes: Stop after at least this many UTF-8 bytes (None for no limit)
+            chunk_bytes: Approximate size of each yielded chunk
+
+        Yields:
+            Text chunks, each ending with a newline
+        """
+        total = 0
+        parts = []
+        part_bytes = 0
+        for paragraph in self.paragraphs():
+            line = paragraph + '\n'
+            size = len(line.encode('utf-8'))
+            parts.append(line)
+            part_bytes += size
+            total += size
+            done = size_bytes is not None and total >= size_bytes
+            if part_bytes >= chunk_bytes or done:
+                yield ''.join(parts)
+                parts = []
+                part_bytes = 0
+            if done:
+                return
+
+    def text(self, size_bytes):
+        """Generate about size_bytes of text as a single string"""
+        return ''.join(self.stream(size_bytes))
+
+    def write(self, path, size_bytes):
+        """Write about size_bytes of text to a file; returns the bytes written"""
+        written = 0
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            for chunk in self.stream(size_bytes):
+                f.write(chunk)
+                written += len(chunk.encode('utf-8'))
+        return written
+
+
+def repetition_stats(tokens):
+    """
+    Measure repetition in a token sample
+
+    Returns:
+        Dict with 'tokens', 'unique' and 'repeat_rate' (fraction of tokens
+        seen earlier in the sample, i.e. the hit rate of an unbounded cache)
+    """
+    seen = set()
+    repeats = 0
+    count = 0
+    for token in tokens:
+        count += 1
+        if token in seen:
+            repeats += 1
+        else:
+            seen.add(token)
+    return {
+        'tokens': count,
+        'unique': len(seen),
+        'repeat_rate': repeats / count if count else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic Zipf-distributed corpus')
+    parser.add_argument('--size', default='10MB', help='Output size, e.g. 512KB, 10MB, 2GB')
+    parser.add_argument('--output', help='Output file (default: stdout)')
+    parser.add_argument('--language', choices=['hindi', 'marathi'], default='hindi')
+    parser.add_argument('--vocabulary', type=int, default=50000, help='Distinct words')
+    parser.add_argument('--exponent', type=float, default=1.1, help='Zipf exponent')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latin-rate', type=float, default=0.01)
+    parser.add_argument('--digit-rate', type=float, default=0.01)
+    parser.add_argument('--learned-words', action='store_true',
+                        help="Add the words of the language's learned exception file "
+                             "(output then changes as that file does)")
+    parser.add_argument('--stats', type=int, metavar='N',
+                        help='Print repetition statistics for the first N words and exit')
+    args = parser.parse_args()
+
+    learned_words = load_learned_words(args.language) if args.learned_words else ()
+    corpus = SyntheticCorpus(args.language, args.vocabulary, args.exponent, args.seed,
+                             args.latin_rate, args.digit_rate, learned_words=learned_words)
+
+    if args.stats:
+        words = corpus.words()
+        stats = repetition_stats(next(words) for _ in range(args.stats))
+        print(f"{stats['tokens']} words, {stats['unique']} unique, "
+              f"repeat rate {stats['repeat_rate']:.1%}")
+        return
+
+    size = parse_size(args.size)
+    start = time.perf_counter()
+    if args.output:
+        written = corpus.write(args.output, size)
+        elapsed = time.perf_counter() - start
+        print(f"Wrote {written / 1024 ** 2:.1f} MB to {args.output} "
+              f"({written / 1024 ** 2 / max(elapsed, 1e-9):.1f} MB/s)", file=sys.stderr)
+    else:
+        out = sys.stdout.buffer
+        for chunk in corpus.stream(size):
+            out.write(chunk.encode('utf-8'))
+        out.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,22 +3,48 @@ Custom Indicate - Hindi/Marathi to English Transliteration
 An enhanced implementation with context-aware processing, 
 statistical schwa deletion, automatic exception detection,
 and auto-capitalization.
+
+Public names are loaded lazily (PEP 562): importing the package is cheap,
+and `from custom_indicate import hindi2english` only imports the modules
+that function needs.
 """
 
-# Basic transliteration
-from .transliterate import hindi2english, marathi2english
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    # Basic transliteration
+    'hindi2english': 'transliterate',
+    'marathi2english': 'transliterate',
+    
+    # Enhanced transliteration with all improvements
+    'EnhancedTransliterator': 'enhanced_transliteration',
+    'enhanced_hindi2english': 'enhanced_transliteration',
+    'enhanced_marathi2english': 'enhanced_transliteration',
+    'get_transliterator': 'enhanced_transliteration',
+    
+    # Individual components if needed separately
+    'apply_context_aware_transliteration': 'context_aware',
+    'apply_schwa_rules': 'schwa_deletion',
+    'identify_exceptions': 'exception_detection',
+    'learn_from_corrections': 'exception_detection',
+    'capitalize_text': 'auto_capitalization',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__version__ = '0.2.0'
+
 
-# Enhanced transliteration with all improvements
-from .enhanced_transliteration import (
-    EnhancedTransliterator, 
-    enhanced_hindi2english, 
-    enhanced_marathi2english
-)
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-# Individual components if needed separately
-from .context_aware import apply_context_aware_transliteration
-from .schwa_deletion import apply_schwa_rules
-from .exception_detection import identify_exceptions, learn_from_corrections
-from .auto_capitalization import capitalize_text
 
-__version__ = '0.2.0'
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,9 @@
+"""
+Command-line bulk transliteration: python -m custom_indicate --help
+"""
+
+import sys
+
+from .bulk import main
+
+sys.exit(main())
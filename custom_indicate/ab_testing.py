@@ -0,0 +1,455 @@
+"""
+A/B and regression comparison of transliteration engine configurations.
+Runs engine configurations (feature flags, exception snapshots or other
+checkouts of the code) over the same test cases in separate processes and
+compares accuracy together with throughput and latency.
+
+Usage:
+    python -m custom_indicate.ab_testing cases.jsonl --b-flags '{"auto_capitalization": false}'
+    python -m custom_indicate.ab_testing cases.jsonl --a-code ../baseline-checkout
+    python -m custom_indicate.ab_testing cases.jsonl --baseline summary.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from .profiling import percentile
+from .test_transliteration import TransliterationEvaluator, TransliterationTestDataset
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside a fresh interpreter so each configuration can import its own
+# copy of custom_indicate; it only relies on EnhancedTransliterator, which
+# every version of the package provides.
+_WORKER_SOURCE = r'''
+import json, sys, time
+config = json.loads(sys.argv[1])
+sys.path.insert(0, config['code_path'])
+from custom_indicate.enhanced_transliteration import EnhancedTransliterator
+
+transliterator = EnhancedTransliterator(config['language'])
+for name, value in config['settings'].items():
+    setattr(transliterator, name, value)
+if config['exceptions_file']:
+    with open(config['exceptions_file'], 'r', encoding='utf-8') as f:
+        transliterator.exception_detector.exceptions = json.load(f)
+flags = config['feature_flags']
+
+with open(config['input'], 'r', encoding='utf-8') as f:
+    texts = [json.loads(line) for line in f]
+for text in texts[:config['warmup']]:
+    transliterator.transliterate(text, flags)
+
+results = []
+start = time.perf_counter()
+for text in texts:
+    call_start = time.perf_counter_ns()
+    output = transliterator.transliterate(text, flags)
+    results.append((output, time.perf_counter_ns() - call_start))
+elapsed = time.perf_counter() - start
+
+with open(config['output'], 'w', encoding='utf-8') as f:
+    for result in results:
+        f.write(json.dumps(result, ensure_ascii=False) + '\n')
+    f.write(json.dumps({'seconds': elapsed}) + '\n')
+'''
+
+
+class EngineConfig:
+    """One engine configuration to compare"""
+
+    def __init__(self, name, language='hindi', feature_flags=None, settings=None,
+                 exceptions_file=None, code_path=None, cwd=None):
+        """
+        Describe an engine configuration
+
+        Args:
+            name: Label used in reports
+            language: 'hindi' or 'marathi'
+            feature_flags: Dict passed to transliterate() as enable_features
+            settings: Dict of transliterator attributes to set, e.g. {'enable_schwa_model': True}
+            exceptions_file: Learned exceptions JSON snapshot to use instead of the default file
+            code_path: Directory containing the custom_indicate package to run
+                (default: this checkout)
+            cwd: Working directory for the engine, where relative data files such as
+                {language}_exceptions.json are looked up (default: code_path or the current directory)
+        """
+        self.name = name
+        self.language = language
+        self.feature_flags = feature_flags
+        self.settings = settings or {}
+        self.exceptions_file = os.path.abspath(exceptions_file) if exceptions_file else None
+        self.code_path = os.path.abspath(code_path) if code_path else REPO_DIR
+        self.cwd = cwd or (self.code_path if code_path else os.getcwd())
+
+    def describe(self):
+        """JSON-serializable description of the configuration"""
+        return {
+            'name': self.name,
+            'language': self.language,
+            'feature_flags': self.feature_flags,
+            'settings': self.settings,
+            'exceptions_file': self.exceptions_file,
+            'code_path': self.code_path,
+        }
+
+
+class _ConfigRun:
+    """A configuration running in its own process"""
+
+    def __init__(self, config, input_path, work_dir, warmup):
+        self.config = config
+        self.output_path = os.path.join(work_dir, f'{id(self)}.jsonl')
+        worker_config = dict(config.describe(), input=input_path, output=self.output_path,
+                             warmup=warmup)
+        self.process = subprocess.Popen(
+            [sys.executable, '-c', _WORKER_SOURCE, json.dumps(worker_config)],
+            cwd=config.cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    def wait(self):
+        """Wait for the process; returns (outputs, latencies in ns, seconds)"""
+        _, stderr = self.process.communicate()
+        if self.process.returncode != 0:
+            raise RuntimeError(f"Configuration '{self.config.name}' failed:\n{stderr}")
+
+        outputs, latencies = [], []
+        with open(self.output_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        for line in lines[:-1]:
+            output, latency = json.loads(line)
+            outputs.append(output)
+            latencies.append(latency)
+        return outputs, latencies, json.loads(lines[-1])['seconds']
+
+
+def _summarize(config, test_cases, outputs, latencies, seconds, evaluator):
+    """Accuracy and performance summary of one configuration's run"""
+    expected = [test_case['expected'] for test_case in test_cases]
+    char_accuracies = evaluator.calculate_character_accuracy_batch(outputs, expected)
+    word_accuracies = [evaluator.calculate_word_accuracy(a, e) for a, e in zip(outputs, expected)]
+    words = sum(len(test_case['original'].split()) for test_case in test_cases)
+    count = max(len(test_cases), 1)
+    ordered = sorted(latencies)
+
+    return {
+        'config': config.describe(),
+        'cases': len(test_cases),
+        'passed_cases': sum(1 for accuracy in word_accuracies if accuracy >= 0.8),
+        'average_char_accuracy': sum(char_accuracies) / count,
+        'average_word_accuracy': sum(word_accuracies) / count,
+        'words': words,
+        'seconds': seconds,
+        'words_per_sec': words / seconds if seconds > 0 else 0.0,
+        'p50_ms': percentile(ordered, 0.50) / 1e6,
+        'p99_ms': percentile(ordered, 0.99) / 1e6,
+        'char_accuracies': char_accuracies,
+        'outputs': outputs,
+    }
+
+
+def run_configs(configs, dataset, parallel=True, warmup=20):
+    """
+    Run configurations over a dataset, each in its own process
+
+    Args:
+        configs: List of EngineConfig
+        dataset: TransliterationTestDataset
+        parallel: Run the processes at the same time (otherwise one after another)
+        warmup: Number of inputs transliterated before timing starts
+
+    Returns:
+        List of summaries, one per configuration
+    """
+    test_cases = list(dataset.iter_test_cases())
+    evaluator = TransliterationEvaluator()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, 'input.jsonl')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for test_case in test_cases:
+                f.write(json.dumps(test_case['original'], ensure_ascii=False) + '\n')
+
+        if parallel:
+            runs = [_ConfigRun(config, input_path, work_dir, warmup) for config in configs]
+            results = [run.wait() for run in runs]
+        else:
+            results = [_ConfigRun(config, input_path, work_dir, warmup).wait() for config in configs]
+
+    return [_summarize(config, test_cases, *result, evaluator)
+            for config, result in zip(configs, results)]
+
+
+def _relative_change(old, new):
+    return (new - old) / old if old else 0.0
+
+
+class ABTester:
+    """Compare two engine configurations on the same test cases"""
+
+    def __init__(self, config_a, config_b, dataset, throughput_threshold=0.1,
+                 accuracy_threshold=0.01):
+        """
+        Initialize the comparison
+
+        Args:
+            config_a: Baseline EngineConfig
+            config_b: Candidate EngineConfig
+            dataset: TransliterationTestDataset to run
+            throughput_threshold: Largest allowed fractional drop in words/sec for B
+            accuracy_threshold: Largest allowed drop in average word accuracy for B
+        """
+        self.config_a = config_a
+        self.config_b = config_b
+        self.dataset = dataset
+        self.throughput_threshold = throughput_threshold
+        self.accuracy_threshold = accuracy_threshold
+        self.results_a = None
+        self.results_b = None
+        self.comparison = None
+
+    def run_comparison(self, parallel=True, max_examples=10):
+        """
+        Run both configurations and compare them
+
+        Args:
+            parallel: Run both configurations at the same time
+            max_examples: Number of differing cases to include per direction
+
+        Returns:
+            Comparison dict
+        """
+        self.results_a, self.results_b = run_configs(
+            [self.config_a, self.config_b], self.dataset, parallel=parallel)
+        self.comparison = self._compare_results(max_examples)
+        return self.comparison
+
+    def _compare_results(self, max_examples):
+        a, b = self.results_a, self.results_b
+        test_cases = list(self.dataset.iter_test_cases())
+
+        better, worse = [], []
+        better_count = worse_count = 0
+        for test_case, out_a, out_b, acc_a, acc_b in zip(
+                test_cases, a['outputs'], b['outputs'], a['char_accuracies'], b['char_accuracies']):
+            if acc_b == acc_a:
+                continue
+            example = {'original': test_case['original'], 'expected': test_case['expected'],
+                       'output_a': out_a, 'output_b': out_b}
+            if acc_b > acc_a:
+                better_count += 1
+                if len(better) < max_examples:
+                    better.append(example)
+            else:
+                worse_count += 1
+                if len(worse) < max_examples:
+                    worse.append(example)
+
+        deltas = {
+            'average_char_accuracy': b['average_char_accuracy'] - a['average_char_accuracy'],
+            'average_word_accuracy': b['average_word_accuracy'] - a['average_word_accuracy'],
+            'words_per_sec': _relative_change(a['words_per_sec'], b['words_per_sec']),
+            'p50_ms': _relative_change(a['p50_ms'], b['p50_ms']),
+            'p99_ms': _relative_change(a['p99_ms'], b['p99_ms']),
+        }
+        throughput_regressed = deltas['words_per_sec'] < -self.throughput_threshold
+        accuracy_regressed = deltas['average_word_accuracy'] < -self.accuracy_threshold
+
+        return {
+            'deltas': deltas,
+            'b_better_cases': better_count,
+            'b_worse_cases': worse_count,
+            'b_better_examples': better,
+            'b_worse_examples': worse,
+            'throughput_regressed': throughput_regressed,
+            'accuracy_regressed': accuracy_regressed,
+            'passed': not (throughput_regressed or accuracy_regressed),
+        }
+
+    def generate_comparison_report(self):
+        """Side-by-side text report of the last comparison"""
+        if self.comparison is None:
+            return "No comparison available. Run run_comparison() first."
+
+        a, b, comparison = self.results_a, self.results_b, self.comparison
+        rows = [
+            ('Passed cases', f"{a['passed_cases']}/{a['cases']}", f"{b['passed_cases']}/{b['cases']}", ''),
+            ('Character accuracy', f"{a['average_char_accuracy']:.2%}", f"{b['average_char_accuracy']:.2%}",
+             f"{comparison['deltas']['average_char_accuracy'] * 100:+.2f} pt"),
+            ('Word accuracy', f"{a['average_word_accuracy']:.2%}", f"{b['average_word_accuracy']:.2%}",
+             f"{comparison['deltas']['average_word_accuracy'] * 100:+.2f} pt"),
+            ('Words/sec', f"{a['words_per_sec']:.0f}", f"{b['words_per_sec']:.0f}",
+             f"{comparison['deltas']['words_per_sec']:+.1%}"),
+            ('p50 latency (ms)', f"{a['p50_ms']:.3f}", f"{b['p50_ms']:.3f}", f"{comparison['deltas']['p50_ms']:+.1%}"),
+            ('p99 latency (ms)', f"{a['p99_ms']:.3f}", f"{b['p99_ms']:.3f}", f"{comparison['deltas']['p99_ms']:+.1%}"),
+        ]
+
+        report = ["=" * 78, "A/B COMPARISON", "=" * 78,
+                  f"A: {self.config_a.name}", f"B: {self.config_b.name}", "",
+                  f"{'':22}{'A':>18}{'B':>18}{'Change':>18}"]
+        report.extend(f"{label:22}{value_a:>18}{value_b:>18}{change:>18}" for label, value_a, value_b, change in rows)
+        report.append("")
+        report.append(f"Cases where B is better: {comparison['b_better_cases']}, "
+                      f"worse: {comparison['b_worse_cases']}")
+        for title, examples in (('B better', comparison['b_better_examples']),
+                                ('B worse', comparison['b_worse_examples'])):
+            for example in examples:
+                report.append(f"  [{title}] {example['original']}")
+                report.append(f"      expected: {example['expected']}")
+                report.append(f"      A: {example['output_a']}")
+                report.append(f"      B: {example['output_b']}")
+        report.append("")
+        if comparison['throughput_regressed']:
+            report.append(f"FAIL: throughput dropped by more than {self.throughput_threshold:.0%}")
+        if comparison['accuracy_regressed']:
+            report.append(f"FAIL: word accuracy dropped by more than {self.accuracy_threshold * 100:.1f} pt")
+        if comparison['passed']:
+            report.append("PASS")
+        return "\n".join(report)
+
+
+class RegressionTester:
+    """Compare a configuration's run against a saved baseline summary"""
+
+    METRICS = ['average_char_accuracy', 'average_word_accuracy', 'words_per_sec']
+
+    def __init__(self, baseline_results=None, throughput_threshold=0.1, accuracy_threshold=0.01):
+        """
+        Initialize the regression tester
+
+        Args:
+            baseline_results: Baseline summary from run_configs() (or None)
+            throughput_threshold: Largest allowed fractional drop in words/sec
+            accuracy_threshold: Largest allowed drop in average accuracy
+        """
+        self.baseline_results = baseline_results
+        self.current_results = None
+        self.throughput_threshold = throughput_threshold
+        self.accuracy_threshold = accuracy_threshold
+
+    def set_baseline(self, results):
+        self.baseline_results = results
+
+    def save_baseline(self, file_path):
+        """Save the baseline summary (without per-case outputs) to a JSON file"""
+        summary = {key: value for key, value in self.baseline_results.items()
+                   if key not in ('outputs', 'char_accuracies')}
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    def load_baseline(self, file_path):
+        """Load a baseline summary saved by save_baseline()"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self.baseline_results = json.load(f)
+            return True
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            print(f"Error loading baseline: {e}")
+            return False
+
+    def compare_with_baseline(self, current_results):
+        """
+        Compare a run summary with the baseline
+
+        Returns:
+            Dict with 'improved', 'regressed' and 'unchanged' metric names,
+            'overall_change' per metric and 'passed'
+        """
+        self.current_results = current_results
+        comparison = {
+            'improved': [],
+            'regressed': [],
+            'unchanged': [],
+            'overall_change': {}
+        }
+
+        for metric in self.METRICS:
+            baseline = self.baseline_results[metric]
+            current = current_results[metric]
+            if metric == 'words_per_sec':
+                diff = _relative_change(baseline, current)
+                threshold = self.throughput_threshold
+            else:
+                diff = current - baseline
+                threshold = self.accuracy_threshold
+
+            if diff > threshold:
+                comparison['improved'].append(metric)
+            elif diff < -threshold:
+                comparison['regressed'].append(metric)
+            else:
+                comparison['unchanged'].append(metric)
+            comparison['overall_change'][metric] = diff
+
+        comparison['passed'] = not comparison['regressed']
+        return comparison
+
+
+def _config_from_args(args, prefix, name):
+    return EngineConfig(
+        getattr(args, f'{prefix}_name') or name,
+        language=args.language,
+        feature_flags=json.loads(getattr(args, f'{prefix}_flags')) if getattr(args, f'{prefix}_flags') else None,
+        settings=json.loads(getattr(args, f'{prefix}_settings')) if getattr(args, f'{prefix}_settings') else None,
+        exceptions_file=getattr(args, f'{prefix}_exceptions'),
+        code_path=getattr(args, f'{prefix}_code'),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare transliteration engine configurations')
+    parser.add_argument('dataset', help='Test cases (.json or .jsonl)')
+    parser.add_argument('--language', choices=['hindi', 'marathi'], default='hindi')
+    for prefix in ('a', 'b'):
+        parser.add_argument(f'--{prefix}-name', help=f'Label for configuration {prefix.upper()}')
+        parser.add_argument(f'--{prefix}-flags', help='Feature flags as JSON')
+        parser.add_argument(f'--{prefix}-settings', help='Transliterator attributes as JSON')
+        parser.add_argument(f'--{prefix}-exceptions', help='Learned exceptions JSON snapshot')
+        parser.add_argument(f'--{prefix}-code', help='Directory containing the custom_indicate package')
+    parser.add_argument('--baseline', help='Compare configuration A with a saved summary instead of B')
+    parser.add_argument('--save-summary', help='Save the summary of configuration A as a baseline')
+    parser.add_argument('--sequential', action='store_true', help='Run configurations one after another')
+    parser.add_argument('--throughput-threshold', type=float, default=0.1)
+    parser.add_argument('--accuracy-threshold', type=float, default=0.01)
+    args = parser.parse_args()
+
+    dataset = TransliterationTestDataset(os.path.basename(args.dataset), args.language)
+    if not dataset.load_from_file(args.dataset):
+        return 2
+
+    config_a = _config_from_args(args, 'a', 'A')
+
+    if args.baseline or args.save_summary:
+        summary = run_configs([config_a], dataset)[0]
+        tester = RegressionTester(throughput_threshold=args.throughput_threshold,
+                                  accuracy_threshold=args.accuracy_threshold)
+        if args.save_summary:
+            tester.set_baseline(summary)
+            tester.save_baseline(args.save_summary)
+            print(f"Saved summary to {args.save_summary}")
+        if not args.baseline:
+            return 0
+        if not tester.load_baseline(args.baseline):
+            return 2
+        comparison = tester.compare_with_baseline(summary)
+        for metric, change in comparison['overall_change'].items():
+            print(f"{metric:24} {change:+.4f}")
+        print("Regressed: " + (', '.join(comparison['regressed']) or 'none'))
+        return 0 if comparison['passed'] else 1
+
+    tester = ABTester(config_a, _config_from_args(args, 'b', 'B'), dataset,
+                      args.throughput_threshold, args.accuracy_threshold)
+    comparison = tester.run_comparison(parallel=not args.sequential)
+    print(tester.generate_comparison_report())
+    return 0 if comparison['passed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
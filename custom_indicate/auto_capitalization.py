@@ -6,6 +6,7 @@ This module handles proper capitalization of text based on language rules.
 import re
 from typing import List, Dict, Set, Tuple, Optional
 from .exceptions import NAMED_ENTITIES, get_named_entity
+from .gazetteer import get_gazetteer
 
 # Common English capitalization words (like months, days, languages, titles)
 COMMON_CAPITALIZED_WORDS = {
@@ -36,6 +37,10 @@ SENTENCE_ENDINGS = r'[.!?][\s]+[\'"\)\]]*'
 QUOTATION_START = r'[\s]*[\'"]'
 ABBREVIATIONS = r'\b(?:[A-Z]\.){2,}|\b(?:[A-Z][a-z]*\.){1,}|[A-Z]\.'
 
+# Compiled patterns for proper noun detection
+TITLE_PATTERN = re.compile(r'\b(Mr\.|Mrs\.|Ms\.|Dr\.|Prof\.)\s+([a-z])', re.IGNORECASE)
+WORD_PATTERN = re.compile(r'\w+')
+
 class AutoCapitalizer:
     def __init__(self, language: str = 'hindi'):
         """
@@ -48,6 +53,9 @@ class AutoCapitalizer:
         self.named_entities_map = NAMED_ENTITIES
         self.common_capitalized = COMMON_CAPITALIZED_WORDS
         
+        # Known person and place names (shared across capitalizers)
+        self.gazetteer = get_gazetteer()
+        
         # Cache of words already processed
         self.capitalization_cache: Dict[str, str] = {}
     
@@ -170,38 +178,19 @@ class AutoCapitalizer:
         
         # Heuristics for proper noun detection
         # 1. Words following titles (Mr., Dr., etc.)
-        text = re.sub(
-            r'\b(Mr\.|Mrs\.|Ms\.|Dr\.|Prof\.)\s+([a-z])',
+        text = TITLE_PATTERN.sub(
             lambda m: m.group(1) + ' ' + m.group(2).upper(),
-            text,
-            flags=re.IGNORECASE
+            text
         )
         
-        # 2. Names of places (simplified approach)
-        place_indicators = ['nagar', 'pur', 'garh', 'pattan', 'bad']
-        for place in place_indicators:
-            text = re.sub(
-                fr'\b([a-z]+{place})\b',
-                lambda m: self.capitalize_first_letter(m.group(1)),
-                text,
-                flags=re.IGNORECASE
-            )
-        
-        # 3. Known proper nouns for Hindi/Marathi contexts
-        # Common Indian proper names that should be capitalized
-        indian_names = ['ram', 'shyam', 'krishna', 'radha', 'sita', 'lakshman', 
-                       'bharat', 'shatrughan', 'hanuman', 'ravan', 'arjun', 
-                       'bheem', 'yudhishthir', 'nakul', 'sahadev', 'dronacharya', 'soor']
-        
-        # Create a pattern to match these names
-        name_pattern = '|'.join(fr'\b{name}\b' for name in indian_names)
-        if name_pattern:
-            text = re.sub(
-                name_pattern,
-                lambda m: self.capitalize_first_letter(m.group(0)),
-                text,
-                flags=re.IGNORECASE
-            )
+        # 2. Names of places (by suffix) and 3. known Indian proper names,
+        # both resolved per token against the gazetteer in a single pass
+        gazetteer = self.gazetteer
+        text = WORD_PATTERN.sub(
+            lambda m: (self.capitalize_first_letter(m.group(0))
+                       if gazetteer.is_proper_noun(m.group(0)) else m.group(0)),
+            text
+        )
         
         return text
     
@@ -0,0 +1,396 @@
+"""
+Bulk transliteration of text files.
+Streams files (or stdin) line by line through the enhanced engine, in batches
+of lines that can be spread over worker processes while the output keeps
+the input order. Very large files can instead be memory-mapped and processed
+in whitespace-aligned chunks. Used by the command-line interface
+(python -m custom_indicate).
+"""
+
+import argparse
+import contextlib
+import glob
+import mmap
+import os
+import sys
+import time
+
+from .parallel import chunked, imap_bounded
+
+LANGUAGES = ['hindi', 'marathi']
+
+# Feature flags of the web form, all enabled by default as there
+FEATURE_FLAGS = ['context_aware', 'statistical_schwa', 'auto_exceptions',
+                 'phonetic_refinement', 'auto_capitalization']
+
+# Buffer size for reading and writing files
+BUFFER_SIZE = 1024 * 1024
+
+# Lines sent to a worker (or transliterated) at a time
+BATCH_LINES = 512
+
+# Bytes of a memory-mapped file transliterated at a time
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# ASCII whitespace; these bytes never occur inside multi-byte UTF-8 sequences
+_WHITESPACE = (b'\n', b' ', b'\t', b'\r', b'\f', b'\v')
+
+STDIN = '-'
+
+
+def expand_inputs(patterns):
+    """
+    Expand input paths and glob patterns
+
+    Args:
+        patterns: File paths, glob patterns or '-' for stdin
+
+    Returns:
+        (list of paths in argument order, list of patterns that matched nothing)
+    """
+    paths = []
+    missing = []
+    for pattern in patterns:
+        if pattern == STDIN or os.path.isfile(pattern):
+            paths.append(pattern)
+            continue
+        matches = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        if matches:
+            paths.extend(matches)
+        else:
+            missing.append(pattern)
+    return paths, missing
+
+
+def _open_input(path):
+    if path == STDIN:
+        return open(sys.stdin.fileno(), 'r', encoding='utf-8', newline='',
+                    buffering=BUFFER_SIZE, closefd=False)
+    return open(path, 'r', encoding='utf-8', newline='', buffering=BUFFER_SIZE)
+
+
+def _open_output(path):
+    if path is None:
+        return open(sys.stdout.fileno(), 'w', encoding='utf-8', newline='',
+                    buffering=BUFFER_SIZE, closefd=False)
+    return open(path, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE)
+
+
+def _open_binary_output(path):
+    if path is None:
+        return open(sys.stdout.fileno(), 'wb', buffering=BUFFER_SIZE, closefd=False)
+    return open(path, 'wb', buffering=BUFFER_SIZE)
+
+
+def _read_batches(paths, batch_lines):
+    """Yield (file index, lines) for every batch of every input, in order"""
+    for index, path in enumerate(paths):
+        with _open_input(path) as f:
+            for lines in chunked(f, batch_lines):
+                yield index, lines
+
+
+# Per-process engine state, set by _init_worker
+_worker_transliterator = None
+_worker_features = None
+
+def _init_worker(language, features):
+    global _worker_transliterator, _worker_features
+    from .enhanced_transliteration import get_transliterator
+
+    _worker_transliterator = get_transliterator(language)
+    _worker_features = features
+
+def _init_process_worker(language, features):
+    # The engine prints errors to stdout, which may be carrying the output
+    sys.stdout = sys.stderr
+    _init_worker(language, features)
+
+
+def _transliterate_lines(lines):
+    """
+    Transliterate lines, keeping each line's leading and trailing whitespace
+
+    Returns:
+        (transliterated text, number of lines, number of words)
+    """
+    output = []
+    words = 0
+    for line in lines:
+        text = line.strip()
+        if text:
+            words += len(text.split())
+            start = len(line) - len(line.lstrip())
+            end = start + len(text)
+            line = line[:start] + _worker_transliterator.transliterate(text, _worker_features) + line[end:]
+        output.append(line)
+    return ''.join(output), len(lines), words
+
+
+def _transliterate_batch(task):
+    index, lines = task
+    return (index,) + _transliterate_lines(lines)
+
+
+def transliterate_files(paths, language='hindi', features=None, output_dir=None,
+                        jobs=1, batch_lines=BATCH_LINES):
+    """
+    Transliterate files line by line
+
+    Args:
+        paths: Input paths ('-' for stdin)
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+        output_dir: Directory for the outputs, each named after its input
+            (default: all outputs to stdout, in input order)
+        jobs: Number of worker processes (1: transliterate in this process)
+        batch_lines: Lines per batch
+
+    Returns:
+        Dict with 'files', 'lines', 'words' and 'seconds'
+    """
+    start = time.perf_counter()
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    tasks = _read_batches(paths, batch_lines)
+    if jobs > 1:
+        results = imap_bounded(_transliterate_batch, tasks, workers=jobs,
+                               initializer=_init_process_worker, initargs=(language, features))
+    else:
+        _init_worker(language, features)
+        results = map(_transliterate_batch, tasks)
+
+    stats = {'files': len(paths), 'lines': 0, 'words': 0}
+    output = _open_output(None) if output_dir is None else None
+    current = None
+    written = set()
+    # The engine prints errors to stdout, which may be carrying the output
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            for index, text, lines, words in results:
+                if output_dir is not None and index != current:
+                    if output is not None:
+                        output.close()
+                    output = _open_output(_output_path(paths[index], output_dir))
+                    current = index
+                    written.add(index)
+                output.write(text)
+                stats['lines'] += lines
+                stats['words'] += words
+        finally:
+            if output is not None:
+                output.close()
+
+    # Empty inputs produce no batches but still get an (empty) output file
+    if output_dir is not None:
+        for index, path in enumerate(paths):
+            if index not in written:
+                _open_output(_output_path(path, output_dir)).close()
+
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def chunk_ranges(data, chunk_size=CHUNK_SIZE):
+    """
+    Split UTF-8 bytes into whitespace-aligned ranges of about chunk_size bytes
+
+    Ranges end after a newline where one is in reach, otherwise after other
+    ASCII whitespace; only a stretch without any whitespace makes a range
+    longer than chunk_size. Only the bytes around each boundary are read, and
+    every range decodes on its own.
+
+    Args:
+        data: bytes-like object supporting find/rfind (e.g. an mmap)
+        chunk_size: Target range size in bytes
+
+    Yields:
+        (start, end) byte offsets
+    """
+    size = len(data)
+    start = 0
+    while start < size:
+        end = start + chunk_size
+        if end >= size:
+            end = size
+        else:
+            cut = data.rfind(b'\n', start, end)
+            if cut < 0:
+                cut = max(data.rfind(space, start, end) for space in _WHITESPACE[1:])
+            if cut < 0:
+                following = [data.find(space, end) for space in _WHITESPACE]
+                cut = min((i for i in following if i >= 0), default=size - 1)
+            end = cut + 1
+        yield start, end
+        start = end
+
+
+def _transliterate_range(data, start, end):
+    return _transliterate_lines(data[start:end].decode('utf-8').splitlines(keepends=True))
+
+
+# Memory map of the input in worker processes, set by _init_mapped_worker
+_worker_data = None
+
+def _init_mapped_worker(path, language, features):
+    global _worker_data
+    _init_process_worker(language, features)
+    with open(path, 'rb') as f:
+        _worker_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _transliterate_mapped_range(task):
+    start, end = task
+    return _transliterate_range(_worker_data, start, end)
+
+
+def transliterate_mapped_file(input_path, output_path=None, language='hindi', features=None,
+                              jobs=1, chunk_size=CHUNK_SIZE):
+    """
+    Transliterate a large file through a memory map
+
+    The file is never read or decoded as a whole: it is split into
+    whitespace-aligned byte ranges (see chunk_ranges), and each range is
+    decoded and transliterated line by line on its own, in worker processes
+    that map the same file when jobs > 1. Results are written to the output
+    in input order as they complete, so memory use is bounded by the
+    chunks in flight rather than by the file size.
+
+    Args:
+        input_path: UTF-8 input file
+        output_path: Output file (default: stdout)
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+        jobs: Number of worker processes (1: transliterate in this process)
+        chunk_size: Target chunk size in bytes
+
+    Returns:
+        Dict with 'files', 'lines', 'words', 'chunks' and 'seconds'
+
+    Raises:
+        ValueError: If output_path is the input file
+    """
+    if output_path is not None and os.path.abspath(output_path) == os.path.abspath(input_path):
+        raise ValueError(f"Output would overwrite its input: {input_path}")
+
+    start_time = time.perf_counter()
+    stats = {'files': 1, 'lines': 0, 'words': 0, 'chunks': 0}
+    with open(input_path, 'rb') as f, _open_binary_output(output_path) as output:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                ranges = chunk_ranges(data, chunk_size)
+                if jobs > 1:
+                    results = imap_bounded(_transliterate_mapped_range, ranges, workers=jobs,
+                                           initializer=_init_mapped_worker,
+                                           initargs=(input_path, language, features))
+                else:
+                    _init_worker(language, features)
+                    results = (_transliterate_range(data, start, end) for start, end in ranges)
+
+                # The engine prints errors to stdout, which may be carrying the output
+                with contextlib.redirect_stdout(sys.stderr):
+                    for text, lines, words in results:
+                        output.write(text.encode('utf-8'))
+                        stats['chunks'] += 1
+                        stats['lines'] += lines
+                        stats['words'] += words
+
+    stats['seconds'] = time.perf_counter() - start_time
+    return stats
+
+
+def _output_path(path, output_dir):
+    return os.path.join(output_dir, os.path.basename(path))
+
+
+def check_outputs(paths, output_dir):
+    """
+    Problems with writing the inputs' outputs into output_dir
+
+    Returns:
+        List of error messages (empty if the outputs can be written)
+    """
+    errors = []
+    if STDIN in paths:
+        errors.append("stdin cannot be written to an output directory")
+    seen = {}
+    for path in paths:
+        if path == STDIN:
+            continue
+        output = _output_path(path, output_dir)
+        if os.path.abspath(output) == os.path.abspath(path):
+            errors.append(f"Output would overwrite its input: {path}")
+        if output in seen:
+            errors.append(f"Inputs {seen[output]} and {path} have the same output {output}")
+        seen[output] = path
+    return errors
+
+
+def format_stats(stats):
+    """One-line summary of a run"""
+    seconds = max(stats['seconds'], 1e-9)
+    return (f"{stats['files']} files, {stats['lines']} lines, {stats['words']} words "
+            f"in {stats['seconds']:.2f} s: {stats['words'] / seconds:,.0f} words/sec")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m custom_indicate',
+        description='Transliterate Hindi or Marathi text files to English')
+    parser.add_argument('inputs', nargs='*', default=[STDIN],
+                        help="Input files or glob patterns ('-' or none: stdin)")
+    parser.add_argument('-l', '--language', choices=LANGUAGES, default='hindi')
+    parser.add_argument('-o', '--output-dir',
+                        help='Write each input to a file of the same name here (default: stdout)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Worker processes; output stays in input order (default: 1)')
+    parser.add_argument('--batch-lines', type=int, default=BATCH_LINES,
+                        help=f'Lines per batch (default: {BATCH_LINES})')
+    parser.add_argument('--mmap', action='store_true',
+                        help='Memory-map each input file and process it in chunks (for very large files)')
+    parser.add_argument('--chunk-mb', type=float, default=CHUNK_SIZE / 1024 / 1024,
+                        help='Chunk size with --mmap, in MiB (default: %(default)g)')
+    parser.add_argument('--stats', action='store_true',
+                        help='Print throughput to stderr when done')
+    for flag in FEATURE_FLAGS:
+        parser.add_argument(f"--{flag.replace('_', '-')}", dest=flag, default=True,
+                            action=argparse.BooleanOptionalAction)
+    args = parser.parse_args(argv)
+
+    paths, missing = expand_inputs(args.inputs)
+    for pattern in missing:
+        print(f"Error: no input files match {pattern}", file=sys.stderr)
+    if args.output_dir is not None:
+        errors = check_outputs(paths, args.output_dir)
+        for error in errors:
+            print(f"Error: {error}", file=sys.stderr)
+        if errors:
+            return 1
+    if args.mmap and STDIN in paths:
+        print("Error: stdin cannot be memory-mapped", file=sys.stderr)
+        return 1
+    if not paths:
+        return 1
+
+    features = {flag: getattr(args, flag) for flag in FEATURE_FLAGS}
+    jobs = max(args.jobs, 1)
+    try:
+        if args.mmap:
+            stats = {'files': 0, 'lines': 0, 'words': 0, 'seconds': 0.0}
+            for path in paths:
+                output_path = _output_path(path, args.output_dir) if args.output_dir else None
+                if args.output_dir:
+                    os.makedirs(args.output_dir, exist_ok=True)
+                file_stats = transliterate_mapped_file(path, output_path, args.language, features,
+                                                       jobs, max(int(args.chunk_mb * 1024 * 1024), 1))
+                for name in stats:
+                    stats[name] += file_stats[name]
+        else:
+            stats = transliterate_files(paths, args.language, features, args.output_dir,
+                                        jobs, max(args.batch_lines, 1))
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if args.stats:
+        print(format_stats(stats), file=sys.stderr)
+    return 1 if missing else 0
@@ -0,0 +1,264 @@
+"""
+Column transliteration for tabular data.
+Transliterates each distinct value of a column once and maps the results
+back to the rows, which pays off on name and address columns where a few
+values repeat across many rows. Works on lists, NumPy object arrays and
+pandas Series, and streams CSV files in chunks of rows.
+"""
+
+import csv
+import os
+import sys
+import time
+
+# Distinct values remembered across calls (e.g. CSV chunks)
+MAX_CACHE_ENTRIES = 1000000
+
+# Rows of a CSV file processed at a time
+CHUNK_ROWS = 50000
+
+
+class ColumnTransliterator:
+    """Transliterates columns value by value, each distinct value once"""
+
+    def __init__(self, language='hindi', features=None, transliterator=None,
+                 max_cache_entries=MAX_CACHE_ENTRIES):
+        """
+        Args:
+            language: 'hindi' or 'marathi'
+            features: Feature flags for EnhancedTransliterator.transliterate
+            transliterator: Engine to use (default: the shared engine for language)
+            max_cache_entries: Distinct values remembered across calls
+        """
+        if transliterator is None:
+            from .enhanced_transliteration import get_transliterator
+            transliterator = get_transliterator(language)
+        self.transliterator = transliterator
+        self.features = features
+        self.max_cache_entries = max_cache_entries
+        self.cache = {}
+        self.stats = {}
+
+    def transliterate_values(self, values, name=None):
+        """
+        Transliterate a list of values
+
+        Non-string values (None, NaN, numbers) and blank strings are returned
+        unchanged; they are not cached or counted as values.
+
+        Args:
+            values: List of values
+            name: Column name the statistics are recorded under
+
+        Returns:
+            List of results, one per value
+        """
+        start = time.perf_counter()
+        cache = self.cache
+        computed = 0
+        counted = 0
+        # Each distinct value of this call is looked up or transliterated once
+        results = {}
+        output = []
+        for value in values:
+            # NaN is not equal to itself, so it must never reach the dicts
+            if not isinstance(value, str) or not value.strip():
+                output.append(value)
+                continue
+            counted += 1
+            result = results.get(value)
+            if result is None:
+                result = cache.get(value)
+                if result is None:
+                    result = self.transliterator.transliterate(value, self.features)
+                    computed += 1
+                    if len(cache) < self.max_cache_entries:
+                        cache[value] = result
+                results[value] = result
+            output.append(result)
+
+        stats = self.stats.setdefault(name, {'rows': 0, 'values': 0, 'chunk_distinct': 0,
+                                             'transliterated': 0, 'seconds': 0.0})
+        stats['rows'] += len(values)
+        stats['values'] += counted
+        stats['chunk_distinct'] += len(results)
+        stats['transliterated'] += computed
+        stats['seconds'] += time.perf_counter() - start
+        return output
+
+    def transliterate(self, column, name=None):
+        """
+        Transliterate a column
+
+        Args:
+            column: List, tuple, NumPy array or pandas Series of values
+            name: Column name for the statistics (default: the Series name)
+
+        Returns:
+            The results in the same kind of container: a list (for lists and
+            tuples), an object array, or a Series with the same index and name
+        """
+        module = type(column).__module__
+        if module.startswith('pandas'):
+            import pandas as pd
+
+            results = self.transliterate_values(column.tolist(),
+                                                column.name if name is None else name)
+            return pd.Series(results, index=column.index, name=column.name, dtype=object)
+        if module == 'numpy':
+            import numpy as np
+
+            results = self.transliterate_values(column.ravel().tolist(), name)
+            output = np.empty(len(results), dtype=object)
+            output[:] = results
+            return output.reshape(column.shape)
+        return self.transliterate_values(list(column), name)
+
+    def report(self):
+        """
+        Per-column statistics
+
+        Returns:
+            Dict of column name -> rows, values (non-blank strings),
+            chunk_distinct (distinct values of each call, summed over calls
+            such as CSV chunks), values transliterated (distinct values not
+            already cached), seconds, rows per second and the dedup ratio
+            (values per value transliterated)
+        """
+        report = {}
+        for name, stats in self.stats.items():
+            seconds = max(stats['seconds'], 1e-9)
+            report[name] = dict(stats,
+                                rows_per_sec=stats['rows'] / seconds,
+                                dedup_ratio=stats['values'] / max(stats['transliterated'], 1))
+        return report
+
+
+def transliterate_column(column, language='hindi', features=None):
+    """
+    Transliterate one column, each distinct value once
+
+    Args:
+        column: List, tuple, NumPy array or pandas Series of values
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+
+    Returns:
+        Results in the same kind of container as column
+    """
+    return ColumnTransliterator(language, features).transliterate(column)
+
+
+def transliterate_csv(input_path, output_path, columns, language='hindi', features=None,
+                      suffix=None, chunk_rows=CHUNK_ROWS, delimiter=','):
+    """
+    Transliterate columns of a CSV file, streaming it in chunks of rows
+
+    Args:
+        input_path: UTF-8 CSV file with a header row
+        output_path: Output CSV file
+        columns: Names of the columns to transliterate
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+        suffix: If given, results go to new columns named column + suffix,
+            each right after its source column; otherwise they replace the values
+        chunk_rows: Rows read and transliterated at a time
+        delimiter: Field delimiter
+
+    Returns:
+        Report dict: per-column statistics (see ColumnTransliterator.report)
+        plus 'rows' and 'seconds' for the whole file
+
+    Raises:
+        ValueError: If a column is not in the header
+    """
+    start = time.perf_counter()
+    transliterator = ColumnTransliterator(language, features)
+    rows_total = 0
+
+    with open(input_path, 'r', encoding='utf-8', newline='') as infile, \
+            open(output_path, 'w', encoding='utf-8', newline='') as outfile:
+        reader = csv.reader(infile, delimiter=delimiter)
+        writer = csv.writer(outfile, delimiter=delimiter)
+        header = next(reader, [])
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise ValueError(f"Columns not in {input_path}: {', '.join(missing)}")
+        indexes = [header.index(name) for name in columns]
+
+        output_header = list(header)
+        if suffix is not None:
+            # Insert from the right so earlier positions stay valid
+            for index in sorted(indexes, reverse=True):
+                output_header.insert(index + 1, header[index] + suffix)
+        writer.writerow(output_header)
+
+        while True:
+            rows = [row for _, row in zip(range(chunk_rows), reader)]
+            if not rows:
+                break
+            width = len(header)
+            for row in rows:
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+
+            results = {index: transliterator.transliterate_values([row[index] for row in rows],
+                                                                  header[index])
+                       for index in indexes}
+            for position, row in enumerate(rows):
+                if suffix is None:
+                    for index in indexes:
+                        row[index] = results[index][position]
+                else:
+                    for index in sorted(indexes, reverse=True):
+                        row.insert(index + 1, results[index][position])
+            writer.writerows(rows)
+            rows_total += len(rows)
+
+    report = transliterator.report()
+    report['rows'] = rows_total
+    report['seconds'] = time.perf_counter() - start
+    return report
+
+
+def format_report(report):
+    """Human-readable table for a transliterate_csv report"""
+    lines = [f"{'column':24}{'rows':>10}{'transliterated':>16}{'dedup':>10}{'rows/sec':>12}"]
+    for name, stats in report.items():
+        if isinstance(stats, dict):
+            lines.append(f"{name:24}{stats['rows']:>10}{stats['transliterated']:>16}"
+                         f"{stats['dedup_ratio']:>9.1f}x{stats['rows_per_sec']:>12,.0f}")
+    lines.append(f"{report['rows']} rows in {report['seconds']:.2f} s")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Transliterate columns of a CSV file')
+    parser.add_argument('input', help='Input CSV file (with a header row)')
+    parser.add_argument('output', help='Output CSV file')
+    parser.add_argument('-c', '--column', action='append', required=True,
+                        help='Column to transliterate (repeatable)')
+    parser.add_argument('-l', '--language', choices=['hindi', 'marathi'], default='hindi')
+    parser.add_argument('--suffix', help='Write results to new columns with this suffix')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--delimiter', default=',')
+    args = parser.parse_args(argv)
+
+    if os.path.abspath(args.input) == os.path.abspath(args.output):
+        print("Error: output would overwrite the input", file=sys.stderr)
+        return 1
+    try:
+        report = transliterate_csv(args.input, args.output, args.column, args.language,
+                                   suffix=args.suffix, chunk_rows=max(args.chunk_rows, 1),
+                                   delimiter=args.delimiter)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(format_report(report))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""
+Transliteration daemon.
+Keeps warmed engines in a long-running process and serves requests over a
+Unix domain socket, so shell pipelines and batch jobs pay for the work
+rather than for importing the package and building the engines each call.
+
+Protocol: every message is a 4-byte big-endian length followed by that many
+bytes of UTF-8 JSON. A client sends requests and reads one response per
+request over the same connection:
+
+    {"op": "transliterate", "text": "...", "language": "hindi", "features": {...}}
+    {"op": "transliterate", "texts": ["...", ...], "language": "marathi"}
+    {"op": "ping"}
+
+Responses are {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+
+Usage:
+    python -m custom_indicate.daemon serve [--socket PATH] [--workers 4]
+    python -m custom_indicate.daemon client [--language marathi] [FILE ...]
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+
+LANGUAGES = ['hindi', 'marathi']
+
+# Largest request or response accepted, in bytes
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+_LENGTH = struct.Struct('>I')
+
+
+def default_socket_path():
+    """Socket path from TRANSLITERATE_SOCKET, or a per-user path in the runtime directory"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or os.environ.get('TMPDIR') or '/tmp'
+    return (os.environ.get('TRANSLITERATE_SOCKET') or
+            os.path.join(runtime_dir, f'indicode-{os.getuid()}.sock'))
+
+
+def send_message(sock, message):
+    """Send one length-prefixed JSON message"""
+    data = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    if len(data) > MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message too large: {len(data)} bytes")
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _recv_exactly(sock, size):
+    """Read exactly size bytes, or None if the peer closed the connection first"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            return None
+        received += count
+    return bytes(buffer)
+
+
+def recv_message(sock):
+    """
+    Receive one length-prefixed JSON message
+
+    Returns:
+        The decoded message, or None if the connection was closed
+    """
+    header = _recv_exactly(sock, _LENGTH.size)
+    if header is None:
+        return None
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message too large: {length} bytes")
+    data = _recv_exactly(sock, length)
+    if data is None:
+        return None
+    return json.loads(data.decode('utf-8'))
+
+
+# Server
+
+class _Stopped(Exception):
+    """Raised in the daemon's main process by SIGTERM/SIGINT"""
+
+
+def handle_request(request):
+    """
+    Run one request against the shared engines
+
+    Returns:
+        Response dict
+    """
+    from .enhanced_transliteration import get_transliterator
+
+    op = request.get('op')
+    if op == 'ping':
+        return {'ok': True, 'result': {'pid': os.getpid()}}
+    if op != 'transliterate':
+        return {'ok': False, 'error': f"Unknown op: {op!r}"}
+
+    language = request.get('language', 'hindi')
+    if language not in LANGUAGES:
+        return {'ok': False, 'error': f"Unsupported language: {language!r}"}
+    features = request.get('features')
+    transliterator = get_transliterator(language)
+
+    if 'texts' in request:
+        result = [transliterator.transliterate(text, features) for text in request['texts']]
+    else:
+        result = transliterator.transliterate(request.get('text', ''), features)
+    return {'ok': True, 'result': result}
+
+
+def handle_connection(conn):
+    """Serve requests on one client connection until the client closes it"""
+    with conn:
+        while True:
+            try:
+                request = recv_message(conn)
+            except (ValueError, UnicodeDecodeError) as e:
+                # The stream cannot be resynchronized after a bad frame
+                send_message(conn, {'ok': False, 'error': f"Bad request: {e}"})
+                return
+            if request is None:
+                return
+            try:
+                response = handle_request(request)
+            except Exception as e:
+                response = {'ok': False, 'error': str(e)}
+            send_message(conn, response)
+
+
+def _worker_loop(server):
+    """Accept and serve connections, one at a time, until terminated"""
+    import signal
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        conn, _ = server.accept()
+        try:
+            handle_connection(conn)
+        except OSError as e:
+            print(f"Error serving daemon client: {e}", file=sys.stderr)
+
+
+def _bind(socket_path):
+    """Bind the listening socket, replacing a stale socket file"""
+    if os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+        else:
+            probe.close()
+            raise OSError(f"A daemon is already listening on {socket_path}")
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    server.listen(128)
+    return server
+
+
+def serve(socket_path=None, workers=None, languages=None, word_list=None):
+    """
+    Run the daemon until SIGTERM or SIGINT
+
+    The engines are warmed up once, then worker processes are forked that
+    share them copy-on-write and accept connections from the same socket.
+    Each worker serves one client at a time; further clients wait in the
+    listen backlog.
+
+    Args:
+        socket_path: Unix socket path (default: default_socket_path())
+        workers: Number of worker processes (default: CPU count)
+        languages: Languages to warm up (default: all)
+        word_list: Optional word list for priming the schwa cache
+    """
+    import signal
+
+    from .parallel import default_workers
+    from .warmup import warm_up
+
+    socket_path = socket_path or default_socket_path()
+    workers = workers or default_workers()
+    server = _bind(socket_path)
+    warm_up(languages, word_list=word_list)
+
+    def stop(signum, frame):
+        raise _Stopped()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    children = set()
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _worker_loop(server)
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    print(f"Serving on {socket_path} with {workers} workers (pid {os.getpid()})", flush=True)
+    try:
+        for _ in range(workers):
+            spawn()
+        # Replace workers that die while the daemon is running
+        while True:
+            pid, _ = os.wait()
+            children.discard(pid)
+            spawn()
+    except (_Stopped, ChildProcessError):
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# Client
+
+class DaemonClient:
+    """Client for a running daemon; one connection, reused across requests"""
+
+    def __init__(self, socket_path=None, timeout=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(self.socket_path)
+
+    def request(self, message):
+        """
+        Send a request and wait for its result
+
+        Raises:
+            RuntimeError: If the daemon reports an error or closes the connection
+        """
+        send_message(self.sock, message)
+        response = recv_message(self.sock)
+        if response is None:
+            raise RuntimeError("Daemon closed the connection")
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', 'Daemon error'))
+        return response['result']
+
+    def ping(self):
+        """Process id of the worker serving this connection"""
+        return self.request({'op': 'ping'})['pid']
+
+    def transliterate(self, text, language='hindi', features=None):
+        """Transliterate one text"""
+        return self.request({'op': 'transliterate', 'text': text,
+                             'language': language, 'features': features})
+
+    def transliterate_many(self, texts, language='hindi', features=None):
+        """Transliterate several texts in one round trip"""
+        return self.request({'op': 'transliterate', 'texts': list(texts),
+                             'language': language, 'features': features})
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Transliteration daemon')
+    parser.add_argument('--socket', help='Unix socket path')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help='Run the daemon')
+    serve_parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    serve_parser.add_argument('--language', choices=LANGUAGES, action='append',
+                              help='Language to warm up (repeatable; default: all)')
+    serve_parser.add_argument('--word-list', help='Word list for priming the schwa cache')
+
+    client_parser = commands.add_parser('client', help='Transliterate files or stdin')
+    client_parser.add_argument('files', nargs='*', help='Input files (default: stdin)')
+    client_parser.add_argument('--language', choices=LANGUAGES, default='hindi')
+    client_parser.add_argument('--features', type=json.loads, help='Feature flags as JSON')
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        serve(args.socket, args.workers, args.language, args.word_list)
+        return 0
+
+    try:
+        with DaemonClient(args.socket) as client:
+            if not args.files:
+                print(client.transliterate(sys.stdin.read(), args.language, args.features))
+            for path in args.files:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                print(client.transliterate(text, args.language, args.features))
+    except (OSError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
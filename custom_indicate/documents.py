@@ -0,0 +1,465 @@
+"""
+Uploaded document processing.
+Uploads are copied to a temporary file in fixed-size blocks, and their
+paragraphs are read back and transliterated one at a time: plain text line
+by line, and .docx by parsing word/document.xml incrementally straight from
+the zip archive. Output is produced as a stream of UTF-8 blocks, so memory
+stays bounded by the longest paragraph rather than by the file size.
+
+PDF pages are extracted and transliterated in a shared pool of worker
+processes, a bounded number of pages at a time, and streamed back in page
+order. Text extraction uses pypdf (or PyPDF2), which is pure Python and only
+needed for PDFs.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+from xml.etree import ElementTree
+
+# Document formats that can be read paragraph by paragraph
+SUPPORTED_EXTENSIONS = ('.txt', '.docx', '.pdf')
+
+# Bytes copied from an upload to disk at a time
+COPY_BUFFER_SIZE = 64 * 1024
+
+# Transliterated output is yielded in blocks of about this many bytes
+OUTPUT_BLOCK_SIZE = 64 * 1024
+
+# PDF pages submitted to the workers but not yet streamed, per worker
+PDF_PAGES_PER_WORKER = 2
+
+# Open PDF readers kept by each worker process, for the documents it is working on
+PDF_READERS_PER_WORKER = 2
+
+_DOCX_BODY = 'word/document.xml'
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+def document_extension(filename):
+    """
+    Lower-case extension of an uploaded file name
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"Unsupported file type {extension or filename!r}; "
+                         f"expected one of {', '.join(SUPPORTED_EXTENSIONS)}")
+    return extension
+
+
+def spool_upload(stream, suffix='', max_bytes=None, directory=None):
+    """
+    Copy an upload stream to a temporary file in fixed-size blocks
+
+    Args:
+        stream: Readable binary file object (e.g. a Werkzeug FileStorage stream)
+        suffix: Suffix for the temporary file name
+        max_bytes: Largest accepted upload; None for no limit
+        directory: Directory for the temporary file (default: the system temp dir)
+
+    Returns:
+        Path of the temporary file; the caller removes it
+
+    Raises:
+        ValueError: If the upload is larger than max_bytes
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            copied = 0
+            while True:
+                block = stream.read(COPY_BUFFER_SIZE)
+                if not block:
+                    break
+                copied += len(block)
+                if max_bytes is not None and copied > max_bytes:
+                    raise ValueError(f"File is larger than {max_bytes} bytes")
+                f.write(block)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def check_document(path, extension):
+    """
+    Check that a spooled file can be read, before any output is streamed
+
+    Raises:
+        ValueError: If the file is not a readable document of its type
+    """
+    if extension == '.docx':
+        try:
+            with zipfile.ZipFile(path) as archive:
+                archive.getinfo(_DOCX_BODY)
+        except (zipfile.BadZipFile, KeyError):
+            raise ValueError("Not a valid .docx file")
+    elif extension == '.pdf':
+        pdf_page_count(path)
+
+
+def iter_text_paragraphs(path):
+    """Lines of a UTF-8 text file, without line endings"""
+    with open(path, 'r', encoding='utf-8-sig', errors='replace', newline=None) as f:
+        for line in f:
+            yield line.rstrip('\n')
+
+
+def _docx_paragraph_text(paragraph):
+    parts = []
+    for element in paragraph.iter():
+        if element.tag == _W + 't':
+            parts.append(element.text or '')
+        elif element.tag == _W + 'tab':
+            parts.append('\t')
+        elif element.tag in (_W + 'br', _W + 'cr'):
+            parts.append(' ')
+    return ''.join(parts)
+
+
+def iter_docx_paragraphs(path):
+    """
+    Paragraph texts of a .docx file, in document order
+
+    word/document.xml is parsed incrementally from the archive; each
+    paragraph is discarded once its text has been read, and each top-level
+    block (paragraph, table) once it has ended, so the tree never holds more
+    than the block being read. Paragraphs inside tables are yielded too.
+    """
+    with zipfile.ZipFile(path) as archive, archive.open(_DOCX_BODY) as xml:
+        body = None
+        depth = 0
+        for event, element in ElementTree.iterparse(xml, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if element.tag == _W + 'body':
+                    body = element
+                continue
+            depth -= 1
+            if element.tag == _W + 'p':
+                yield _docx_paragraph_text(element)
+                element.clear()
+            # Children of w:body sit at depth 2 (w:document > w:body > block)
+            if body is not None and depth == 2:
+                body.clear()
+
+
+def _pdf_reader_class():
+    """PdfReader from pypdf or PyPDF2, or None if neither is installed"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            return None
+    return PdfReader
+
+
+def _open_pdf(path, reader_class=None):
+    reader_class = reader_class or _pdf_reader_class()
+    if reader_class is None:
+        raise ValueError("PDF support requires pypdf (pip install pypdf)")
+    try:
+        return reader_class(path)
+    except Exception as e:
+        raise ValueError(f"Not a valid .pdf file: {e}")
+
+
+def _page_count(reader):
+    try:
+        return len(reader.pages)
+    except Exception as e:
+        raise ValueError(f"Not a valid .pdf file: {e}")
+
+
+def pdf_page_count(path, reader_class=None):
+    """
+    Number of pages in a PDF file
+
+    Args:
+        path: PDF file
+        reader_class: PdfReader-compatible class (default: pypdf's)
+
+    Raises:
+        ValueError: If no PDF library is installed or the file cannot be read
+    """
+    return _page_count(_open_pdf(path, reader_class))
+
+
+def _transliterate_line(transliterator, line, features):
+    text = line.strip()
+    return transliterator.transliterate(text, features) if text else ''
+
+
+def _transliterate_pdf_page(reader, transliterator, features, index):
+    start = time.perf_counter()
+    try:
+        text = reader.pages[index].extract_text() or ''
+    except Exception as e:
+        # One damaged page should not lose the rest of the document
+        print(f"Error extracting PDF page {index + 1}: {e}", file=sys.stderr)
+        text = ''
+    extracted = time.perf_counter()
+    lines = [_transliterate_line(transliterator, line, features) for line in text.splitlines()]
+    return {
+        'page': index + 1,
+        'text': '\n'.join(lines),
+        'extract_seconds': extracted - start,
+        'transliterate_seconds': time.perf_counter() - extracted
+    }
+
+
+# Worker side: readers this worker process has open, oldest first.
+# Only used in pool workers; the pool is shared, so pages of several
+# documents can reach the same worker.
+_pdf_readers = {}
+
+def _worker_pdf_reader(path, reader_class):
+    stat = os.stat(path)
+    # Spooled uploads are deleted when done, so a later upload can reuse the path
+    key = (path, reader_class, stat.st_mtime_ns, stat.st_size)
+    reader = _pdf_readers.pop(key, None)
+    if reader is None:
+        reader = _open_pdf(path, reader_class)
+        while len(_pdf_readers) >= PDF_READERS_PER_WORKER:
+            del _pdf_readers[next(iter(_pdf_readers))]
+    _pdf_readers[key] = reader
+    return reader
+
+def _transliterate_pdf_task(task):
+    from .enhanced_transliteration import get_transliterator
+
+    path, reader_class, language, features, index = task
+    return _transliterate_pdf_page(_worker_pdf_reader(path, reader_class),
+                                   get_transliterator(language), features, index)
+
+
+def get_pdf_pool(workers):
+    """Shared process pool for PDF pages with the given number of workers"""
+    from .parallel import shared_pool
+
+    return shared_pool(('pdf', workers), workers)
+
+
+def iter_pdf_pages(path, language='hindi', features=None, workers=None, max_in_flight=None,
+                   reader_class=None):
+    """
+    Extract and transliterate the pages of a PDF file in worker processes
+
+    Pages are independent, so they are spread over the shared pool of
+    get_pdf_pool(workers); at most max_in_flight pages are pending at a time
+    and results come back in page order. Single-page documents and
+    workers=1 are handled in the calling thread, with its own reader.
+
+    Args:
+        path: PDF file
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+        workers: Number of worker processes (default: CPU count; 1 runs the
+            pages in this process)
+        max_in_flight: Pages submitted but not yet yielded (default:
+            PDF_PAGES_PER_WORKER per worker)
+        reader_class: PdfReader-compatible class (default: pypdf's); must
+            be importable by the worker processes
+
+    Yields:
+        Dict per page: 'page' (1-based), 'text' (transliterated, one line per
+        extracted line), 'extract_seconds' and 'transliterate_seconds'
+
+    Raises:
+        ValueError: If no PDF library is installed, the file cannot be read
+            or a worker process stops unexpectedly
+    """
+    from .enhanced_transliteration import get_transliterator
+    from .parallel import default_workers, discard_shared_pool, imap_bounded
+
+    reader = _open_pdf(path, reader_class)
+    pages = range(_page_count(reader))
+    workers = workers or default_workers()
+    if workers <= 1 or len(pages) <= 1:
+        transliterator = get_transliterator(language)
+        for index in pages:
+            yield _transliterate_pdf_page(reader, transliterator, features, index)
+        return
+
+    # Each worker opens the file itself
+    reader = None
+    pool = get_pdf_pool(workers)
+    tasks = ((path, reader_class, language, features, index) for index in pages)
+    try:
+        yield from imap_bounded(_transliterate_pdf_task, tasks, executor=pool,
+                                max_in_flight=max_in_flight or workers * PDF_PAGES_PER_WORKER)
+    except BrokenProcessPool:
+        # Give the next document a fresh pool
+        discard_shared_pool(('pdf', workers), pool)
+        raise ValueError("A PDF worker process stopped unexpectedly")
+
+
+def stream_transliterated_pdf(path, language='hindi', features=None, workers=None, timings=None):
+    """
+    Transliterate a PDF file as a stream of UTF-8 text blocks, one per page
+
+    Pages are separated by a blank line.
+
+    Args:
+        path: PDF file
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+        workers: Number of worker processes (see iter_pdf_pages)
+        timings: Optional list that receives each page's timing dict
+            (without the text) as the page is streamed
+
+    Yields:
+        UTF-8 encoded page texts
+    """
+    for result in iter_pdf_pages(path, language, features, workers):
+        text = result.pop('text')
+        if timings is not None:
+            timings.append(result)
+        separator = '\n' if result['page'] > 1 else ''
+        yield (separator + text + '\n').encode('utf-8')
+
+
+def format_page_timings(timings):
+    """Human-readable per-page timing table"""
+    lines = [f"{'page':>6}{'extract s':>12}{'transliterate s':>18}"]
+    for timing in timings:
+        lines.append(f"{timing['page']:>6}{timing['extract_seconds']:>12.3f}"
+                     f"{timing['transliterate_seconds']:>18.3f}")
+    extract = sum(timing['extract_seconds'] for timing in timings)
+    transliterate = sum(timing['transliterate_seconds'] for timing in timings)
+    lines.append(f"{'total':>6}{extract:>12.3f}{transliterate:>18.3f}")
+    return '\n'.join(lines)
+
+
+def iter_paragraphs(path, extension):
+    """Paragraph texts of a spooled .txt or .docx document"""
+    if extension == '.docx':
+        return iter_docx_paragraphs(path)
+    if extension == '.txt':
+        return iter_text_paragraphs(path)
+    raise ValueError(f"Unsupported file type {extension!r}")
+
+
+def transliterate_paragraphs(paragraphs, language='hindi', features=None,
+                             block_size=OUTPUT_BLOCK_SIZE):
+    """
+    Transliterate paragraphs into a stream of UTF-8 text blocks
+
+    Each paragraph becomes one output line; blank paragraphs stay blank.
+
+    Args:
+        paragraphs: Iterable of paragraph texts
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+        block_size: Bytes of output collected before a block is yielded
+
+    Yields:
+        UTF-8 encoded blocks of the transliterated text
+    """
+    from .enhanced_transliteration import get_transliterator
+
+    transliterator = get_transliterator(language)
+    block = []
+    size = 0
+    for paragraph in paragraphs:
+        data = (_transliterate_line(transliterator, paragraph, features) + '\n').encode('utf-8')
+        block.append(data)
+        size += len(data)
+        if size >= block_size:
+            yield b''.join(block)
+            block = []
+            size = 0
+    if block:
+        yield b''.join(block)
+
+
+def stream_transliterated_document(path, extension, language='hindi', features=None,
+                                   remove=True, pdf_workers=None):
+    """
+    Transliterate a spooled document as a stream of UTF-8 text blocks
+
+    Args:
+        path: Spooled document (see spool_upload)
+        extension: Document extension (see document_extension)
+        language: 'hindi' or 'marathi'
+        features: Feature flags for EnhancedTransliterator.transliterate
+        remove: Whether to delete path once the stream is finished or closed
+        pdf_workers: Worker processes for PDF pages (see iter_pdf_pages)
+
+    Yields:
+        UTF-8 encoded blocks of the transliterated text
+    """
+    try:
+        if extension == '.pdf':
+            start = time.perf_counter()
+            timings = []
+            yield from stream_transliterated_pdf(path, language, features, pdf_workers, timings)
+            if timings:
+                slowest = max(timings, key=lambda t: t['extract_seconds'] + t['transliterate_seconds'])
+                print(f"Transliterated {len(timings)} PDF pages in {time.perf_counter() - start:.2f}s "
+                      f"(slowest: page {slowest['page']}, "
+                      f"{slowest['extract_seconds'] + slowest['transliterate_seconds']:.2f}s)")
+        else:
+            yield from transliterate_paragraphs(iter_paragraphs(path, extension), language, features)
+    except (ElementTree.ParseError, zipfile.BadZipFile, ValueError) as e:
+        # The response has started, so the error can only end the stream
+        print(f"Error reading {extension} document: {e}")
+    finally:
+        if remove:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Transliterate a .txt, .docx or .pdf document')
+    parser.add_argument('input', help='Input document')
+    parser.add_argument('-o', '--output', help='Output .txt file (default: stdout)')
+    parser.add_argument('-l', '--language', choices=['hindi', 'marathi'], default='hindi')
+    parser.add_argument('-j', '--workers', type=int, help='Worker processes for PDF pages')
+    parser.add_argument('--timings', action='store_true', help='Print per-page PDF timings to stderr')
+    args = parser.parse_args(argv)
+
+    try:
+        extension = document_extension(args.input)
+        check_document(args.input, extension)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    timings = []
+    if extension == '.pdf':
+        blocks = stream_transliterated_pdf(args.input, args.language, workers=args.workers,
+                                           timings=timings)
+    else:
+        blocks = transliterate_paragraphs(iter_paragraphs(args.input, extension), args.language)
+
+    output = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    try:
+        # Engine diagnostics go to stderr so they cannot mix with the output
+        with contextlib.redirect_stdout(sys.stderr):
+            for block in blocks:
+                output.write(block)
+    finally:
+        if args.output:
+            output.close()
+        else:
+            output.flush()
+    if args.timings and timings:
+        print(format_page_timings(timings), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Levenshtein edit distance for evaluating transliterations.
+Uses the bit-parallel algorithm of Myers (as formulated by Hyyrö for edit
+distance), which processes one character of the first string per step with
+a few integer operations instead of filling a full distance matrix.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch scoring falls back to the scalar path
+    np = None
+
+# Pairs scored together per NumPy step in levenshtein_batch
+BATCH_SIZE = 4096
+
+# Expected strings up to this length fit a single uint64 bit vector
+_WORD_BITS = 64
+
+
+def levenshtein(a, b):
+    """
+    Edit distance between two strings (insertions, deletions, substitutions)
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Minimum number of single-character edits turning a into b
+    """
+    n = len(b)
+    if not a or not n:
+        return len(a) or n
+
+    # Bit j of peq[c] is set where b[j] == c
+    peq = {}
+    for j, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << j)
+
+    mask = (1 << n) - 1
+    high_bit = 1 << (n - 1)
+    pv = mask  # vertical +1 deltas of the current column
+    mv = 0     # vertical -1 deltas
+    score = n
+
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
+
+
+def _encode(strings, width, fill):
+    """Code points of each string in a (len(strings), width) array, padded with fill"""
+    codes = np.full((len(strings), width), fill, dtype=np.int32)
+    for row, text in enumerate(strings):
+        if text:
+            codes[row, :len(text)] = np.frombuffer(text.encode('utf-32-le'), dtype=np.int32)
+    return codes
+
+
+def _levenshtein_vector(actuals, expecteds):
+    """Bit-parallel distances for pairs whose second strings have 1 to 64 characters"""
+    count = len(actuals)
+    a_lengths = np.fromiter((len(a) for a in actuals), dtype=np.int64, count=count)
+    b_lengths = np.fromiter((len(b) for b in expecteds), dtype=np.uint64, count=count)
+
+    # Padding values never equal a real character (or each other)
+    a_codes = _encode(actuals, max(int(a_lengths.max()), 1), -1)
+    b_codes = _encode(expecteds, _WORD_BITS, -2)
+
+    one = np.uint64(1)
+    mask = np.where(b_lengths == _WORD_BITS, np.uint64(0xFFFFFFFFFFFFFFFF),
+                    (one << b_lengths) - one)
+    high_shift = b_lengths - one
+    pv = mask.copy()
+    mv = np.zeros(count, dtype=np.uint64)
+    score = b_lengths.astype(np.int64)
+
+    for i in range(a_codes.shape[1]):
+        active = a_lengths > i
+        if not active.any():
+            break
+        # Bit j is set where b[j] equals the i-th character of a
+        eq = np.packbits(a_codes[:, i, None] == b_codes, axis=1, bitorder='little')
+        eq = eq.view('<u8').ravel()
+
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        delta = ((ph >> high_shift) & one).astype(np.int64) - ((mh >> high_shift) & one).astype(np.int64)
+        # Pairs whose first string has ended keep the score at their own length
+        score += np.where(active, delta, 0)
+        ph = ((ph << one) | one) & mask
+        mh = (mh << one) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
+
+
+def levenshtein_batch(actuals, expecteds):
+    """
+    Edit distances for many string pairs at once
+
+    Uses NumPy to run the bit-parallel recurrence for a block of pairs per
+    step when available; results are identical to levenshtein().
+
+    Args:
+        actuals: Sequence of first strings
+        expecteds: Sequence of second strings (same length as actuals)
+
+    Returns:
+        List of edit distances
+    """
+    actuals = list(actuals)
+    expecteds = list(expecteds)
+    if len(actuals) != len(expecteds):
+        raise ValueError("actuals and expecteds must have the same length")
+
+    if np is None:
+        return [levenshtein(a, b) for a, b in zip(actuals, expecteds)]
+
+    distances = [0] * len(actuals)
+    vector_rows = []
+    for row, (a, b) in enumerate(zip(actuals, expecteds)):
+        if a and b and len(b) > _WORD_BITS >= len(a):
+            # The distance is symmetric, so the shorter string can be the bit vector
+            actuals[row], expecteds[row] = b, a
+        elif not a or not b or len(b) > _WORD_BITS:
+            distances[row] = levenshtein(a, b)
+            continue
+        vector_rows.append(row)
+
+    # Group pairs of similar length so short pairs do not step through long padding
+    vector_rows.sort(key=lambda row: len(actuals[row]))
+    for start in range(0, len(vector_rows), BATCH_SIZE):
+        rows = vector_rows[start:start + BATCH_SIZE]
+        scores = _levenshtein_vector([actuals[row] for row in rows],
+                                     [expecteds[row] for row in rows])
+        for row, score in zip(rows, scores.tolist()):
+            distances[row] = score
+
+    return distances
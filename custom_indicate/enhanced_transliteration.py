@@ -3,13 +3,16 @@ Integrated transliteration engine combining all enhanced features.
 This module serves as the main entry point for the enhanced transliteration system.
 """
 
+import os
 import re
-from .transliterate import hindi2english, marathi2english, preprocess_text, postprocess_text
+from .transliterate import preprocess_text, postprocess_text, transliterate_text
 from .context_aware import apply_context_aware_transliteration
-from .schwa_deletion import apply_schwa_rules
+from .schwa_deletion import apply_schwa_rules, apply_schwa_model
+from .schwa_lexicon import load_schwa_lexicon
 from .exception_detection import ExceptionDetector
 from .auto_capitalization import capitalize_text
-from .exceptions import get_exception, get_named_entity, is_schwa_exception
+from .exceptions import get_named_entity, is_schwa_exception
+from .language_pack import load_language_pack
 
 class EnhancedTransliterator:
     """
@@ -30,6 +33,17 @@ class EnhancedTransliterator:
         self.enable_auto_exceptions = True
         self.enable_phonetic_refinement = False  # Phonetic refinement disabled
         self.enable_auto_capitalization = True
+        # Opt-in: statistical syllable model instead of the regex schwa heuristics
+        self.enable_schwa_model = False
+        
+        # Compiled language data, shared by all engines of the language
+        pack = load_language_pack(language)
+        self.char_map = pack['char_map']
+        self.builtin_exceptions = pack['exceptions']
+        
+        # Precomputed schwa results for common words (None when not built)
+        self.schwa_lexicon = load_schwa_lexicon(language, 'rules')
+        self.schwa_model_lexicon = load_schwa_lexicon(language, 'model')
     
     def transliterate(self, text, enable_features=None):
         """
@@ -41,13 +55,35 @@ class EnhancedTransliterator:
                             {'context_aware': True/False, 
                              'statistical_schwa': True/False,
                              'auto_exceptions': True/False,
-                             'phonetic_refinement': True/False}
+                             'phonetic_refinement': True/False,
+                             'schwa_model': True/False}
         
         Returns:
             Transliterated text with all enhancements applied
         """
         if not text:
             return ""
+        return self.transliterate_preprocessed(preprocess_text(text), enable_features)
+    
+    def transliterate_preprocessed(self, text, enable_features=None, is_title=None,
+                                   capitalize_start=True):
+        """
+        Transliterate text that has already been through preprocess_text
+        
+        Used directly to transliterate a document in sentence shards (see
+        sharding.py), where the document-level decisions are made for the
+        whole document rather than for each shard.
+        
+        Args:
+            text: Preprocessed text in Hindi/Marathi
+            enable_features: Dict of feature flags to override defaults
+            is_title: Whether to capitalize the text as a title (default:
+                      short text without sentence punctuation)
+            capitalize_start: Whether to capitalize the first letter
+        
+        Returns:
+            Transliterated text
+        """
         # Set feature flags
         if enable_features is not None:
             context_aware = enable_features.get('context_aware', self.enable_context_aware)
@@ -55,24 +91,25 @@ class EnhancedTransliterator:
             auto_exceptions = enable_features.get('auto_exceptions', self.enable_auto_exceptions)
             phonetic_refinement = enable_features.get('phonetic_refinement', self.enable_phonetic_refinement)
             auto_capitalization = enable_features.get('auto_capitalization', self.enable_auto_capitalization)
+            schwa_model = enable_features.get('schwa_model', self.enable_schwa_model)
         else:
             context_aware = self.enable_context_aware
             statistical_schwa = self.enable_statistical_schwa
             auto_exceptions = self.enable_auto_exceptions
             phonetic_refinement = self.enable_phonetic_refinement
             auto_capitalization = self.enable_auto_capitalization
-        
-        # Preprocess input text
-        text = preprocess_text(text)
+            schwa_model = self.enable_schwa_model
         
         # Split into words for word-level processing
         words = text.split()
         transliterated_words = []
+        # (output index, word) pairs left for the batched schwa model
+        model_words = []
         
         # Process each word
         for word in words:
             # Step 1: Check for known exceptions first
-            exception = get_exception(word, self.language) if auto_exceptions else None
+            exception = self.get_exception(word) if auto_exceptions else None
             
             if exception:
                 transliterated_words.append(exception)
@@ -92,11 +129,23 @@ class EnhancedTransliterator:
                 transliterated_words.append(auto_exception)
                 continue
             
+            # Steps 4-5 for common words: precomputed by the schwa lexicon
+            lexicon = self.schwa_model_lexicon if schwa_model else (
+                self.schwa_lexicon if statistical_schwa else None)
+            precomputed = lexicon.get(word) if lexicon is not None else None
+            
+            if precomputed is not None:
+                transliterated_words.append(precomputed)
+                continue
+            
+            # Steps 4-5 (model mode): score the whole document in one batch below
+            if schwa_model:
+                model_words.append((len(transliterated_words), word))
+                transliterated_words.append(None)
+                continue
+            
             # Step 4: Basic transliteration
-            if self.language == 'hindi':
-                transliterated = hindi2english(word)
-            else:  # marathi
-                transliterated = marathi2english(word)
+            transliterated = transliterate_text(word, self.char_map)
             # Step 5: Apply statistical schwa deletion if enabled
             if statistical_schwa:
                 transliterated = apply_schwa_rules(transliterated, word)
@@ -104,6 +153,11 @@ class EnhancedTransliterator:
             # Phonetic refinement step removed
             
             transliterated_words.append(transliterated)
+        
+        if model_words:
+            modelled = apply_schwa_model([word for _, word in model_words], self.char_map)
+            for (index, _), transliterated in zip(model_words, modelled):
+                transliterated_words[index] = transliterated
         # Join words back into text
         transliterated_text = ' '.join(transliterated_words)
         
@@ -115,11 +169,12 @@ class EnhancedTransliterator:
         transliterated_text = postprocess_text(transliterated_text)          # Apply auto-capitalization if enabled
         if auto_capitalization:
             # Detect if this might be a title (short text, no sentence endings)
-            is_title = len(transliterated_text) < 100 and not any(char in transliterated_text for char in '.!?')
+            if is_title is None:
+                is_title = len(transliterated_text) < 100 and not any(char in transliterated_text for char in '.!?')
             transliterated_text = capitalize_text(transliterated_text, self.language, is_title)
         
         # Always ensure the first letter is capitalized, even when auto-capitalization is disabled
-        if transliterated_text and len(transliterated_text) > 0:
+        if capitalize_start and transliterated_text and len(transliterated_text) > 0:
             # Find the first letter (skipping any leading spaces or punctuation)
             match = re.search(r'[a-z]', transliterated_text, re.IGNORECASE)
             if match:
@@ -128,6 +183,10 @@ class EnhancedTransliterator:
         
         return transliterated_text
     
+    def get_exception(self, word):
+        """Built-in exception for a word from the language pack, if any"""
+        return self.builtin_exceptions.get(word)
+    
     def learn_from_correction(self, original_text, auto_transliteration, corrected_transliteration):
         """
         Learn from manual corrections to improve future transliterations
@@ -164,6 +223,26 @@ class EnhancedTransliterator:
             if auto_capitalization is not None:
                 self.enable_auto_capitalization = auto_capitalization
 
+_transliterators = {}
+
+def get_transliterator(language='hindi'):
+    """
+    Get the shared transliterator for a language
+    
+    The engine is built once per language (and working directory, which
+    locates its learned exceptions) and reused across calls. Its learned
+    exceptions are reloaded when the exceptions file changes, e.g. after
+    feedback was learned by another detector.
+    """
+    key = (language, os.getcwd())
+    transliterator = _transliterators.get(key)
+    if transliterator is None:
+        transliterator = EnhancedTransliterator(language)
+        _transliterators[key] = transliterator
+    else:
+        transliterator.exception_detector.reload_if_changed()
+    return transliterator
+
 # Convenience functions
 
 def enhanced_hindi2english(text, features=None):
@@ -177,7 +256,7 @@ def enhanced_hindi2english(text, features=None):
     Returns:
         Enhanced transliteration
     """
-    transliterator = EnhancedTransliterator('hindi')
+    transliterator = get_transliterator('hindi')
     return transliterator.transliterate(text, features)
 
 def enhanced_marathi2english(text, features=None):
@@ -191,5 +270,5 @@ def enhanced_marathi2english(text, features=None):
     Returns:
         Enhanced transliteration
     """
-    transliterator = EnhancedTransliterator('marathi')
+    transliterator = get_transliterator('marathi')
     return transliterator.transliterate(text, features)
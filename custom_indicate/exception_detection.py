@@ -28,6 +28,7 @@ class ExceptionDetector:
         self.language = language
         self.exception_file = exception_file or f"{language}_exceptions.json"
         self.exceptions = {}
+        self._file_state = None
         self.load_exceptions()
         
         # Track word frequency for confidence scoring
@@ -43,8 +44,16 @@ class ExceptionDetector:
             'unusual_cluster': r'[bcdfghjklmnpqrstvwxyz]{3,}',    # 3+ consonants in a row
         }
     
+    def _stat_file(self):
+        try:
+            stat = os.stat(self.exception_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
     def load_exceptions(self):
         """Load exceptions from file if it exists"""
+        self._file_state = self._stat_file()
         if os.path.exists(self.exception_file):
             try:
                 with open(self.exception_file, 'r', encoding='utf-8') as f:
@@ -53,11 +62,25 @@ class ExceptionDetector:
                 print(f"Error loading exceptions: {e}")
                 self.exceptions = {}
     
+    def reload_if_changed(self):
+        """
+        Reload exceptions if the file was changed since it was last loaded
+        (e.g. by another detector learning from feedback)
+        
+        Returns:
+            True if the exceptions were reloaded
+        """
+        if self._stat_file() == self._file_state:
+            return False
+        self.load_exceptions()
+        return True
+    
     def save_exceptions(self):
         """Save exceptions to file"""
         try:
             with open(self.exception_file, 'w', encoding='utf-8') as f:
                 json.dump(self.exceptions, f, ensure_ascii=False, indent=2)
+            self._file_state = self._stat_file()
         except IOError as e:
             print(f"Error saving exceptions: {e}")
     
@@ -62,6 +62,9 @@ SCHWA_EXCEPTIONS = [
     'राम', 'श्याम', 'कृष्ण', 'विष्णु', 'महेश', 'सूरज', 'चंद्र', 'सोम'
 ]
 
+# Set form of SCHWA_EXCEPTIONS for constant-time lookups
+SCHWA_EXCEPTION_SET = frozenset(SCHWA_EXCEPTIONS)
+
 # Named entities that need proper capitalization
 NAMED_ENTITIES = {
     'भारत': 'Bharat',       # India
@@ -87,4 +90,4 @@ def get_named_entity(word):
 
 def is_schwa_exception(word):
     """Check if a word has special schwa deletion rules"""
-    return word in SCHWA_EXCEPTIONS
+    return word in SCHWA_EXCEPTION_SET
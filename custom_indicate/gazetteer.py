@@ -0,0 +1,177 @@
+"""
+Proper-noun gazetteer for auto-capitalization.
+Holds known person/place names and place-name suffixes loaded from a data file,
+with per-token lookups that cost O(token length) regardless of list size.
+"""
+
+import json
+import os
+import sys
+
+from .mapped_table import MappedTable, write_table
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+DEFAULT_GAZETTEER_FILE = os.path.join(DATA_DIR, 'proper_nouns.json')
+
+# Name lists at least this long are compiled to a binary table next to the
+# source file and memory-mapped, so worker processes share a single copy
+MMAP_THRESHOLD = 5000
+
+
+class Gazetteer:
+    """
+    Lookup structure for proper nouns.
+    Exact names live in a frozenset (small lists) or a memory-mapped hash table
+    (large lists); place suffixes live in a reversed-character trie.
+    """
+
+    def __init__(self, names=(), place_suffixes=(), table=None):
+        """
+        Initialize the gazetteer
+
+        Args:
+            names: Iterable of lowercase names (ignored when table is given)
+            place_suffixes: Iterable of place-name suffixes such as 'pur'
+            table: Optional MappedTable holding the names
+        """
+        self._table = table
+        self._names = frozenset() if table is not None else frozenset(n.lower() for n in names)
+        self.place_suffixes = tuple(s.lower() for s in place_suffixes)
+
+        # Reversed trie: walking a token from its last character finds every
+        # suffix it ends with in a single pass. '' marks the end of a suffix.
+        self._suffix_trie = {}
+        for suffix in self.place_suffixes:
+            node = self._suffix_trie
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[''] = True
+
+    @classmethod
+    def from_compiled(cls, path):
+        """Memory-map a gazetteer written by compile_gazetteer()"""
+        table = MappedTable(path)
+        return cls(place_suffixes=table.meta.get('place_suffixes', []), table=table)
+
+    def __len__(self):
+        return len(self._table) if self._table is not None else len(self._names)
+
+    def is_name(self, token):
+        """Check if a token is a known name (case-insensitive)"""
+        token = token.lower()
+        if self._table is not None:
+            return token in self._table
+        return token in self._names
+
+    def has_place_suffix(self, token):
+        """
+        Check if a token is a place name built from a known suffix,
+        e.g. 'jaipur' or 'ahmednagar'. The token must be purely alphabetic
+        and longer than the suffix.
+        """
+        if not (token.isascii() and token.isalpha()):
+            return False
+
+        token = token.lower()
+        node = self._suffix_trie
+        # A match must leave at least one character in front of the suffix
+        for i in range(len(token) - 1, 0, -1):
+            node = node.get(token[i])
+            if node is None:
+                return False
+            if '' in node:
+                return True
+        return False
+
+    def is_proper_noun(self, token):
+        """Check if a token should be capitalized as a proper noun"""
+        return self.is_name(token) or self.has_place_suffix(token)
+
+
+def compile_gazetteer(names, place_suffixes, path):
+    """
+    Compile a name list into a memory-mappable gazetteer file
+
+    Args:
+        names: Iterable of names
+        place_suffixes: Iterable of place-name suffixes
+        path: Output file path
+
+    Returns:
+        Number of names written
+    """
+    return write_table(
+        path,
+        ((name.lower(), '') for name in names),
+        meta={'place_suffixes': list(place_suffixes)}
+    )
+
+
+def _compiled_path(source_path):
+    return os.path.splitext(source_path)[0] + '.gaz'
+
+
+def load_gazetteer(path=DEFAULT_GAZETTEER_FILE):
+    """
+    Load a gazetteer from a JSON data file
+
+    The file holds {"names": [...], "place_suffixes": [...]}. A compiled table
+    next to the source file is used when it is newer than the source and
+    readable (a truncated or corrupt table falls back to the source list);
+    large name lists are compiled automatically on first load.
+
+    Args:
+        path: Path to the JSON data file
+
+    Returns:
+        Gazetteer instance
+    """
+    compiled_path = _compiled_path(path)
+    try:
+        if os.path.getmtime(compiled_path) >= os.path.getmtime(path):
+            return Gazetteer.from_compiled(compiled_path)
+    except OSError:
+        pass
+    except ValueError as e:
+        # A truncated or corrupt table is rebuilt from the source list below
+        print(f"Error loading compiled gazetteer, using the source list: {e}")
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error loading gazetteer: {e}")
+        return Gazetteer()
+
+    names = data.get('names', [])
+    place_suffixes = data.get('place_suffixes', [])
+
+    if len(names) >= MMAP_THRESHOLD:
+        try:
+            compile_gazetteer(names, place_suffixes, compiled_path)
+            return Gazetteer.from_compiled(compiled_path)
+        except (OSError, ValueError) as e:
+            print(f"Error compiling gazetteer, keeping it in memory: {e}")
+
+    return Gazetteer(names, place_suffixes)
+
+
+_default_gazetteer = None
+
+def get_gazetteer():
+    """Get the shared gazetteer loaded from the default data file"""
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        _default_gazetteer = load_gazetteer()
+    return _default_gazetteer
+
+
+if __name__ == '__main__':
+    # Usage: python -m custom_indicate.gazetteer [names.json]
+    source = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_GAZETTEER_FILE
+    with open(source, 'r', encoding='utf-8') as f:
+        source_data = json.load(f)
+    count = compile_gazetteer(source_data.get('names', []),
+                              source_data.get('place_suffixes', []),
+                              _compiled_path(source))
+    print(f"Compiled {count} names to {_compiled_path(source)}")
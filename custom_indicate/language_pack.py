@@ -0,0 +1,178 @@
+"""
+Compiled language packs.
+Each language's lookup data (character map and built-in word exceptions) is
+compiled from char_maps.py and exceptions.py into one versioned binary file,
+validated with a checksum and loaded with a single read. The engine and the
+basic converters take this data only from the pack: a pack that is missing,
+stale or corrupt is rebuilt from the source modules and written back, so the
+sources are only imported when they change.
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+import tempfile
+import time
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+# File layout (little-endian):
+#   header  - magic, format version, reserved, source fingerprint (sha256),
+#             payload checksum (sha256), payload length
+#   payload - marshal-serialized dict of the pack's data
+PACK_MAGIC = b'ICLP'
+PACK_VERSION = 2
+
+_HEADER = struct.Struct('<4sHH32s32sQ')
+
+# Modules the packs are compiled from
+_SOURCE_FILES = ['char_maps.py', 'exceptions.py']
+
+LANGUAGES = ['hindi', 'marathi']
+
+
+def default_pack_path(language='hindi'):
+    """Default location of a language's compiled pack"""
+    return os.path.join(DATA_DIR, f'{language}.pack')
+
+
+def source_fingerprint(language='hindi'):
+    """
+    Fingerprint of the sources and formats a pack is compiled from
+
+    Like Python's .pyc check, it uses the size and modification time of the
+    source modules, so checking a pack does not read (or import) them.
+    """
+    digest = hashlib.sha256(f'{language}:{PACK_VERSION}:{marshal.version}'.encode('utf-8'))
+    package_dir = os.path.dirname(__file__)
+    for name in _SOURCE_FILES:
+        stat = os.stat(os.path.join(package_dir, name))
+        digest.update(f'{name}:{stat.st_size}:{stat.st_mtime_ns}\0'.encode('utf-8'))
+    return digest.digest()
+
+
+def build_pack_data(language='hindi'):
+    """
+    Assemble a language's pack data from the source modules
+
+    Returns:
+        Dict with 'language', 'char_map' and 'exceptions' (built-in word
+        exceptions of the language)
+    """
+    from .char_maps import HINDI_CHARS, MARATHI_CHARS
+    from .exceptions import HINDI_EXCEPTIONS, MARATHI_EXCEPTIONS
+
+    return {
+        'language': language,
+        'char_map': dict(HINDI_CHARS if language == 'hindi' else MARATHI_CHARS),
+        'exceptions': dict(HINDI_EXCEPTIONS if language == 'hindi' else MARATHI_EXCEPTIONS),
+    }
+
+
+def compile_language_pack(language='hindi', path=None, data=None):
+    """
+    Compile a language pack file
+
+    Args:
+        language: 'hindi' or 'marathi'
+        path: Output path (defaults to the language's pack in the data directory)
+        data: Pack data as returned by build_pack_data (built if not given)
+
+    Returns:
+        Size of the written file in bytes
+    """
+    path = path or default_pack_path(language)
+    # Fingerprint first: sources edited while building make the pack stale, not wrong
+    fingerprint = source_fingerprint(language)
+    payload = marshal.dumps(data if data is not None else build_pack_data(language))
+    header = _HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, fingerprint,
+                          hashlib.sha256(payload).digest(), len(payload))
+
+    # Write to a temporary file first so readers never load a half-written pack
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path), dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(header) + len(payload)
+
+
+def read_language_pack(path, language='hindi'):
+    """
+    Read and validate a pack file
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a pack, is corrupt or is stale
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Truncated language pack: {path}")
+    magic, version, _, fingerprint, checksum, length = _HEADER.unpack_from(data, 0)
+    if magic != PACK_MAGIC or version != PACK_VERSION:
+        raise ValueError(f"Not a language pack (or an older format): {path}")
+    if fingerprint != source_fingerprint(language):
+        raise ValueError(f"Language pack is stale: {path}")
+
+    payload = memoryview(data)[_HEADER.size:]
+    if len(payload) != length or hashlib.sha256(payload).digest() != checksum:
+        raise ValueError(f"Language pack checksum mismatch: {path}")
+    pack = marshal.loads(payload)
+    if not isinstance(pack, dict) or pack.get('language') != language:
+        raise ValueError(f"Language pack is for another language: {path}")
+    return pack
+
+
+_packs = {}
+
+def load_language_pack(language='hindi', path=None):
+    """
+    Get the shared pack data for a language
+
+    A pack file that is missing, stale or corrupt is rebuilt from the source
+    modules and written back; if it cannot be written (read-only install),
+    the data built from source is used for the life of the process.
+    """
+    path = path or default_pack_path(language)
+    pack = _packs.get(path)
+    if pack is not None:
+        return pack
+
+    try:
+        pack = read_language_pack(path, language)
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"Error loading language pack, rebuilding from source: {e}")
+        pack = build_pack_data(language)
+        try:
+            compile_language_pack(language, path, pack)
+        except OSError:
+            pass
+
+    _packs[path] = pack
+    return pack
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compile language packs')
+    parser.add_argument('--language', choices=LANGUAGES + ['all'], default='all')
+    parser.add_argument('--output', help='Output path (single language only)')
+    args = parser.parse_args()
+
+    languages = LANGUAGES if args.language == 'all' else [args.language]
+    for language in languages:
+        path = args.output if args.output and len(languages) == 1 else default_pack_path(language)
+        size = compile_language_pack(language, path)
+        start = time.perf_counter()
+        read_language_pack(path, language)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Compiled {language} pack to {path} ({size} bytes, loads in {elapsed:.2f} ms)")
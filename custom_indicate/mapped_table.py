@@ -0,0 +1,173 @@
+"""
+Memory-mapped string lookup tables.
+Compiles a set of string keys (with optional string values) into a compact
+open-addressing hash table on disk that can be memory-mapped and shared
+between worker processes through the OS page cache.
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+
+# File layout (little-endian):
+#   header  - magic, format version, entry count, slot count, metadata length,
+#             records length
+#   meta    - UTF-8 JSON object with free-form metadata
+#   slots   - one uint32 per slot: offset of the record + 1 (0 marks an empty slot)
+#   records - key length (uint16), value length (uint16), key bytes, value bytes
+TABLE_MAGIC = b'ICMT'
+TABLE_VERSION = 2
+
+_HEADER = struct.Struct('<4sHHIIII')
+_SLOT = struct.Struct('<I')
+_RECORD = struct.Struct('<HH')
+
+
+def _slot_count(count):
+    """Smallest power of two that keeps the load factor at or below 0.5"""
+    slots = 8
+    while slots < count * 2:
+        slots <<= 1
+    return slots
+
+
+def write_table(path, items, meta=None):
+    """
+    Compile key/value pairs into a memory-mappable table file
+
+    Args:
+        path: Output file path
+        items: Iterable of (key, value) string pairs; use '' for key-only tables
+        meta: Optional dict stored alongside the table (must be JSON-serializable)
+
+    Returns:
+        Number of entries written
+    """
+    records = bytearray()
+    offsets = {}
+
+    for key, value in items:
+        key_bytes = key.encode('utf-8')
+        value_bytes = (value or '').encode('utf-8')
+        if len(key_bytes) > 0xFFFF or len(value_bytes) > 0xFFFF:
+            continue
+        if key_bytes in offsets:
+            continue
+        offsets[key_bytes] = len(records)
+        records += _RECORD.pack(len(key_bytes), len(value_bytes))
+        records += key_bytes
+        records += value_bytes
+
+    n_slots = _slot_count(len(offsets))
+    mask = n_slots - 1
+    slots = [0] * n_slots
+    for key_bytes, offset in offsets.items():
+        slot = zlib.crc32(key_bytes) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = offset + 1
+
+    meta_bytes = json.dumps(meta or {}, ensure_ascii=False).encode('utf-8')
+
+    # Write to a temporary file first so readers never map a half-written table
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, 0, len(offsets), n_slots,
+                             len(meta_bytes), len(records)))
+        f.write(meta_bytes)
+        f.write(struct.pack(f'<{n_slots}I', *slots))
+        f.write(records)
+    os.replace(tmp_path, path)
+
+    return len(offsets)
+
+
+class MappedTable:
+    """
+    Read-only view of a table written by write_table().
+    Lookups hash the key once and compare bytes in place, so the cost of a
+    lookup depends on the key length and not on the number of entries.
+    """
+
+    def __init__(self, path):
+        """
+        Memory-map a compiled table
+
+        Args:
+            path: Path of the table file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a table (or an older format), or is
+                truncated or corrupt
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"Truncated lookup table: {path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+        try:
+            magic, version, _, count, n_slots, meta_len, records_len = _HEADER.unpack_from(self._mm, 0)
+            if magic != TABLE_MAGIC or version != TABLE_VERSION:
+                raise ValueError(f"Not a compiled lookup table (or an older format): {path}")
+            meta_at = _HEADER.size
+            slots_at = meta_at + meta_len
+            records_at = slots_at + n_slots * _SLOT.size
+            if records_at + records_len != len(self._mm):
+                raise ValueError(f"Truncated or corrupt lookup table: {path}")
+            if n_slots & (n_slots - 1) or not n_slots:
+                raise ValueError(f"Corrupt lookup table (slot count {n_slots}): {path}")
+            self.meta = json.loads(str(self._view[meta_at:slots_at], 'utf-8'))
+        except struct.error as e:
+            self.close()
+            raise ValueError(f"Corrupt lookup table: {path}: {e}")
+        except ValueError:
+            self.close()
+            raise
+
+        self.count = count
+        self._mask = n_slots - 1
+        self._slots_at = slots_at
+        self._records_at = records_at
+
+    def _find(self, key):
+        """Return the (start, end) of the value for a key, or None"""
+        key_bytes = key.encode('utf-8')
+        key_len = len(key_bytes)
+        mm = self._mm
+        view = self._view
+        mask = self._mask
+        slot = zlib.crc32(key_bytes) & mask
+
+        while True:
+            ref = _SLOT.unpack_from(mm, self._slots_at + slot * 4)[0]
+            if not ref:
+                return None
+            pos = self._records_at + ref - 1
+            stored_key_len, value_len = _RECORD.unpack_from(mm, pos)
+            pos += 4
+            if stored_key_len == key_len and view[pos:pos + key_len] == key_bytes:
+                return pos + key_len, pos + key_len + value_len
+            slot = (slot + 1) & mask
+
+    def get(self, key, default=None):
+        """Get the value stored for a key"""
+        span = self._find(key)
+        if span is None:
+            return default
+        return str(self._view[span[0]:span[1]], 'utf-8')
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        """Release the memory map"""
+        self._view.release()
+        self._mm.close()
@@ -0,0 +1,141 @@
+"""
+Process-pool helpers shared by the batch tools.
+Keeps a bounded number of tasks in flight so large inputs can be streamed
+through worker processes without queueing everything in memory.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+def default_workers():
+    """Number of worker processes to use when none is given (CPUs available to this process)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def imap_bounded(func, iterable, workers=None, initializer=None, initargs=(),
+                 max_in_flight=None, ordered=True, mp_context=None, executor=None):
+    """
+    Map a function over an iterable in worker processes
+
+    At most max_in_flight items are submitted but not yet yielded, so the
+    iterable is consumed lazily and memory stays bounded.
+
+    Args:
+        func: Picklable function applied to each item
+        iterable: Items to process (consumed lazily)
+        workers: Number of worker processes (default: CPU count)
+        initializer: Optional function run once in each worker
+        initargs: Arguments for the initializer
+        max_in_flight: Maximum pending items (default: twice the workers)
+        ordered: Yield results in input order (otherwise as they complete)
+        mp_context: Optional multiprocessing context
+        executor: Optional existing pool to submit to instead of starting one
+            (it is left running; workers, initializer, initargs and
+            mp_context are then ignored)
+
+    Yields:
+        func(item) for each item
+    """
+    workers = workers or default_workers()
+    max_in_flight = max(max_in_flight or workers * 2, 1)
+
+    if executor is not None:
+        yield from _map_bounded(executor, func, iterable, max_in_flight, ordered)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                             initargs=initargs, mp_context=mp_context) as executor:
+        yield from _map_bounded(executor, func, iterable, max_in_flight, ordered)
+
+
+def _map_bounded(executor, func, iterable, max_in_flight, ordered):
+    pending = deque() if ordered else set()
+    try:
+        if ordered:
+            for item in iterable:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        else:
+            for item in iterable:
+                pending.add(executor.submit(func, item))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                yield pending.pop().result()
+    finally:
+        # A consumer that stops early leaves nothing queued in a shared pool
+        for future in pending:
+            future.cancel()
+
+
+# Pools kept for the life of the process, by key. Their workers are spawned
+# rather than forked: pools are started lazily from web server request
+# threads, and forking a multithreaded process copies locks held by other
+# threads into the children.
+_shared_pools = {}
+_shared_pools_lock = threading.Lock()
+
+def shared_pool(key, workers, initializer=None, initargs=()):
+    """
+    Process pool shared by all callers using the same key
+
+    The pool is created on first use and kept until shutdown_shared_pools
+    (run at exit) or discard_shared_pool.
+
+    Args:
+        key: Hashable identifying the pool (include the worker count)
+        workers: Number of worker processes
+        initializer: Optional function run once in each worker
+        initargs: Arguments for the initializer
+
+    Returns:
+        ProcessPoolExecutor
+    """
+    with _shared_pools_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs,
+                                       mp_context=multiprocessing.get_context('spawn'))
+            _shared_pools[key] = pool
+        return pool
+
+
+def discard_shared_pool(key, pool):
+    """Shut down a shared pool (e.g. a broken one) so the next caller gets a new one"""
+    with _shared_pools_lock:
+        if _shared_pools.get(key) is pool:
+            del _shared_pools[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def shutdown_shared_pools():
+    """Shut down all shared pools"""
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.shutdown(cancel_futures=True)
+
+
+def chunked(iterable, size):
+    """Group an iterable into lists of at most size items"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -6,8 +6,130 @@ This module refines phonetic rules for more accurate transliteration.
 import re
 import json
 import os.path
+import time
 from collections import defaultdict
 
+from .parallel import chunked, default_workers, imap_bounded
+
+# Characters with a special meaning in regex patterns
+_REGEX_METACHARACTERS = set('.^$*+?{}[]|()')
+
+
+def _literal_text(pattern):
+    """
+    Return the text a pattern matches if it is a plain literal
+    (letters, or re.escape()d punctuation), otherwise None
+    """
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            # Escapes like \d or \1 have a special meaning; escaped punctuation does not
+            if char.isalnum() or char == '_':
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in _REGEX_METACHARACTERS:
+            return None
+        else:
+            chars.append(char)
+    if escaped or not chars:
+        return None
+    return ''.join(chars)
+
+
+def _overlaps(first, second):
+    """Check if an occurrence of one string can share characters with an occurrence of the other"""
+    if first in second or second in first:
+        return True
+    for size in range(1, min(len(first), len(second))):
+        if first[-size:] == second[:size] or second[-size:] == first[:size]:
+            return True
+    return False
+
+
+class _CompiledRule:
+    """A single precompiled rule"""
+    
+    def __init__(self, rule_id, pattern, replacement):
+        self.rule_id = rule_id
+        self.regex = re.compile(pattern)
+        self.replacement = replacement
+    
+    def apply(self, text, rule_stats):
+        result = self.regex.sub(self.replacement, text)
+        if result != text:
+            rule_stats[self.rule_id] += 1
+        return result
+
+
+class _LiteralRuleGroup:
+    """
+    Consecutive literal rules applied in one alternation pass.
+    Only built for rules whose patterns never overlap and whose replacements
+    share no characters with any pattern in the group, so one pass gives the
+    same result as applying the rules one after another.
+    """
+    
+    def __init__(self):
+        self.rules = {}        # literal text -> (rule_id, pattern, replacement)
+        self.pattern_chars = set()
+        self.replacement_chars = set()
+        self.regex = None
+    
+    def accepts(self, literal, replacement):
+        """Check if a literal rule can join the group without changing results"""
+        if not replacement or literal in self.rules:
+            return False
+        pattern_chars = self.pattern_chars | set(literal)
+        if pattern_chars & (self.replacement_chars | set(replacement)):
+            return False
+        return not any(_overlaps(literal, other) for other in self.rules)
+    
+    def add(self, rule_id, pattern, literal, replacement):
+        self.rules[literal] = (rule_id, pattern, replacement)
+        self.pattern_chars.update(literal)
+        self.replacement_chars.update(replacement)
+    
+    def compile(self):
+        """Build the alternation (a lone rule is cheaper as a plain compiled rule)"""
+        if len(self.rules) == 1:
+            return _CompiledRule(*next(iter(self.rules.values())))
+        self.regex = re.compile('|'.join(re.escape(literal) for literal in self.rules))
+        return self
+    
+    def apply(self, text, rule_stats):
+        rules = self.rules
+        fired = set()
+        
+        def replace(match):
+            rule_id, _, replacement = rules[match.group(0)]
+            fired.add(rule_id)
+            return replacement
+        
+        result = self.regex.sub(replace, text)
+        for rule_id in fired:
+            rule_stats[rule_id] += 1
+        return result
+
+
+class _RuleWeights(defaultdict):
+    """Rule weights that count modifications, so compiled rules know when to rebuild"""
+    
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
 class PhoneticRuleRefiner:
     """
     Class to refine phonetic rules for Hindi/Marathi transliteration.
@@ -61,7 +183,12 @@ class PhoneticRuleRefiner:
         self.refined_rules = self.load_rules() or self.default_rules.copy()
         
         # Rule weights (for determining which rules take precedence)
-        self.rule_weights = defaultdict(float)
+        self.rule_weights = _RuleWeights(float)
+        
+        # Precompiled, pre-sorted rules; rebuilt when rules or weights change
+        self._rules_version = 0
+        self._compiled_rules = None
+        self._compiled_key = None
         
         # Rule application statistics (track how often each rule is used)
         self.rule_stats = defaultdict(int)
@@ -77,8 +204,10 @@ class PhoneticRuleRefiner:
     
     def load_rules(self):
         """Load refined rules from file if it exists"""
+        self._file_mtime = None
         if os.path.exists(self.rules_file):
             try:
+                self._file_mtime = os.path.getmtime(self.rules_file)
                 with open(self.rules_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except (json.JSONDecodeError, IOError) as e:
@@ -91,10 +220,11 @@ class PhoneticRuleRefiner:
         try:
             with open(self.rules_file, 'w', encoding='utf-8') as f:
                 json.dump(self.refined_rules, f, ensure_ascii=False, indent=2)
+            self._file_mtime = os.path.getmtime(self.rules_file)
         except IOError as e:
             print(f"Error saving refined rules: {e}")
     
-    def add_rule(self, category, pattern, replacement, context=None, weight=1.0):
+    def add_rule(self, category, pattern, replacement, context=None, weight=1.0, save=True):
         """
         Add or update a phonetic rule
         
@@ -104,6 +234,8 @@ class PhoneticRuleRefiner:
             replacement: Replacement text
             context: Optional phonetic context for contextual rules
             weight: Rule weight (higher takes precedence)
+            save: Whether to write the rules file now (pass False when
+                adding many rules and call save_rules() once afterwards)
         """
         # Create context-specific pattern if context is provided
         if context and context in self.phonetic_contexts:
@@ -121,14 +253,17 @@ class PhoneticRuleRefiner:
                 # Update existing rule
                 self.refined_rules[category][i] = rule
                 self.rule_weights[(category, pattern)] = weight
+                self.invalidate_compiled_rules()
                 return
         
         # Add new rule
         self.refined_rules[category].append(rule)
         self.rule_weights[(category, pattern)] = weight
+        self.invalidate_compiled_rules()
         
         # Save updated rules
-        self.save_rules()
+        if save:
+            self.save_rules()
     
     def remove_rule(self, category, pattern):
         """Remove a phonetic rule"""
@@ -138,12 +273,70 @@ class PhoneticRuleRefiner:
             
             # If a rule was removed, save changes
             if len(self.refined_rules[category]) < original_len:
+                self.invalidate_compiled_rules()
                 if (category, pattern) in self.rule_weights:
                     del self.rule_weights[(category, pattern)]
                 self.save_rules()
                 return True
         return False
     
+    def invalidate_compiled_rules(self):
+        """Mark compiled rules as stale (call after editing refined_rules directly)"""
+        self._rules_version += 1
+    
+    def compile_rules(self):
+        """
+        Get the rules of every category compiled and sorted by weight
+        
+        The result is cached until rules or weights change. Runs of literal
+        rules are merged into a single alternation pass where that cannot
+        change the result.
+        
+        Returns:
+            Dict of category -> list of compiled rule steps
+        """
+        key = (self._rules_version, self.rule_weights.version)
+        if self._compiled_rules is not None and self._compiled_key == key:
+            return self._compiled_rules
+        
+        compiled = {}
+        for category, rules in self.refined_rules.items():
+            steps = []
+            group = None
+            for pattern, replacement in sorted(
+                rules,
+                key=lambda x: self.rule_weights.get((category, x[0]), 0.0),
+                reverse=True
+            ):
+                rule_id = (category, pattern)
+                literal = _literal_text(pattern)
+                is_literal = literal is not None and '\\' not in replacement
+                
+                # A literal rule that replaces text with itself never changes anything
+                if is_literal and literal == replacement:
+                    continue
+                
+                if is_literal:
+                    if group is not None and group.accepts(literal, replacement):
+                        group.add(rule_id, pattern, literal, replacement)
+                        continue
+                    candidate = _LiteralRuleGroup()
+                    if candidate.accepts(literal, replacement):
+                        candidate.add(rule_id, pattern, literal, replacement)
+                        group = candidate
+                        steps.append(group)
+                        continue
+                
+                group = None
+                steps.append(_CompiledRule(rule_id, pattern, replacement))
+            
+            compiled[category] = [step.compile() if isinstance(step, _LiteralRuleGroup) else step
+                                  for step in steps]
+        
+        self._compiled_rules = compiled
+        self._compiled_key = key
+        return compiled
+    
     def apply_rules(self, text, categories=None):
         """
         Apply refined phonetic rules to text
@@ -156,26 +349,16 @@ class PhoneticRuleRefiner:
             Processed text with phonetic rules applied
         """
         result = text
+        compiled = self.compile_rules()
         
         # Get categories to apply
         if categories is None:
             categories = self.refined_rules.keys()
         
-        # Apply rules from each category
+        # Apply rules from each category, tracking usage in rule_stats
         for category in categories:
-            if category in self.refined_rules:
-                for pattern, replacement in sorted(
-                    self.refined_rules[category],
-                    key=lambda x: self.rule_weights.get((category, x[0]), 0.0),
-                    reverse=True
-                ):
-                    # Apply the rule and track usage
-                    prev_result = result
-                    result = re.sub(pattern, replacement, result)
-                    
-                    # Update statistics if rule was applied
-                    if prev_result != result:
-                        self.rule_stats[(category, pattern)] += 1
+            for step in compiled.get(category, ()):
+                result = step.apply(result, self.rule_stats)
         
         return result
     
@@ -227,7 +410,7 @@ class PhoneticRuleRefiner:
                     updated_rules += 1
         
         # Try to derive new rules from examples
-        new_rules = self.derive_rules_from_examples(examples)
+        new_rules = self.derive_rules_from_examples(examples, save=False)
         updated_rules += len(new_rules)
         
         # Save updated rules and weights
@@ -236,12 +419,13 @@ class PhoneticRuleRefiner:
         
         return updated_rules
     
-    def derive_rules_from_examples(self, examples):
+    def derive_rules_from_examples(self, examples, save=True):
         """
         Try to derive new phonetic rules from examples
         
         Args:
             examples: List of (input, expected_output) pairs
+            save: Whether to write the rules file once the new rules are added
             
         Returns:
             List of newly derived rules as (category, pattern, replacement) tuples
@@ -254,47 +438,179 @@ class PhoneticRuleRefiner:
             if result == expected_output:
                 continue
             
-            # Look for consistent differences between input and expected output
-            if len(input_text) == len(expected_output):
-                # Character-by-character analysis for same length strings
-                for i in range(len(input_text)):
-                    if input_text[i] != expected_output[i]:
-                        # Found a difference - look for patterns
-                        context_size = 2  # chars before/after
-                        
-                        # Extract context around the difference
-                        start = max(0, i - context_size)
-                        end = min(len(input_text), i + context_size + 1)
-                        
-                        pattern_text = input_text[start:end]
-                        replacement_text = expected_output[start:end]
-                        
-                        # Determine rule category
-                        if input_text[i].lower() in 'aeiou' and expected_output[i].lower() in 'aeiou':
-                            category = 'vowel_rules'
-                        elif input_text[i].lower() in 'bcdfghjklmnpqrstvwxyz' and expected_output[i].lower() in 'bcdfghjklmnpqrstvwxyz':
-                            category = 'consonant_clusters'
-                        else:
-                            # Skip if not clearly vowel or consonant
-                            continue
-                        
-                        # Create candidate rule
-                        pattern = re.escape(pattern_text)
-                        
-                        # Don't create overly specific rules
-                        if len(pattern) <= 3:
-                            continue
-                        
-                        self.add_rule(category, pattern, replacement_text, weight=0.5)
-                        new_rules.append((category, pattern, replacement_text))
-            else:
-                # For different length strings, look for common substrings
-                # This is more complex and would require sophisticated diff algorithms
-                # For now, we'll skip these cases
-                pass
+            for category, pattern, replacement_text in self._candidate_rules(input_text, expected_output):
+                self.add_rule(category, pattern, replacement_text, weight=0.5, save=False)
+                new_rules.append((category, pattern, replacement_text))
+        
+        if new_rules and save:
+            self.save_rules()
         
         return new_rules
     
+    def _candidate_rules(self, input_text, expected_output):
+        """
+        Find candidate rules for an example the current rules get wrong
+        
+        Returns:
+            List of (category, pattern, replacement) tuples
+        """
+        candidates = []
+        
+        # Look for consistent differences between input and expected output
+        if len(input_text) == len(expected_output):
+            # Character-by-character analysis for same length strings
+            for i in range(len(input_text)):
+                if input_text[i] != expected_output[i]:
+                    # Found a difference - look for patterns
+                    context_size = 2  # chars before/after
+                    
+                    # Extract context around the difference
+                    start = max(0, i - context_size)
+                    end = min(len(input_text), i + context_size + 1)
+                    
+                    pattern_text = input_text[start:end]
+                    replacement_text = expected_output[start:end]
+                    
+                    # Determine rule category
+                    if input_text[i].lower() in 'aeiou' and expected_output[i].lower() in 'aeiou':
+                        category = 'vowel_rules'
+                    elif input_text[i].lower() in 'bcdfghjklmnpqrstvwxyz' and expected_output[i].lower() in 'bcdfghjklmnpqrstvwxyz':
+                        category = 'consonant_clusters'
+                    else:
+                        # Skip if not clearly vowel or consonant
+                        continue
+                    
+                    # Create candidate rule
+                    pattern = re.escape(pattern_text)
+                    
+                    # Don't create overly specific rules
+                    if len(pattern) <= 3:
+                        continue
+                    
+                    candidates.append((category, pattern, replacement_text))
+        else:
+            # For different length strings, look for common substrings
+            # This is more complex and would require sophisticated diff algorithms
+            # For now, we'll skip these cases
+            pass
+        
+        return candidates
+    
+    def category_effectiveness(self, examples):
+        """
+        Count how often each rule category alone turns an input into its expected output
+        
+        Args:
+            examples: Iterable of (input, expected_output) pairs
+            
+        Returns:
+            Dict of category -> [correct, total]
+        """
+        counts = {category: [0, 0] for category in self.refined_rules}
+        for input_text, expected_output in examples:
+            for category in self.refined_rules:
+                counts[category][1] += 1
+                if self.apply_rules(input_text, [category]) == expected_output:
+                    counts[category][0] += 1
+        return counts
+    
+    def train_from_examples(self, examples, workers=None, chunk_size=500, update_weights=True,
+                            derive_rules=True, progress=True):
+        """
+        Refine rules from a large set of examples using worker processes
+        
+        Gives the same weight updates as refine_rules_from_examples(). Workers
+        evaluate chunks of examples against a snapshot of the rules and return
+        counts; the weights are updated in one step and the rules file is
+        written once at the end. New rules are derived from the snapshot with
+        the updated weights, so rules derived from one example are not used
+        when checking later examples.
+        
+        Args:
+            examples: Iterable of (input, expected_output) pairs
+            workers: Number of worker processes (default: CPU count)
+            chunk_size: Examples per task sent to a worker
+            update_weights: Whether to update rule weights based on examples
+            derive_rules: Whether to derive new rules from mismatched examples
+            progress: Whether to print progress and throughput
+            
+        Returns:
+            Dict with 'examples', 'updated_rules', 'new_rules', 'seconds' and 'examples_per_second'
+        """
+        examples = list(examples)
+        workers = workers or default_workers()
+        start = time.perf_counter()
+        updated_rules = 0
+        new_rules = []
+        
+        if examples:
+            initargs = (self.language, self.rules_file, self.refined_rules)
+            
+            # Phase 1: effectiveness counts against the current weights
+            totals = defaultdict(lambda: [0, 0])
+            weights = dict(self.rule_weights)
+            tasks = ((_EVALUATE, chunk, weights) for chunk in chunked(examples, chunk_size))
+            for counts in self._run_training_phase('evaluate', tasks, len(examples), workers, initargs, progress):
+                for category, (correct, total) in counts.items():
+                    totals[category][0] += correct
+                    totals[category][1] += total
+            
+            if update_weights:
+                # Every rule in a category gets the category's counts
+                for category, (correct, total) in totals.items():
+                    if total == 0:
+                        continue
+                    effectiveness = correct / total
+                    patterns = dict.fromkeys(rule[0] for rule in self.refined_rules.get(category, []))
+                    for pattern in patterns:
+                        rule_id = (category, pattern)
+                        current_weight = self.rule_weights.get(rule_id, 1.0)
+                        self.rule_weights[rule_id] = 0.7 * current_weight + 0.3 * effectiveness
+                        updated_rules += 1
+            
+            # Phase 2: candidate rules from examples the updated rules still get wrong
+            if derive_rules:
+                weights = dict(self.rule_weights)
+                tasks = ((_DERIVE, chunk, weights) for chunk in chunked(examples, chunk_size))
+                for candidates in self._run_training_phase('derive', tasks, len(examples), workers, initargs, progress):
+                    for category, pattern, replacement in candidates:
+                        self.add_rule(category, pattern, replacement, weight=0.5, save=False)
+                        new_rules.append((category, pattern, replacement))
+                updated_rules += len(new_rules)
+            
+            if updated_rules > 0:
+                self.save_rules()
+        
+        elapsed = time.perf_counter() - start
+        report = {
+            'examples': len(examples),
+            'updated_rules': updated_rules,
+            'new_rules': len(new_rules),
+            'seconds': elapsed,
+            'examples_per_second': len(examples) / elapsed if elapsed > 0 else 0.0,
+        }
+        if progress:
+            print(f"Trained on {report['examples']} examples in {elapsed:.2f}s "
+                  f"({report['examples_per_second']:.0f} examples/s): "
+                  f"{updated_rules} rules updated, {len(new_rules)} new")
+        return report
+    
+    def _run_training_phase(self, name, tasks, total, workers, initargs, progress):
+        """Run training tasks in worker processes, yielding results in input order"""
+        start = time.perf_counter()
+        done = 0
+        last_report = start
+        for count, result in imap_bounded(_run_training_task, tasks, workers=workers,
+                                          initializer=_init_training_worker, initargs=initargs):
+            done += count
+            yield result
+            
+            now = time.perf_counter()
+            if progress and (now - last_report >= 1.0 or done == total):
+                last_report = now
+                rate = done / (now - start) if now > start else 0.0
+                print(f"  {name}: {done}/{total} examples ({rate:.0f} examples/s)")
+    
     def get_rule_stats(self):
         """Get statistics about rule usage"""
         stats = {}
@@ -332,10 +648,62 @@ def apply_refined_phonetic_rules(text, language='hindi'):
     Returns:
         Processed text with phonetic rules applied
     """
-    refiner = PhoneticRuleRefiner(language)
-    return refiner.apply_rules(text)
+    return get_phonetic_refiner(language).apply_rules(text)
+
+_refiners = {}
+
+def get_phonetic_refiner(language='hindi', rules_file=None):
+    """
+    Get the shared rule refiner for a language
+    
+    The refiner (and its compiled rules) is reused across calls and only
+    reloaded when the rules file is changed by someone else.
+    """
+    rules_file = rules_file or f"{language}_refined_rules.json"
+    # Relative rules files resolve against the working directory
+    key = (language, rules_file, os.getcwd())
+    refiner = _refiners.get(key)
+    
+    try:
+        mtime = os.stat(rules_file).st_mtime
+    except OSError:
+        mtime = None
+    if refiner is None or refiner._file_mtime != mtime:
+        refiner = PhoneticRuleRefiner(language, rules_file)
+        _refiners[key] = refiner
+    return refiner
+
+# Training worker state: one refiner per worker process, holding the rules snapshot
+_EVALUATE = 'evaluate'
+_DERIVE = 'derive'
+_training_refiner = None
+
+def _init_training_worker(language, rules_file, refined_rules):
+    global _training_refiner
+    _training_refiner = PhoneticRuleRefiner(language, rules_file)
+    _training_refiner.refined_rules = refined_rules
+    _training_refiner.invalidate_compiled_rules()
+
+def _run_training_task(task):
+    """Evaluate one chunk of examples; returns (example count, result)"""
+    phase, examples, weights = task
+    refiner = _training_refiner
+    if dict(refiner.rule_weights) != weights:
+        refiner.rule_weights.clear()
+        for rule_id, weight in weights.items():
+            refiner.rule_weights[rule_id] = weight
+        refiner.invalidate_compiled_rules()
+    
+    if phase == _EVALUATE:
+        return len(examples), refiner.category_effectiveness(examples)
+    
+    candidates = []
+    for input_text, expected_output in examples:
+        if refiner.apply_rules(input_text) != expected_output:
+            candidates.extend(refiner._candidate_rules(input_text, expected_output))
+    return len(examples), candidates
 
-def refine_rules_from_corpus(input_texts, expected_outputs, language='hindi'):
+def refine_rules_from_corpus(input_texts, expected_outputs, language='hindi', workers=None):
     """
     Refine rules based on a corpus of examples
     
@@ -343,10 +711,13 @@ def refine_rules_from_corpus(input_texts, expected_outputs, language='hindi'):
         input_texts: List of input texts
         expected_outputs: List of expected outputs
         language: 'hindi' or 'marathi'
+        workers: Number of worker processes (None to refine in this process)
         
     Returns:
         Number of rules updated/refined
     """
     refiner = PhoneticRuleRefiner(language)
     examples = list(zip(input_texts, expected_outputs))
+    if workers:
+        return refiner.train_from_examples(examples, workers=workers)['updated_rules']
     return refiner.refine_rules_from_examples(examples)
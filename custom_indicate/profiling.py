@@ -0,0 +1,224 @@
+"""
+Profiling helpers for the transliteration pipeline.
+Runs a deterministic profiler (cProfile) together with a stack sampler, and
+writes a pstats dump plus flamegraph-compatible collapsed stacks whose root
+frame is the pipeline stage each sample was taken in.
+"""
+
+import cProfile
+import io
+import math
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+
+# Engine functions that start a pipeline stage. A sample belongs to the
+# outermost stage on its stack, so hindi2english() time spent in its own
+# postprocessing counts towards 'transliterate'. 'get_exception' covers both
+# the engine's built-in exception lookup and ExceptionDetector's learned
+# exceptions.
+PIPELINE_STAGES = {
+    'preprocess_text': 'preprocess',
+    'get_exception': 'exceptions',
+    'get_named_entity': 'exceptions',
+    'hindi2english': 'transliterate',
+    'marathi2english': 'transliterate',
+    'transliterate_text': 'transliterate',
+    'apply_schwa_rules': 'schwa',
+    'apply_schwa_model': 'schwa',
+    'apply_context_aware_transliteration': 'context_aware',
+    'postprocess_text': 'postprocess',
+    'capitalize_text': 'capitalization',
+    'apply_rules': 'phonetic_refinement',
+}
+
+# Samples inside EnhancedTransliterator.transliterate but outside any stage
+ENGINE_STAGE = 'engine'
+# Samples outside the engine (test harness, evaluation, I/O)
+OTHER_STAGE = 'other'
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _frame_name(code):
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}.{code.co_name}"
+
+
+def _stage_of(codes):
+    """Pipeline stage of a stack given as code objects, outermost first"""
+    stage = OTHER_STAGE
+    for code in codes:
+        if not code.co_filename.startswith(_PACKAGE_DIR):
+            continue
+        if code.co_name in PIPELINE_STAGES:
+            return PIPELINE_STAGES[code.co_name]
+        if code.co_name == 'transliterate':
+            stage = ENGINE_STAGE
+    return stage
+
+
+class PipelineProfiler:
+    """
+    Profile a workload running in the current thread
+
+    Usage:
+        with PipelineProfiler('profiles/run') as profiler:
+            workload()
+        profiler.write()
+        print(profiler.top_functions())
+    """
+
+    def __init__(self, output_prefix, interval=0.001, sampling=True, deterministic=True):
+        """
+        Initialize the profiler
+
+        Args:
+            output_prefix: Path prefix for the .pstats and .collapsed files
+            interval: Seconds between stack samples
+            sampling: Whether to collect sampled stacks
+            deterministic: Whether to run cProfile
+        """
+        self.output_prefix = output_prefix
+        self.interval = interval
+        self.profile = cProfile.Profile() if deterministic else None
+        self.sampling = sampling
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+        self._target_thread = None
+        self._switch_interval = None
+
+    def start(self):
+        self._target_thread = threading.get_ident()
+        if self.sampling:
+            # Let the sampler thread get the GIL about as often as it wants to sample
+            self._switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self._switch_interval, self.interval))
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        if self.profile is not None:
+            self.profile.enable()
+
+    def stop(self):
+        if self.profile is not None:
+            self.profile.disable()
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            sys.setswitchinterval(self._switch_interval)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_thread)
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            if not codes:
+                continue
+            codes.reverse()
+            stack = [f"[{_stage_of(codes)}]"] + [_frame_name(code) for code in codes]
+            self.samples[';'.join(stack)] += 1
+
+    def stage_samples(self):
+        """Number of samples per pipeline stage"""
+        stages = Counter()
+        for stack, count in self.samples.items():
+            stages[stack.split(';', 1)[0].strip('[]')] += count
+        return stages
+
+    def write(self):
+        """
+        Write the pstats dump and collapsed stacks
+
+        Returns:
+            List of written file paths
+        """
+        directory = os.path.dirname(self.output_prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        paths = []
+        if self.profile is not None:
+            path = f"{self.output_prefix}.pstats"
+            self.profile.dump_stats(path)
+            paths.append(path)
+        if self.sampling:
+            path = f"{self.output_prefix}.collapsed"
+            with open(path, 'w', encoding='utf-8') as f:
+                for stack, count in sorted(self.samples.items()):
+                    f.write(f"{stack} {count}\n")
+            paths.append(path)
+        return paths
+
+    def top_functions(self, limit=20, sort='tottime'):
+        """Table of the hottest functions from the deterministic profile"""
+        if self.profile is None:
+            return ''
+        out = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=out)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def stage_table(self):
+        """Table of sampled time per pipeline stage"""
+        stages = self.stage_samples()
+        total = sum(stages.values())
+        if not total:
+            return 'No samples collected'
+        lines = [f"{'Stage':22}{'Samples':>10}{'Share':>9}"]
+        for stage, count in stages.most_common():
+            lines.append(f"{stage:22}{count:>10}{count / total:>9.1%}")
+        return '\n'.join(lines)
+
+
+def profile_call(func, output_prefix, top=20, interval=0.001):
+    """
+    Run func under PipelineProfiler, write the outputs and print a summary
+
+    Returns:
+        func's return value
+    """
+    with PipelineProfiler(output_prefix, interval=interval) as profiler:
+        result = func()
+
+    paths = profiler.write()
+    print(profiler.stage_table())
+    print()
+    print(profiler.top_functions(top))
+    print("Profile written to " + ', '.join(paths))
+    return result
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list
+
+    Shared by the benchmark suite, the load test and the A/B comparison, so
+    their latency percentiles agree.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction (0.5 for the median)
+
+    Returns:
+        The smallest value with at least fraction of the values at or below
+        it (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
@@ -0,0 +1,146 @@
+"""
+Content-addressed cache of transliteration results.
+Results are stored under a hash of the input text, language, feature flags
+and a fingerprint of everything the engine's output depends on, so a
+regression run only recomputes cases whose input or engine has changed.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+
+from .exceptions import NAMED_ENTITIES, SCHWA_EXCEPTIONS
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# SQLite limits the number of parameters in one statement
+_QUERY_BATCH = 500
+
+
+def _hash_json(digest, value):
+    digest.update(json.dumps(value, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    digest.update(b'\0')
+
+
+def _hash_file(digest, path):
+    digest.update(os.path.basename(path).encode('utf-8'))
+    try:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    except OSError:
+        digest.update(b'<missing>')
+    digest.update(b'\0')
+
+
+def engine_fingerprint(transliterator, rules_file=None):
+    """
+    Hash of the code and data a transliterator's output depends on
+
+    Covers the engine source files, character maps, built-in and learned
+    exception dictionaries, bundled data files, the phonetic rules file and
+    the transliterator's enable_* settings.
+
+    Args:
+        transliterator: EnhancedTransliterator instance
+        rules_file: Phonetic rules file (default: {language}_refined_rules.json)
+
+    Returns:
+        Hex digest string
+    """
+    language = transliterator.language
+    digest = hashlib.sha256(language.encode('utf-8'))
+
+    # Engine code; test modules do not affect results
+    for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, '*.py'))):
+        if not os.path.basename(path).startswith('test'):
+            _hash_file(digest, path)
+    for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, 'data', '*.json'))):
+        _hash_file(digest, path)
+
+    # Runtime data, which may differ from the source if modified in place
+    _hash_json(digest, transliterator.char_map)
+    _hash_json(digest, transliterator.builtin_exceptions)
+    _hash_json(digest, NAMED_ENTITIES)
+    _hash_json(digest, SCHWA_EXCEPTIONS)
+
+    detector = getattr(transliterator, 'exception_detector', None)
+    if detector is not None:
+        _hash_json(digest, detector.exceptions)
+
+    _hash_file(digest, rules_file or f"{language}_refined_rules.json")
+
+    settings = {name: value for name, value in vars(transliterator).items()
+                if name.startswith('enable_')}
+    _hash_json(digest, settings)
+
+    return digest.hexdigest()
+
+
+def result_key(fingerprint, language, feature_flags, text):
+    """Cache key for one input under an engine fingerprint and feature flags"""
+    digest = hashlib.sha256(fingerprint.encode('ascii'))
+    digest.update(b'\0' + language.encode('utf-8') + b'\0')
+    _hash_json(digest, feature_flags or {})
+    digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite-backed store of transliteration results by content key.
+    Counts hits and misses so runs can report what was reused.
+    """
+
+    def __init__(self, path):
+        """
+        Open (or create) a result cache
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, output TEXT NOT NULL)')
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys):
+        """
+        Look up results for a list of keys
+
+        Returns:
+            List with the stored output for each key, or None where missing
+        """
+        found = {}
+        for start in range(0, len(keys), _QUERY_BATCH):
+            batch = keys[start:start + _QUERY_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            found.update(self._db.execute(
+                f'SELECT key, output FROM results WHERE key IN ({placeholders})', batch))
+
+        outputs = [found.get(key) for key in keys]
+        hits = sum(1 for output in outputs if output is not None)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return outputs
+
+    def put_many(self, items):
+        """Store (key, output) pairs"""
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO results (key, output) VALUES (?, ?)', items)
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def clear(self):
+        """Remove every stored result"""
+        with self._db:
+            self._db.execute('DELETE FROM results')
+
+    def close(self):
+        self._db.close()
@@ -4,6 +4,12 @@ Implements a more sophisticated approach to inherent vowel deletion in Hindi/Mar
 """
 
 import re
+from functools import lru_cache
+
+# NumPy is optional and only used for batch scoring. It is imported on first
+# use (see _load_numpy) since it costs more than the rest of the package to import.
+np = None
+_numpy_loaded = False
 
 # Statistical patterns for schwa deletion based on word endings and syllable structure
 SCHWA_DELETION_PATTERNS = [
@@ -56,6 +62,21 @@ SCHWA_EXCEPTIONS_TABLE = {
     ]
 }
 
+# Exception lists as frozensets for constant-time membership checks
+ABNORMAL_DELETION_WORDS = frozenset(SCHWA_EXCEPTIONS_TABLE['abnormal_deletion'])
+ABNORMAL_RETENTION_WORDS = frozenset(SCHWA_EXCEPTIONS_TABLE['abnormal_retention'])
+
+# Single-pass form of SCHWA_DELETION_PATTERNS for whole words.
+# Every pattern is anchored at the end of the word, and patterns 2-5 all
+# require the word to end in consonant + 'a', which pattern 1 has already
+# removed. Applying the table in order is therefore the same as one anchored
+# match of pattern 1 against the last two characters of the word.
+WORD_FINAL_SCHWA = re.compile(r'[kgcjtdnpbmyrlvshz]a$')
+SCHWA_AT_WORD_END = re.compile(r'a\b')
+
+# Number of (word, original) results memoized by delete_schwa()
+SCHWA_CACHE_SIZE = 65536
+
 # Syllable weight table (for determining schwa deletion)
 SYLLABLE_WEIGHTS = {
     # Format: syllable structure -> weight
@@ -69,62 +90,24 @@ SYLLABLE_WEIGHTS = {
 
 def syllabify(word):
     """
-    Break a word into syllables to aid in schwa deletion decisions
-    This is a simplified syllabification for Hindi/Marathi
-    """
-    syllables = []
-    i = 0
-    current_syllable = ""
+    Break a word into syllables (aksharas) to aid in schwa deletion decisions
     
-    while i < len(word):
-        # Start with a consonant or consonant cluster
-        if is_consonant(word[i]):
-            current_syllable += word[i]
-            i += 1
-            
-            # Collect consonant cluster
-            while i < len(word) and is_consonant(word[i]):
-                current_syllable += word[i]
-                i += 1
-        
-        # Add vowel (if present)
-        if i < len(word) and is_vowel(word[i]):
-            current_syllable += word[i]
-            i += 1
-            
-            # Include vowel modifiers
-            if i < len(word) and is_vowel_modifier(word[i]):
-                current_syllable += word[i]
-                i += 1
-        
-        # Save completed syllable
-        if current_syllable:
-            syllables.append(current_syllable)
-            current_syllable = ""
-    
-    # Add any remaining characters
-    if current_syllable:
-        syllables.append(current_syllable)
-    
-    return syllables
+    A syllable is a consonant cluster (consonants joined by virama) or an
+    independent vowel, together with any following matra, nukta, anusvara,
+    visarga or candrabindu. Characters are classified through the
+    DEVANAGARI_CATEGORIES table and the syllable boundaries are found with
+    one regex pass over the resulting category string.
+    """
+    categories = word.translate(_CATEGORY_TABLE)
+    return [word[m.start():m.end()] for m in SYLLABLE_PATTERN.finditer(categories)]
 
 def get_syllable_weight(syllable):
     """Calculate the weight of a syllable for schwa deletion determination"""
-    # Simplified: Convert the syllable to a CV pattern
-    cv_pattern = ""
-    for char in syllable:
-        if is_consonant(char):
-            cv_pattern += 'C'
-        elif is_vowel(char) or is_vowel_modifier(char):
-            cv_pattern += 'V'
-    
-    # Look up the weight
-    for pattern, weight in SYLLABLE_WEIGHTS.items():
-        if cv_pattern == pattern:
-            return weight
+    # Convert the syllable to a CV pattern and look up the weight
+    cv_pattern = syllable.translate(_CV_TABLE)
     
     # Default weight for unknown patterns
-    return 1.0
+    return SYLLABLE_WEIGHTS.get(cv_pattern, 1.0)
 
 def is_consonant(char):
     """Check if a character is a Devanagari consonant"""
@@ -141,6 +124,54 @@ def is_vowel_modifier(char):
     # Unicode range for Devanagari vowel signs (matras)
     return '\u093E' <= char <= '\u094C' or char == '\u0902' or char == '\u0903'
 
+# Devanagari character categories, indexed by code point - 0x0900:
+#   C consonant, V independent vowel, D dependent vowel sign (matra),
+#   N nukta, H virama, M other combining mark (candrabindu, anusvara,
+#   visarga, stress marks), O anything else (digits, danda, avagraha, ...)
+def _build_category_array():
+    categories = ['O'] * 0x80
+    for first, last, category in [
+        (0x0900, 0x0903, 'M'), (0x0904, 0x0914, 'V'), (0x0915, 0x0939, 'C'),
+        (0x093A, 0x093B, 'D'), (0x093C, 0x093C, 'N'), (0x093E, 0x094C, 'D'),
+        (0x094D, 0x094D, 'H'), (0x094E, 0x094F, 'D'), (0x0951, 0x0954, 'M'),
+        (0x0955, 0x0957, 'D'), (0x0958, 0x095F, 'C'), (0x0960, 0x0961, 'V'),
+        (0x0962, 0x0963, 'D'), (0x0972, 0x0977, 'V'), (0x0978, 0x097F, 'C'),
+    ]:
+        for codepoint in range(first, last + 1):
+            categories[codepoint - 0x0900] = category
+    return ''.join(categories)
+
+DEVANAGARI_CATEGORIES = _build_category_array()
+
+class _TranslationTable(dict):
+    """str.translate() table with a fixed result for unlisted characters"""
+    def __init__(self, mapping, default):
+        super().__init__(mapping)
+        self.default = default
+    
+    def __missing__(self, codepoint):
+        return self.default
+
+# Word -> category string (one category letter per character)
+_CATEGORY_TABLE = _TranslationTable(
+    {0x0900 + i: category for i, category in enumerate(DEVANAGARI_CATEGORIES)}, 'O')
+
+# Syllable -> CV pattern, using the is_consonant/is_vowel/is_vowel_modifier
+# definitions (other characters are dropped)
+_CV_TABLE = _TranslationTable(
+    {cp: ('C' if is_consonant(chr(cp)) else 'V')
+     for cp in range(0x0900, 0x0980)
+     if is_consonant(chr(cp)) or is_vowel(chr(cp)) or is_vowel_modifier(chr(cp))}, None)
+
+# A syllable starts at a consonant, a vowel or a stray mark and extends over
+# combining marks and over consonants that directly follow a virama.
+# 'Other' characters always form a syllable of their own.
+SYLLABLE_PATTERN = re.compile(r'[CVNDHM](?:[NDHM]|(?<=H)C)*|O')
+
+def has_inherent_schwa(syllable):
+    """Check if a syllable ends in a consonant that carries the inherent 'a'"""
+    return syllable[-1:].translate(_CATEGORY_TABLE) in ('C', 'N')
+
 def calculate_schwa_deletion_probability(word, position):
     """
     Calculate the probability of schwa deletion at a specific position in a word
@@ -176,6 +207,147 @@ def calculate_schwa_deletion_probability(word, position):
     # Cap probability between 0 and 1
     return max(0, min(prob, 1))
 
+# Category codes for the vectorized syllabifier (index into 'CVDNHMO')
+_CATEGORY_CODES = 'CVDNHMO'
+_CONSONANT, _VIRAMA, _OTHER = 0, 4, 6
+# Largest CV pattern code for patterns of up to four letters (base-3 digits)
+_MAX_PATTERN_CODE = 2 * (1 + 3 + 9 + 27)
+
+def _pattern_code(cv_pattern):
+    """Encode a CV pattern as base-3 digits (C=1, V=2), first letter lowest"""
+    return sum((1 if letter == 'C' else 2) * 3 ** i for i, letter in enumerate(cv_pattern))
+
+def _load_numpy():
+    """Import NumPy and build the scoring tables on first use; None without NumPy"""
+    global np, _numpy_loaded, _CATEGORY_ARRAY, _CV_DIGITS, _WEIGHT_BY_CODE
+    if _numpy_loaded:
+        return np
+    _numpy_loaded = True
+    try:
+        import numpy
+    except ImportError:  # batch scoring falls back to pure Python
+        return None
+    
+    _CATEGORY_ARRAY = numpy.array([_CATEGORY_CODES.index(c) for c in DEVANAGARI_CATEGORIES],
+                                  dtype=numpy.uint8)
+    _CV_DIGITS = numpy.array([{'C': 1, 'V': 2}.get(chr(cp).translate(_CV_TABLE), 0)
+                              for cp in range(0x0900, 0x0980)], dtype=numpy.int64)
+    _WEIGHT_BY_CODE = numpy.ones(_MAX_PATTERN_CODE + 1)
+    for pattern, weight in SYLLABLE_WEIGHTS.items():
+        _WEIGHT_BY_CODE[_pattern_code(pattern)] = weight
+    np = numpy
+    return np
+
+def score_schwa_deletion(words):
+    """
+    Compute per-syllable schwa deletion probabilities for many words at once
+    
+    Gives the same values as calculate_schwa_deletion_probability(word, i)
+    for every syllable position i. With NumPy available, all words are
+    classified, syllabified and scored as flat arrays in one pass.
+    
+    Args:
+        words: List of Devanagari words
+    
+    Returns:
+        list: One sequence of probabilities per word (NumPy arrays when available)
+    """
+    if _load_numpy() is None:
+        return [[calculate_schwa_deletion_probability(word, position)
+                 for position in range(len(syllabify(word)))]
+                for word in words]
+    
+    word_count = len(words)
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=word_count)
+    text = ''.join(words)
+    if not text:
+        return [np.empty(0) for _ in words]
+    
+    # Classify every character through the category array
+    offsets = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64) - 0x0900
+    in_block = (offsets >= 0) & (offsets < 0x80)
+    offsets = np.where(in_block, offsets, 0)
+    categories = np.where(in_block, _CATEGORY_ARRAY[offsets], _OTHER)
+    cv_digits = np.where(in_block, _CV_DIGITS[offsets], 0)
+    
+    # A character continues the current syllable if it is a mark following a
+    # non-'other' character, or a consonant following a virama (same as
+    # SYLLABLE_PATTERN). Word starts always begin a new syllable.
+    previous = np.empty_like(categories)
+    previous[0] = _OTHER
+    previous[1:] = categories[:-1]
+    is_mark = (categories >= 2) & (categories <= 5)
+    continues = (is_mark & (previous != _OTHER)) | ((categories == _CONSONANT) & (previous == _VIRAMA))
+    word_starts = np.cumsum(lengths) - lengths
+    continues[word_starts[lengths > 0]] = False
+    
+    syllable_starts = np.flatnonzero(~continues)
+    syllable_ids = np.cumsum(~continues) - 1
+    syllable_words = np.repeat(np.arange(word_count), lengths)[syllable_starts]
+    syllable_counts = np.bincount(syllable_words, minlength=word_count)
+    first_syllable = np.cumsum(syllable_counts) - syllable_counts
+    positions = np.arange(len(syllable_starts)) - first_syllable[syllable_words]
+    
+    # Syllable weights: encode each syllable's CV pattern as a base-3 number
+    has_digit = cv_digits > 0
+    digits_before = np.cumsum(has_digit) - has_digit
+    ranks = digits_before - digits_before[syllable_starts][syllable_ids]
+    values = cv_digits * 3 ** np.minimum(ranks, 4)
+    codes = np.add.reduceat(values, syllable_starts)
+    pattern_lengths = np.add.reduceat(has_digit.astype(np.int64), syllable_starts)
+    weights = np.where(pattern_lengths <= 4,
+                       _WEIGHT_BY_CODE[np.minimum(codes, _MAX_PATTERN_CODE)], 1.0)
+    
+    is_last = positions == syllable_counts[syllable_words] - 1
+    probabilities = np.where(is_last, 0.95, np.where(positions == 0, 0.05, 0.5) * weights)
+    probabilities = np.clip(probabilities, 0, 1)
+    
+    return np.split(probabilities, np.cumsum(syllable_counts)[:-1])
+
+def _map_syllable(syllable, char_map):
+    """Transliterate one syllable by greedy longest match against the char map"""
+    result = []
+    i = 0
+    while i < len(syllable):
+        for seq_len in range(min(5, len(syllable) - i), 0, -1):
+            sequence = syllable[i:i + seq_len]
+            if sequence in char_map:
+                result.append(char_map[sequence])
+                i += seq_len
+                break
+        else:
+            result.append(syllable[i])
+            i += 1
+    return ''.join(result)
+
+def apply_schwa_model(words, char_map, threshold=0.5):
+    """
+    Transliterate words using the statistical schwa model instead of the
+    regex heuristics (opt-in alternative to hindi2english + apply_schwa_rules)
+    
+    Every syllable is scored with score_schwa_deletion(); a syllable that
+    carries an inherent schwa loses its 'a' when the deletion probability
+    is above the threshold.
+    
+    Args:
+        words: List of Devanagari words
+        char_map: Character mapping dictionary (e.g. HINDI_CHARS)
+        threshold: Deletion probability above which the schwa is dropped
+    
+    Returns:
+        list: Transliterated words
+    """
+    results = []
+    for word, probabilities in zip(words, score_schwa_deletion(words)):
+        parts = []
+        for syllable, probability in zip(syllabify(word), probabilities):
+            latin = _map_syllable(syllable, char_map)
+            if probability > threshold and latin.endswith('a') and has_inherent_schwa(syllable):
+                latin = latin[:-1]
+            parts.append(latin)
+        results.append(''.join(parts))
+    return results
+
 def apply_statistical_schwa_deletion(transliterated_word, original_word=None):
     """
     Apply statistical schwa deletion rules to a transliterated word
@@ -189,10 +361,10 @@ def apply_statistical_schwa_deletion(transliterated_word, original_word=None):
     """
     # If the original word is in the exceptions list, use predefined treatment
     if original_word:
-        if original_word in SCHWA_EXCEPTIONS_TABLE['abnormal_deletion']:
+        if original_word in ABNORMAL_DELETION_WORDS:
             # Apply aggressive schwa deletion
-            return re.sub(r'a\b', '', transliterated_word)
-        elif original_word in SCHWA_EXCEPTIONS_TABLE['abnormal_retention']:
+            return SCHWA_AT_WORD_END.sub('', transliterated_word)
+        elif original_word in ABNORMAL_RETENTION_WORDS:
             # Preserve schwas
             return transliterated_word
     
@@ -205,6 +377,32 @@ def apply_statistical_schwa_deletion(transliterated_word, original_word=None):
     
     return result
 
+@lru_cache(maxsize=SCHWA_CACHE_SIZE)
+def delete_schwa(word, original_word=None):
+    """
+    Compiled, memoized schwa deletion for a single word
+    
+    Gives the same result as apply_statistical_schwa_deletion() for any
+    whitespace-free word, using one anchored match instead of a re.sub per
+    pattern.
+    
+    Args:
+        word: A single transliterated word
+        original_word: The original Devanagari word (if available)
+    
+    Returns:
+        str: Word with appropriate schwa deletion applied
+    """
+    if original_word:
+        if original_word in ABNORMAL_DELETION_WORDS:
+            return SCHWA_AT_WORD_END.sub('', word)
+        elif original_word in ABNORMAL_RETENTION_WORDS:
+            return word
+    
+    if WORD_FINAL_SCHWA.match(word, len(word) - 2):
+        return word[:-1]
+    return word
+
 def apply_schwa_rules(text, original_text=None):
     """
     Apply all schwa deletion rules to a transliterated text
@@ -221,6 +419,6 @@ def apply_schwa_rules(text, original_text=None):
     
     # Process each word
     for i, (word, original) in enumerate(zip(words, original_words)):
-        words[i] = apply_statistical_schwa_deletion(word, original)
+        words[i] = delete_schwa(word, original)
     
     return ' '.join(words)
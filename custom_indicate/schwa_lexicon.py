@@ -0,0 +1,173 @@
+"""
+Precomputed schwa lexicon.
+Runs the full word-level schwa logic offline over a word list and stores the
+results in a memory-mapped table, so common words cost a single lookup.
+"""
+
+import argparse
+import hashlib
+import os
+import time
+
+from .mapped_table import MappedTable, write_table
+from .schwa_deletion import apply_schwa_rules, apply_schwa_model
+from .language_pack import load_language_pack
+from .transliterate import hindi2english, marathi2english
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+# Modules whose code and data determine the precomputed results
+_SOURCE_FILES = ['transliterate.py', 'char_maps.py', 'schwa_deletion.py']
+
+# Words processed per batch when building with the statistical model
+_MODEL_BATCH_SIZE = 10000
+
+
+def default_lexicon_path(language='hindi', mode='rules'):
+    """Default location of a language's schwa lexicon"""
+    suffix = '' if mode == 'rules' else f'_{mode}'
+    return os.path.join(DATA_DIR, f'{language}_schwa{suffix}.lex')
+
+
+def source_fingerprint(language='hindi', mode='rules'):
+    """Hash of the engine sources a lexicon was built from"""
+    digest = hashlib.sha256(f'{language}:{mode}'.encode('utf-8'))
+    package_dir = os.path.dirname(__file__)
+    for name in _SOURCE_FILES:
+        with open(os.path.join(package_dir, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def transliterate_word(word, language='hindi'):
+    """Basic transliteration followed by schwa rules, as done per word by the engine"""
+    if language == 'hindi':
+        transliterated = hindi2english(word)
+    else:  # marathi
+        transliterated = marathi2english(word)
+    return apply_schwa_rules(transliterated, word)
+
+
+class SchwaLexicon:
+    """Memory-mapped word -> transliteration table for one language and schwa mode"""
+
+    def __init__(self, path):
+        """
+        Open a lexicon built by build_lexicon()
+
+        Args:
+            path: Path to the lexicon file
+        """
+        self.table = MappedTable(path)
+        self.language = self.table.meta.get('language')
+        self.mode = self.table.meta.get('mode', 'rules')
+        self.fingerprint = self.table.meta.get('fingerprint')
+
+    def get(self, word):
+        """Get the precomputed transliteration for a word, or None"""
+        return self.table.get(word)
+
+    def __len__(self):
+        return len(self.table)
+
+    def close(self):
+        self.table.close()
+
+
+def build_lexicon(words, language='hindi', path=None, mode='rules', progress=False):
+    """
+    Precompute transliterations for a word list and write a lexicon file
+
+    Args:
+        words: Iterable of Devanagari words (most frequent first)
+        language: 'hindi' or 'marathi'
+        path: Output path (defaults to the language's lexicon in the data directory)
+        mode: 'rules' (apply_schwa_rules) or 'model' (statistical schwa model)
+        progress: Whether to print progress while building
+
+    Returns:
+        Number of words written
+    """
+    path = path or default_lexicon_path(language, mode)
+    char_map = load_language_pack(language)['char_map']
+    unique_words = list(dict.fromkeys(w for w in words if w))
+
+    start = time.perf_counter()
+    items = []
+    for i in range(0, len(unique_words), _MODEL_BATCH_SIZE):
+        batch = unique_words[i:i + _MODEL_BATCH_SIZE]
+        if mode == 'model':
+            results = apply_schwa_model(batch, char_map)
+        else:
+            results = [transliterate_word(word, language) for word in batch]
+        items.extend(zip(batch, results))
+
+        if progress:
+            elapsed = time.perf_counter() - start
+            print(f"  {len(items)}/{len(unique_words)} words "
+                  f"({len(items) / max(elapsed, 1e-9):.0f} words/s)")
+
+    meta = {
+        'language': language,
+        'mode': mode,
+        'fingerprint': source_fingerprint(language, mode),
+    }
+    return write_table(path, items, meta=meta)
+
+
+_lexicons = {}
+
+def load_schwa_lexicon(language='hindi', mode='rules', path=None):
+    """
+    Get the shared lexicon for a language, or None if there is no usable one
+
+    A lexicon built from different engine sources is ignored, since its
+    results may no longer match what the rules produce.
+    """
+    path = path or default_lexicon_path(language, mode)
+    if path in _lexicons:
+        return _lexicons[path]
+
+    lexicon = None
+    if os.path.exists(path):
+        try:
+            lexicon = SchwaLexicon(path)
+        except (OSError, ValueError) as e:
+            print(f"Error loading schwa lexicon: {e}")
+        else:
+            if lexicon.fingerprint != source_fingerprint(language, mode):
+                print(f"Ignoring stale schwa lexicon {path}; rebuild it with "
+                      f"python -m custom_indicate.schwa_lexicon")
+                lexicon.close()
+                lexicon = None
+
+    _lexicons[path] = lexicon
+    return lexicon
+
+
+def read_word_list(path, limit=None):
+    """Read one word per line (extra tab-separated columns such as counts are ignored)"""
+    words = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            word = line.split('\t', 1)[0].strip()
+            if word:
+                words.append(word)
+                if limit and len(words) >= limit:
+                    break
+    return words
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build a precomputed schwa lexicon')
+    parser.add_argument('word_list', help='Word list, one word per line, most frequent first')
+    parser.add_argument('--language', choices=['hindi', 'marathi'], default='hindi')
+    parser.add_argument('--mode', choices=['rules', 'model'], default='rules')
+    parser.add_argument('--limit', type=int, default=500000, help='Number of words to include')
+    parser.add_argument('--output', help='Output path (default: data directory)')
+    args = parser.parse_args()
+
+    output = args.output or default_lexicon_path(args.language, args.mode)
+    count = build_lexicon(read_word_list(args.word_list, args.limit), args.language,
+                          output, args.mode, progress=True)
+    print(f"Wrote {count} words to {output} ({os.path.getsize(output) / 1024:.0f} KiB)")
@@ -0,0 +1,165 @@
+"""
+Parallel transliteration of large documents.
+Splits a document at sentence boundaries, transliterates the shards in a
+pool of worker processes with warmed engines and joins the results in
+order. The output is identical to EnhancedTransliterator.transliterate on
+the whole document: shard edges are only placed where no pipeline stage
+looks across them, and a document whose shards cannot be verified is
+transliterated serially instead.
+"""
+
+import re
+from concurrent.futures.process import BrokenProcessPool
+
+from .context_aware import CONTEXT_DISAMBIGUATIONS
+from .parallel import default_workers, discard_shared_pool, shared_pool
+from .transliterate import preprocess_text
+
+# Characters that end a sentence in the source text
+SENTENCE_TERMINATORS = ('।', '॥', '.', '?', '!')
+
+# Documents shorter than this are not worth the round trips to the pool
+PARALLEL_MIN_CHARS = 20000
+
+# Shard size bounds, in characters of source text
+MIN_SHARD_CHARS = 4000
+MAX_SHARD_CHARS = 200000
+
+# Shards per worker, so that uneven shards still balance across the pool
+SHARDS_PER_WORKER = 4
+
+_SENTENCE_END = re.compile(r'[.!?]$')
+
+
+def shard_size(length, workers):
+    """Target shard size in characters for a document of the given length"""
+    target = length // max(workers * SHARDS_PER_WORKER, 1)
+    return min(max(target, MIN_SHARD_CHARS), MAX_SHARD_CHARS)
+
+
+def sentence_shards(text, shard_chars):
+    """
+    Split preprocessed text into shards of whole sentences
+
+    A shard ends after a word ending in a sentence terminator, and never
+    right before a word starting with a digit (the context rules join a
+    word and a following number).
+
+    Args:
+        text: Text as returned by preprocess_text (single spaces)
+        shard_chars: Target shard size in characters
+
+    Returns:
+        List of shards; joined with single spaces they give back text
+    """
+    shards = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = start + shard_chars
+        if end >= length:
+            shards.append(text[start:])
+            break
+        # Cut at the first sentence end after the target size
+        while True:
+            end = text.find(' ', end)
+            if end < 0:
+                end = length
+                break
+            if text[end - 1] in SENTENCE_TERMINATORS and not text[end + 1:end + 2].isdigit():
+                break
+            end += 1
+        shards.append(text[start:end])
+        start = end + 1
+    return shards
+
+
+def _context_independent():
+    """Whether every context disambiguation gives the same word in every context"""
+    return all(len(set(contexts.values())) == 1 for contexts in CONTEXT_DISAMBIGUATIONS.values())
+
+
+def _shards_consistent(shards, results):
+    """
+    Whether the shard results are known to match the serial result
+
+    The context stage only disambiguates words when the whole document
+    keeps its word count through transliteration, and the capitalization
+    stages treat each shard start as a sentence start, which holds when the
+    previous shard's result ends a sentence.
+    """
+    for index, (shard, result) in enumerate(zip(shards, results)):
+        if len(shard.split()) != len(result.split()):
+            return False
+        if index < len(shards) - 1 and not _SENTENCE_END.search(result):
+            return False
+        if index > 0 and result[:1].isdigit():
+            return False
+    return True
+
+
+# Worker side
+
+def _init_shard_worker(language):
+    from .enhanced_transliteration import get_transliterator
+
+    get_transliterator(language)
+
+def _transliterate_shard(task):
+    from .enhanced_transliteration import get_transliterator
+
+    language, features, text, first = task
+    # Multi-shard documents end a sentence before the last shard, so they are never titles
+    return get_transliterator(language).transliterate_preprocessed(
+        text, features, is_title=False, capitalize_start=first)
+
+
+def get_pool(language, workers):
+    """Shared process pool whose workers have an engine for language (see parallel.shared_pool)"""
+    return shared_pool(('shard', language, workers), workers, _init_shard_worker, (language,))
+
+
+def transliterate_parallel(text, language='hindi', features=None, workers=None,
+                           shard_chars=None, min_chars=PARALLEL_MIN_CHARS):
+    """
+    Transliterate a document in sentence shards across worker processes
+
+    Gives the same result as EnhancedTransliterator(language).transliterate(text,
+    features). Short documents, documents without usable sentence boundaries
+    and documents whose shard results cannot be verified against the serial
+    pipeline are transliterated in this process.
+
+    Args:
+        text: Input text in Hindi/Marathi
+        language: 'hindi' or 'marathi'
+        features: Dict of feature flags
+        workers: Number of worker processes (default: CPU count)
+        shard_chars: Shard size in characters (default: adapted to the
+            document length and the number of workers)
+        min_chars: Documents shorter than this are not sharded
+
+    Returns:
+        Transliterated text
+    """
+    from .enhanced_transliteration import get_transliterator
+
+    workers = workers or default_workers()
+    if not text or workers < 2 or len(text) < min_chars or not _context_independent():
+        return get_transliterator(language).transliterate(text, features)
+
+    preprocessed = preprocess_text(text)
+    shards = sentence_shards(preprocessed, shard_chars or shard_size(len(preprocessed), workers))
+    if len(shards) < 2:
+        return get_transliterator(language).transliterate(text, features)
+
+    tasks = [(language, features, shard, index == 0) for index, shard in enumerate(shards)]
+    pool = get_pool(language, workers)
+    try:
+        results = list(pool.map(_transliterate_shard, tasks))
+    except BrokenProcessPool:
+        # A worker died; give later documents a fresh pool and do this one here
+        discard_shared_pool(('shard', language, workers), pool)
+        return get_transliterator(language).transliterate(text, features)
+    if not _shards_consistent(shards, results):
+        return get_transliterator(language).transliterate(text, features)
+    return ' '.join(results)
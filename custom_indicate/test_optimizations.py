@@ -0,0 +1,1088 @@
+"""
+Tests for the performance-oriented engine components.
+These check that optimized structures give the same answers as the
+straightforward implementations they replace.
+"""
+
+import contextlib
+import csv
+import io
+import json
+import os
+import pstats
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+import zipfile
+
+from custom_indicate.ab_testing import ABTester, EngineConfig, RegressionTester
+from custom_indicate.auto_capitalization import AutoCapitalizer
+from custom_indicate.bulk import (
+    check_outputs,
+    chunk_ranges,
+    expand_inputs,
+    transliterate_files,
+    transliterate_mapped_file
+)
+from custom_indicate.columnar import ColumnTransliterator, transliterate_csv
+from custom_indicate.daemon import DaemonClient, recv_message, send_message
+from custom_indicate.documents import (
+    check_document,
+    iter_docx_paragraphs,
+    iter_pdf_pages,
+    pdf_page_count,
+
+    spool_upload,
+    stream_transliterated_document
+)
+from custom_indicate.edit_distance import levenshtein, levenshtein_batch
+from custom_indicate.enhanced_transliteration import EnhancedTransliterator, get_transliterator
+from custom_indicate.exception_detection import ExceptionDetector
+from custom_indicate.gazetteer import Gazetteer, compile_gazetteer, load_gazetteer
+from custom_indicate.language_pack import (
+    build_pack_data,
+    compile_language_pack,
+    load_language_pack,
+    read_language_pack
+)
+from custom_indicate.mapped_table import MappedTable, write_table
+from custom_indicate.parallel import shared_pool, shutdown_shared_pools
+from custom_indicate.phonetic_refinement import PhoneticRuleRefiner
+from custom_indicate.profiling import PipelineProfiler, _stage_of, percentile
+from custom_indicate.result_cache import ResultCache, engine_fingerprint
+from custom_indicate.schwa_lexicon import SchwaLexicon, build_lexicon
+from custom_indicate.sharding import sentence_shards, transliterate_parallel
+from custom_indicate import warmup
+from custom_indicate.warmup import is_ready, mark_ready, start_warm_up, warm_up
+from custom_indicate.test_transliteration import (
+    TransliterationTestDataset,
+    TransliterationTestRunner
+)
+from custom_indicate.schwa_deletion import (
+    SCHWA_EXCEPTIONS_TABLE,
+    apply_schwa_rules,
+    apply_statistical_schwa_deletion,
+    calculate_schwa_deletion_probability,
+    delete_schwa,
+    score_schwa_deletion,
+    syllabify
+)
+
+
+class TestGazetteer(unittest.TestCase):
+    """Tests for the proper-noun gazetteer"""
+
+    def setUp(self):
+        self.gazetteer = Gazetteer(['ram', 'Sita'], ['pur', 'nagar'])
+
+    def test_exact_names(self):
+        """Names match whole tokens, case-insensitively"""
+        self.assertTrue(self.gazetteer.is_name('Ram'))
+        self.assertTrue(self.gazetteer.is_name('sita'))
+        self.assertFalse(self.gazetteer.is_name('rama'))
+
+    def test_place_suffixes(self):
+        """Suffix rules need at least one letter before the suffix"""
+        self.assertTrue(self.gazetteer.has_place_suffix('jaipur'))
+        self.assertTrue(self.gazetteer.has_place_suffix('Ahmednagar'))
+        self.assertFalse(self.gazetteer.has_place_suffix('pur'))
+        self.assertFalse(self.gazetteer.has_place_suffix('jai2pur'))
+
+    def test_compiled_gazetteer(self):
+        """A memory-mapped gazetteer answers like the in-memory one"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'names.gaz')
+            compile_gazetteer(['ram', 'Sita'], ['pur', 'nagar'], path)
+            mapped = Gazetteer.from_compiled(path)
+            for token in ['ram', 'RAM', 'sita', 'rama', 'jaipur', 'pur', '']:
+                self.assertEqual(mapped.is_proper_noun(token),
+                                 self.gazetteer.is_proper_noun(token), token)
+            mapped._table.close()
+
+    def test_corrupt_compiled_gazetteer_falls_back_to_source(self):
+        """A truncated compiled table is ignored in favour of the source list"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'names.json')
+            with open(source, 'w', encoding='utf-8') as f:
+                json.dump({'names': ['ram', 'sita'], 'place_suffixes': ['pur']}, f)
+            compiled = os.path.join(tmp, 'names.gaz')
+            compile_gazetteer(['ram', 'sita'], ['pur'], compiled)
+            with open(compiled, 'r+b') as f:
+                f.truncate(os.path.getsize(compiled) - 3)
+
+            gazetteer = load_gazetteer(source)
+            self.assertTrue(gazetteer.is_name('Sita'))
+            self.assertTrue(gazetteer.has_place_suffix('jaipur'))
+
+    def test_capitalize_proper_nouns(self):
+        """Capitalizer uses the default gazetteer for names and places"""
+        capitalizer = AutoCapitalizer('hindi')
+        result = capitalizer.capitalize_proper_nouns('ram went to jaipur with dr. sharma')
+        self.assertEqual(result, 'Ram went to Jaipur with dr. Sharma')
+
+
+class TestMappedTable(unittest.TestCase):
+    """Tests for the memory-mapped lookup table"""
+
+    def test_round_trip(self):
+        """Every written key can be read back and missing keys are absent"""
+        items = [(f'शब्द{i}', f'shabd{i}') for i in range(1000)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'table.bin')
+            write_table(path, items, meta={'language': 'hindi'})
+            table = MappedTable(path)
+            self.assertEqual(len(table), 1000)
+            self.assertEqual(table.meta, {'language': 'hindi'})
+            for key, value in items:
+                self.assertEqual(table.get(key), value)
+            self.assertIsNone(table.get('missing'))
+            self.assertNotIn('शब्द1000', table)
+            table.close()
+
+    def test_truncated_table(self):
+        """Truncated, extended or empty files raise ValueError instead of struct.error"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'table.bin')
+            write_table(path, [(f'key{i}', f'value{i}') for i in range(100)])
+            size = os.path.getsize(path)
+            for length in [size + 1, size - 1, size // 2, 10, 0]:
+                with open(path, 'r+b') as f:
+                    f.truncate(length)
+                with self.assertRaises(ValueError):
+                    MappedTable(path)
+
+
+class TestSchwaEngine(unittest.TestCase):
+    """Tests for the compiled schwa deletion engine"""
+
+    def test_matches_pattern_table(self):
+        """The fused tail match agrees with applying every pattern in order"""
+        words = ['kamala', 'namaka', 'sahaya', 'dharma', 'ka', 'a', '', 'raama',
+                 'kitaba,', 'ghara', 'shuddha', 'aaya', 'mana', 'vana', 'kxa']
+        originals = [None, 'राम'] + SCHWA_EXCEPTIONS_TABLE['abnormal_deletion'] \
+            + SCHWA_EXCEPTIONS_TABLE['abnormal_retention']
+        for word in words:
+            for original in originals:
+                self.assertEqual(delete_schwa(word, original),
+                                 apply_statistical_schwa_deletion(word, original),
+                                 (word, original))
+
+    def test_apply_schwa_rules(self):
+        """Word-by-word application keeps unmatched trailing words"""
+        self.assertEqual(apply_schwa_rules('kamala ghara'), 'kamal ghar')
+        self.assertEqual(apply_schwa_rules('kamala ghara', 'कमल'), 'kamala ghara')
+
+
+class TestSyllabifier(unittest.TestCase):
+    """Tests for the table-driven syllabifier and batch scoring"""
+
+    def test_syllabify(self):
+        """Matras, virama clusters and marks stay with their consonant"""
+        self.assertEqual(syllabify('नमस्ते'), ['न', 'म', 'स्ते'])
+        self.assertEqual(syllabify('हिन्दी'), ['हि', 'न्दी'])
+        self.assertEqual(syllabify('संसार'), ['सं', 'सा', 'र'])
+        self.assertEqual(syllabify('a1'), ['a', '1'])
+        self.assertEqual(syllabify(''), [])
+
+    def test_batch_scoring_matches_scalar(self):
+        """Batch probabilities equal the per-position calculation"""
+        words = ['कमल', 'नमस्ते', 'हिन्दी', 'अनुभव', '', 'क्षत्रिय', 'राम।', 'संसार']
+        for word, batch in zip(words, score_schwa_deletion(words)):
+            expected = [calculate_schwa_deletion_probability(word, i)
+                        for i in range(len(syllabify(word)))]
+            self.assertEqual([float(p) for p in batch], [float(p) for p in expected], word)
+
+
+class TestSchwaLexicon(unittest.TestCase):
+    """Tests for the precomputed schwa lexicon"""
+
+    def test_lexicon_matches_rules(self):
+        """Engine output is the same with and without the lexicon"""
+        text = "मेरा नाम राहुल है। मैं भारत से हूँ। कमल नमस्ते दुनिया"
+        transliterator = EnhancedTransliterator('hindi')
+        transliterator.schwa_lexicon = None
+        expected = transliterator.transliterate(text)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'hindi_schwa.lex')
+            self.assertEqual(build_lexicon(text.split(), 'hindi', path),
+                             len(set(text.split())))
+            transliterator.schwa_lexicon = SchwaLexicon(path)
+            self.assertEqual(transliterator.schwa_lexicon.get('कमल'), 'Kamal')
+            self.assertEqual(transliterator.transliterate(text), expected)
+            transliterator.schwa_lexicon.close()
+
+
+class TestCompiledPhoneticRules(unittest.TestCase):
+    """Tests for the compiled phonetic rule engine"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.refiner = PhoneticRuleRefiner('hindi', os.path.join(self.tmp.name, 'rules.json'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def reference_apply(self, text):
+        """Apply every rule in weight order with plain re.sub"""
+        for category, rules in self.refiner.refined_rules.items():
+            for pattern, replacement in sorted(
+                rules,
+                key=lambda x: self.refiner.rule_weights.get((category, x[0]), 0.0),
+                reverse=True
+            ):
+                text = re.sub(pattern, replacement, text)
+        return text
+
+    def test_matches_sequential_application(self):
+        """Merged literal rules give the same text as one re.sub per rule"""
+        for text in ['raamaa aur seetaa', 'kshatriya dharm', 'aaee ooaa aai', 'bhaarat', '']:
+            self.assertEqual(self.refiner.apply_rules(text), self.reference_apply(text), text)
+
+    def test_recompiles_on_change(self):
+        """Adding rules or changing weights takes effect immediately"""
+        self.assertEqual(self.refiner.apply_rules('kamal'), 'kamal')
+        self.refiner.add_rule('vowel_rules', 'am', 'um')
+        self.assertEqual(self.refiner.apply_rules('kamal'), 'kumal')
+        self.refiner.add_rule('vowel_rules', 'ku', 'qu')
+        self.refiner.rule_weights[('vowel_rules', 'ku')] = 5.0
+        self.assertEqual(self.refiner.apply_rules('kamal'), 'kumal')
+        self.refiner.rule_weights[('vowel_rules', 'ku')] = -5.0
+        self.assertEqual(self.refiner.apply_rules('kamal'), 'qumal')
+
+
+class TestParallelTraining(unittest.TestCase):
+    """Tests for training phonetic rules in worker processes"""
+
+    def test_matches_serial_refinement(self):
+        """Parallel training ends with the same rules and weights as the serial pass"""
+        words = ['raamaa', 'seetaa', 'kshatriya', 'bhaarat', 'paanee', 'kamal']
+        examples = []
+        for i, word in enumerate(words * 20):
+            if i % 3 == 0:
+                expected = word[:2] + ('i' if word[2] in 'aeiou' else 't') + word[3:]
+            else:
+                expected = word.replace('aa', 'ā')
+            examples.append((word, expected))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            serial = PhoneticRuleRefiner('hindi', os.path.join(tmp, 'serial.json'))
+            parallel = PhoneticRuleRefiner('hindi', os.path.join(tmp, 'parallel.json'))
+            serial.refine_rules_from_examples(examples)
+            report = parallel.train_from_examples(examples, workers=2, chunk_size=25, progress=False)
+
+            self.assertEqual(report['examples'], len(examples))
+            self.assertGreater(report['new_rules'], 0)
+            self.assertEqual(parallel.refined_rules, serial.refined_rules)
+            self.assertEqual(dict(parallel.rule_weights), dict(serial.rule_weights))
+
+
+class TestSyntheticCorpus(unittest.TestCase):
+    """Tests for the seeded benchmark corpus generator"""
+
+    def test_learned_words_only_when_passed(self):
+        """The vocabulary depends on the seed, not on the live learned exception files"""
+        from benchmarks.synthetic import SyntheticCorpus
+
+        first = SyntheticCorpus(vocabulary_size=3000, seed=5)
+        self.assertEqual(first.vocabulary, SyntheticCorpus(vocabulary_size=3000, seed=5).vocabulary)
+        self.assertNotIn('अनोखाशब्द', first.vocabulary)
+        learned = SyntheticCorpus(vocabulary_size=3000, seed=5, learned_words=['अनोखाशब्द'])
+        self.assertIn('अनोखाशब्द', learned.vocabulary)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Tests for the benchmark suite helpers"""
+
+    def test_nearest_rank_percentile(self):
+        self.assertEqual(percentile(list(range(1, 11)), 0.50), 5)
+        self.assertEqual(percentile([1, 2], 0.50), 1)
+        self.assertEqual(percentile([1, 2, 3, 4], 0.25), 1)
+        self.assertEqual(percentile([1, 2, 3, 4], 0.75), 3)
+        self.assertEqual(percentile(list(range(1, 101)), 0.99), 99)
+        self.assertEqual(percentile([1, 2, 3], 0.50), 2)
+        self.assertEqual(percentile([7], 0.99), 7)
+        self.assertEqual(percentile([1, 2], 0.0), 1)
+        self.assertEqual(percentile([1, 2], 1.0), 2)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_one_percentile_implementation(self):
+        """The suite, the load test and A/B comparisons report the same percentiles"""
+        import custom_indicate.ab_testing
+        from benchmarks import loadtest, suite
+
+        for module in [suite, loadtest, custom_indicate.ab_testing]:
+            self.assertIs(module.percentile, percentile, module.__name__)
+
+
+class TestEditDistance(unittest.TestCase):
+    """Tests for the bit-parallel edit distance"""
+
+    def reference_distance(self, a, b):
+        """Full-matrix Levenshtein distance"""
+        previous = list(range(len(b) + 1))
+        for i, char_a in enumerate(a, 1):
+            current = [i]
+            for j, char_b in enumerate(b, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (char_a != char_b)))
+            previous = current
+        return previous[-1]
+
+    def test_matches_reference(self):
+        """Scalar and batch distances equal the dynamic-programming result"""
+        rnd = random.Random(0)
+        actuals, expecteds = [], []
+        for _ in range(300):
+            alphabet = rnd.choice(['ab', 'abcdeकख'])
+            actuals.append(''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 80))))
+            expecteds.append(''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 80))))
+
+        expected = [self.reference_distance(a, b) for a, b in zip(actuals, expecteds)]
+        self.assertEqual([levenshtein(a, b) for a, b in zip(actuals, expecteds)], expected)
+        self.assertEqual(levenshtein_batch(actuals, expecteds), expected)
+
+    def test_known_distances(self):
+        self.assertEqual(levenshtein('kitten', 'sitting'), 3)
+        self.assertEqual(levenshtein('', 'abc'), 3)
+        self.assertEqual(levenshtein('namaste', 'namaste'), 0)
+        self.assertEqual(levenshtein_batch(['Kamal', ''], ['kamal', '']), [1, 0])
+
+
+class TestStreamingTestRunner(unittest.TestCase):
+    """Tests for JSONL datasets and parallel test runs"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        dataset = TransliterationTestDataset('sample', 'hindi')
+        dataset.metadata = {'source': 'test'}
+        for i, (original, expected) in enumerate([('नमस्ते', 'Namaste'), ('कमल', 'Kamal'),
+                                                  ('भारत', 'Bharat'), ('दुनिया', 'wrong')] * 5):
+            dataset.add_test_case(original, expected, category=f'c{i % 2}')
+        self.path = os.path.join(self.tmp.name, 'sample.jsonl')
+        dataset.save_to_jsonl(self.path)
+        self.cases = dataset.test_cases
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load(self):
+        dataset = TransliterationTestDataset('sample', 'hindi')
+        self.assertTrue(dataset.load_from_file(self.path))
+        return dataset
+
+    def test_jsonl_round_trip(self):
+        """JSONL datasets stream back every case and the metadata"""
+        dataset = self.load()
+        self.assertEqual(dataset.metadata, {'source': 'test'})
+        self.assertEqual(dataset.test_cases, [])
+        self.assertEqual(list(dataset.iter_test_cases()), self.cases)
+        self.assertEqual(len(dataset.filter_by_category('c1')), 10)
+
+    def test_parallel_matches_serial(self):
+        """Worker processes give the same statistics and ordered failures"""
+        runner = TransliterationTestRunner(EnhancedTransliterator('hindi'), [self.load()])
+        serial = runner.run_tests(chunk_size=3)['sample']
+        parallel = runner.run_tests(workers=2, chunk_size=3, keep_results='failures',
+                                    max_failures=2)['sample']
+
+        self.assertEqual(serial['total_cases'], 20)
+        self.assertEqual(len(serial['detailed_results']), 20)
+        for key in ('total_cases', 'passed_cases', 'average_char_accuracy', 'average_word_accuracy'):
+            self.assertEqual(parallel[key], serial[key], key)
+
+        failures = [r for r in serial['detailed_results'] if not r['passed']]
+        self.assertEqual(parallel['detailed_results'], failures[:2])
+        self.assertEqual(parallel['dropped_failures'], len(failures) - 2)
+
+    def test_result_cache(self):
+        """Unchanged cases are reused; new flags or engine data recompute them"""
+        transliterator = EnhancedTransliterator('hindi')
+        runner = TransliterationTestRunner(transliterator, [self.load()])
+        cache = ResultCache(os.path.join(self.tmp.name, 'results.db'))
+
+        first = runner.run_tests(cache=cache)['sample']
+        self.assertEqual((first['cached_cases'], first['computed_cases']), (0, 20))
+        # Repeated inputs are stored once
+        self.assertEqual(len(cache), 4)
+
+        second = runner.run_tests(cache=cache)['sample']
+        self.assertEqual((second['cached_cases'], second['computed_cases']), (20, 0))
+        for key in ('passed_cases', 'average_char_accuracy', 'average_word_accuracy'):
+            self.assertEqual(second[key], first[key], key)
+
+        flags = runner.run_tests(cache=cache, feature_flags={'auto_capitalization': False})['sample']
+        self.assertEqual(flags['computed_cases'], 20)
+
+        fingerprint = engine_fingerprint(transliterator)
+        transliterator.exception_detector.exceptions = dict(
+            transliterator.exception_detector.exceptions, कमल='kamala')
+        self.assertNotEqual(engine_fingerprint(transliterator), fingerprint)
+        cache.close()
+
+
+class TestComparisonTools(unittest.TestCase):
+    """Tests for the A/B and regression comparison tools"""
+
+    def test_ab_comparison(self):
+        """Configurations run in separate processes and differences are reported"""
+        transliterator = EnhancedTransliterator('hindi')
+        flags = {'auto_capitalization': False}
+        texts = ['मेरा नाम राहुल है। मैं भारत से हूँ।', 'भारत']
+        expected = [transliterator.transliterate(text) for text in texts]
+        without_caps = [transliterator.transliterate(text, flags) for text in texts]
+        self.assertNotEqual(expected, without_caps)
+
+        dataset = TransliterationTestDataset('sample', 'hindi')
+        for text, output in zip(texts, expected):
+            dataset.add_test_case(text, output)
+
+        tester = ABTester(EngineConfig('default'), EngineConfig('no caps', feature_flags=flags),
+                          dataset, throughput_threshold=1.0)
+        comparison = tester.run_comparison()
+
+        self.assertEqual(tester.results_a['outputs'], expected)
+        self.assertEqual(tester.results_b['outputs'], without_caps)
+        self.assertEqual(tester.results_a['passed_cases'], 2)
+        self.assertGreater(tester.results_a['words_per_sec'], 0)
+        self.assertEqual(comparison['b_worse_cases'],
+                         sum(1 for a, b in zip(expected, without_caps) if a != b))
+        self.assertTrue(comparison['accuracy_regressed'])
+        self.assertFalse(comparison['passed'])
+        self.assertIn('FAIL', tester.generate_comparison_report())
+
+    def test_regression_thresholds(self):
+        """Throughput is compared relatively, accuracy in absolute points"""
+        baseline = {'average_char_accuracy': 0.9, 'average_word_accuracy': 0.8, 'words_per_sec': 1000.0}
+        tester = RegressionTester(baseline, throughput_threshold=0.1, accuracy_threshold=0.01)
+
+        comparison = tester.compare_with_baseline(dict(baseline, words_per_sec=950.0))
+        self.assertTrue(comparison['passed'])
+        self.assertEqual(comparison['unchanged'], RegressionTester.METRICS)
+
+        comparison = tester.compare_with_baseline(dict(baseline, words_per_sec=800.0,
+                                                       average_char_accuracy=0.95))
+        self.assertEqual(comparison['regressed'], ['words_per_sec'])
+        self.assertEqual(comparison['improved'], ['average_char_accuracy'])
+        self.assertFalse(comparison['passed'])
+
+
+class TestLanguagePack(unittest.TestCase):
+    """Tests for compiled language packs"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'hindi.pack')
+        compile_language_pack('hindi', self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _patch_byte(self, offset):
+        with open(self.path, 'r+b') as f:
+            f.seek(offset)
+            value = f.read(1)[0]
+            f.seek(offset)
+            f.write(bytes([value ^ 0xFF]))
+
+    def test_round_trip(self):
+        from custom_indicate.char_maps import HINDI_CHARS
+
+        data = read_language_pack(self.path, 'hindi')
+        self.assertEqual(data, build_pack_data('hindi'))
+        self.assertEqual(data['char_map'], HINDI_CHARS)
+        self.assertEqual(data['exceptions']['अच्छा'], 'accha')
+
+    def test_bad_packs_are_rebuilt(self):
+        """Corrupt and stale packs are rejected, and loading writes a valid pack back"""
+        self._patch_byte(os.path.getsize(self.path) - 1)
+        with self.assertRaisesRegex(ValueError, 'checksum'):
+            read_language_pack(self.path, 'hindi')
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(load_language_pack('hindi', self.path), build_pack_data('hindi'))
+        self.assertEqual(read_language_pack(self.path, 'hindi'), build_pack_data('hindi'))
+
+        # The source fingerprint starts right after magic, version and reserved fields
+        self._patch_byte(8)
+        with self.assertRaisesRegex(ValueError, 'stale'):
+            read_language_pack(self.path, 'hindi')
+        with self.assertRaisesRegex(ValueError, 'stale'):
+            read_language_pack(self.path, 'marathi')
+
+        missing = os.path.join(self.tmp.name, 'marathi.pack')
+        self.assertEqual(load_language_pack('marathi', missing), build_pack_data('marathi'))
+        self.assertTrue(os.path.exists(missing))
+
+    def test_engine_reads_only_the_pack(self):
+        """With packs in place, the engine and converters never import the source maps"""
+        source = ("import sys; from custom_indicate import EnhancedTransliterator, hindi2english; "
+                  "print(EnhancedTransliterator('marathi').transliterate('नमस्ते भारत'), "
+                  "hindi2english('नमस्ते')); "
+                  "print('custom_indicate.char_maps' in sys.modules)")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for _ in range(2):
+            # The first run may have to (re)build the packs
+            output = subprocess.run([sys.executable, '-c', source], capture_output=True,
+                                    text=True, encoding='utf-8', cwd=root, check=True).stdout
+        self.assertEqual(output.splitlines()[-1], 'False')
+
+    def test_engine_data(self):
+        """Engines share the pack data and see named entities added at runtime"""
+        from custom_indicate.exceptions import NAMED_ENTITIES
+        from custom_indicate.transliterate import HINDI_CHARS, MARATHI_CHARS
+
+        self.assertIs(EnhancedTransliterator('hindi').char_map, load_language_pack('hindi')['char_map'])
+        self.assertEqual(EnhancedTransliterator('hindi').char_map, HINDI_CHARS)
+        self.assertEqual(EnhancedTransliterator('marathi').char_map, MARATHI_CHARS)
+
+        transliterator = EnhancedTransliterator('hindi')
+        NAMED_ENTITIES['अनोखानाम'] = 'Anokhanaam'
+        try:
+            self.assertEqual(transliterator.transliterate('अनोखानाम'), 'Anokhanaam')
+        finally:
+            del NAMED_ENTITIES['अनोखानाम']
+
+
+class TestLazyImports(unittest.TestCase):
+    """Tests for lazy loading of the package's public names"""
+
+    def test_basic_import_stays_light(self):
+        """Importing hindi2english does not load the enhanced engine or NumPy"""
+        source = ("import sys; from custom_indicate import hindi2english; "
+                  "print(hindi2english('नमस्ते')); "
+                  "print(' '.join(m for m in ('custom_indicate.enhanced_transliteration', 'numpy') "
+                  "if m in sys.modules))")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, '-c', source], capture_output=True,
+                                text=True, encoding='utf-8', cwd=root, check=True).stdout
+        transliterated, loaded = (output.splitlines() + [''])[:2]
+        self.assertTrue(transliterated)
+        self.assertEqual(loaded, '')
+
+    def test_public_names_resolve(self):
+        import custom_indicate
+        from custom_indicate.enhanced_transliteration import EnhancedTransliterator as engine_class
+
+        self.assertIs(custom_indicate.EnhancedTransliterator, engine_class)
+        for name in custom_indicate.__all__:
+            self.assertTrue(callable(getattr(custom_indicate, name)))
+        self.assertIn('capitalize_text', dir(custom_indicate))
+        with self.assertRaises(AttributeError):
+            custom_indicate.no_such_name
+
+
+class TestWarmup(unittest.TestCase):
+    """Tests for the shared engines and pre-fork warm-up"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_warm_up_marks_ready(self):
+        status = warm_up(['hindi'], freeze=False)
+        self.assertTrue(is_ready())
+        self.assertEqual(status['languages'], ['hindi'])
+        self.assertIs(get_transliterator('hindi'), get_transliterator('hindi'))
+
+    def test_ready_without_preload_warm_up(self):
+        """Skipped warm-up reports ready; otherwise warm-up can start in the background"""
+        saved = dict(warmup._status)
+        self.addCleanup(warmup._status.update, saved)
+
+        warmup._status['ready'] = False
+        self.assertTrue(mark_ready()['skipped'])
+        self.assertTrue(is_ready())
+        self.assertFalse(start_warm_up(languages=['hindi'], freeze=False))
+
+        warmup._status.update({'ready': False, 'skipped': False})
+        self.assertTrue(start_warm_up(languages=['hindi'], freeze=False))
+        self.assertFalse(start_warm_up(languages=['hindi'], freeze=False))
+        warmup._thread.join()
+        self.assertTrue(is_ready())
+        self.assertEqual(warmup.warmup_status()['languages'], ['hindi'])
+
+    def test_shared_engine_reloads_learned_exceptions(self):
+        transliterator = get_transliterator('hindi')
+        before = transliterator.transliterate('कमल')
+
+        detector = ExceptionDetector('hindi')
+        detector.add_exception('कमल', 'Kamall')
+        detector.save_exceptions()
+
+        self.assertIs(get_transliterator('hindi'), transliterator)
+        self.assertNotEqual(before, 'Kamall')
+        self.assertEqual(transliterator.transliterate('कमल'), 'Kamall')
+
+
+class TestBulkTransliteration(unittest.TestCase):
+    """Tests for line-by-line bulk transliteration of files"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.inputs = []
+        texts = {'a.txt': 'मेरा नाम राहुल है।\r\n\r\nमैं भारत से हूँ।\r\n' * 40,
+                 'b.txt': 'नमस्ते दुनिया\nकल मैं दिल्ली गया था',
+                 'empty.txt': ''}
+        for name, text in texts.items():
+            path = os.path.join(self.tmp.name, name)
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            self.inputs.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, output_dir, jobs):
+        transliterate_files(self.inputs, output_dir=output_dir, jobs=jobs, batch_lines=7)
+        outputs = {}
+        for name in sorted(os.listdir(output_dir)):
+            with open(os.path.join(output_dir, name), encoding='utf-8', newline='') as f:
+                outputs[name] = f.read()
+        return outputs
+
+    def test_parallel_matches_serial(self):
+        serial = self._run(os.path.join(self.tmp.name, 'serial'), jobs=1)
+        parallel = self._run(os.path.join(self.tmp.name, 'parallel'), jobs=2)
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial['empty.txt'], '')
+        self.assertEqual(serial['a.txt'].count('\r\n'), 120)
+        self.assertTrue(serial['b.txt'].startswith('Namaste'))
+        self.assertFalse(serial['b.txt'].endswith('\n'))
+
+    def test_inputs_and_outputs(self):
+        paths, missing = expand_inputs([os.path.join(self.tmp.name, '*.txt'), '-', 'no-such-*.txt'])
+        self.assertEqual(paths, sorted(self.inputs) + ['-'])
+        self.assertEqual(missing, ['no-such-*.txt'])
+
+        errors = check_outputs(paths, self.tmp.name)
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(check_outputs(self.inputs, os.path.join(self.tmp.name, 'out')), [])
+
+    def test_chunk_ranges(self):
+        data = ('नमस्ते दुनिया\r\n' * 50 + 'क' * 300 + ' अंत').encode('utf-8')
+        ranges = list(chunk_ranges(data, 100))
+
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(data))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertIn(data[end - 1:end], (b'\n', b' '))
+        for start, end in ranges:
+            data[start:end].decode('utf-8')
+        # The stretch without whitespace makes one long chunk
+        self.assertGreater(max(end - start for start, end in ranges), 900)
+
+    def test_mapped_file_matches_line_mode(self):
+        expected = self._run(os.path.join(self.tmp.name, 'lines'), jobs=1)
+        for jobs in (1, 2):
+            for path in self.inputs:
+                output = os.path.join(self.tmp.name, f'{jobs}-{os.path.basename(path)}')
+                stats = transliterate_mapped_file(path, output, jobs=jobs, chunk_size=64)
+                with open(output, encoding='utf-8', newline='') as f:
+                    self.assertEqual(f.read(), expected[os.path.basename(path)])
+        self.assertEqual(stats['chunks'], 0)
+        with self.assertRaises(ValueError):
+            transliterate_mapped_file(self.inputs[0], self.inputs[0])
+
+
+class TestColumnTransliteration(unittest.TestCase):
+    """Tests for deduplicated column transliteration"""
+
+    class CountingEngine:
+        def __init__(self):
+            self.engine = EnhancedTransliterator('hindi')
+            self.calls = []
+
+        def transliterate(self, text, features=None):
+            self.calls.append(text)
+            return self.engine.transliterate(text, features)
+
+    def test_distinct_values_transliterated_once(self):
+        engine = self.CountingEngine()
+        column = ['राहुल', 'भारत', None, 'राहुल', '', 'भारत', 'राहुल', 7]
+        results = ColumnTransliterator(transliterator=engine).transliterate(column, 'name')
+
+        self.assertEqual(sorted(engine.calls), sorted(['राहुल', 'भारत']))
+        self.assertEqual(results[0], engine.engine.transliterate('राहुल'))
+        self.assertEqual(results[2:5], [None, results[0], ''])
+        self.assertEqual(results[-1], 7)
+
+    def test_missing_values_not_cached(self):
+        """NaN, None and blank cells pass through without filling the cache or the counts"""
+        import numpy as np
+
+        transliterator = ColumnTransliterator()
+        column = np.array([np.nan] * 1000 + ['राहुल'] * 10 + [None, '  '], dtype=object)
+        results = transliterator.transliterate(column, 'name')
+
+        self.assertEqual(len(transliterator.cache), 1)
+        self.assertTrue(all(np.isnan(value) for value in results[:1000]))
+        self.assertEqual(list(results[-2:]), [None, '  '])
+        stats = transliterator.report()['name']
+        self.assertEqual((stats['rows'], stats['values'], stats['transliterated']), (1012, 10, 1))
+        self.assertEqual(stats['dedup_ratio'], 10)
+
+    def test_numpy_column(self):
+        import numpy as np
+
+        column = np.array([['राहुल', 'भारत'], ['भारत', None]], dtype=object)
+        results = ColumnTransliterator().transliterate(column)
+        self.assertEqual(results.shape, (2, 2))
+        self.assertEqual(results.dtype, object)
+        self.assertEqual(results[0, 1], results[1, 0])
+        self.assertIsNone(results[1, 1])
+
+    def test_csv_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'people.csv')
+            with open(source, 'w', encoding='utf-8', newline='') as f:
+                f.write('id,name,city\n')
+                for i in range(25):
+                    f.write(f"{i},{['राहुल', 'सीता'][i % 2]},दिल्ली\n")
+                f.write('25,राहुल\n')
+
+            output = os.path.join(tmp, 'out.csv')
+            report = transliterate_csv(source, output, ['name', 'city'], suffix='_en', chunk_rows=4)
+            with open(output, encoding='utf-8', newline='') as f:
+                rows = list(csv.reader(f))
+
+            self.assertEqual(rows[0], ['id', 'name', 'name_en', 'city', 'city_en'])
+            self.assertEqual(len(rows), 27)
+            self.assertEqual(rows[1][2], rows[3][2])
+            self.assertEqual(rows[-1][3:], ['', ''])
+            self.assertEqual(report['rows'], 26)
+            self.assertEqual(report['name']['transliterated'], 2)
+            # The short last row's blank city is not a value
+            self.assertEqual(report['city']['transliterated'], 1)
+            self.assertEqual(report['city']['values'], 25)
+            self.assertEqual(report['city']['chunk_distinct'], 7)
+
+            with self.assertRaisesRegex(ValueError, 'address'):
+                transliterate_csv(source, output, ['address'])
+
+
+class TestSharding(unittest.TestCase):
+    """Tests for sentence-sharded parallel transliteration"""
+
+    def test_shards_end_at_sentences(self):
+        text = 'राम घर गया। 2024 में वह आया. क्या हुआ? कुछ नहीं! ' * 20
+        text = text.strip()
+        shards = sentence_shards(text, 30)
+        self.assertGreater(len(shards), 10)
+        self.assertEqual(' '.join(shards), text)
+        for shard, following in zip(shards, shards[1:]):
+            self.assertIn(shard[-1], '।.?!')
+            self.assertFalse(following[0].isdigit())
+
+    def test_matches_serial(self):
+        """Sharded output is identical to serial output, including fallbacks"""
+        from benchmarks.corpora import adversarial, paragraphs
+
+        texts = [' '.join(paragraphs(10)),
+                 'राम घर गया। श्री. पाटील आले। डॉ. शर्मा ने कहा। क्या? हाँ! ' * 30]
+        texts += [text for text in adversarial(100) if text]
+        for language in ['hindi', 'marathi']:
+            transliterator = get_transliterator(language)
+            for features in [None, {'auto_capitalization': False}, {'context_aware': False}]:
+                for text in texts:
+                    self.assertEqual(
+                        transliterate_parallel(text, language, features, workers=2,
+                                               shard_chars=200, min_chars=0),
+                        transliterator.transliterate(text, features))
+
+    def test_short_text_serial(self):
+        text = 'मेरा नाम राहुल है।'
+        self.assertEqual(transliterate_parallel(text, workers=2),
+                         get_transliterator('hindi').transliterate(text))
+
+    def test_shared_pool_created_once(self):
+        """Concurrent first requests get one spawned pool per key"""
+        self.addCleanup(shutdown_shared_pools)
+        pools = []
+        threads = [threading.Thread(target=lambda: pools.append(shared_pool(('test', 2), 2)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(pool) for pool in pools}), 1)
+        self.assertEqual(list(pools[0].map(abs, [-1, -2])), [1, 2])
+        self.assertIsNot(shared_pool(('test', 3), 3), pools[0])
+
+
+class TestDocuments(unittest.TestCase):
+    """Tests for streamed upload processing"""
+
+    W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+    def write_docx(self, path, paragraphs, table_every=0):
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            with archive.open('word/document.xml', 'w') as f:
+                f.write(f'<w:document xmlns:w="{self.W}"><w:body>'.encode('utf-8'))
+                for i, text in enumerate(paragraphs):
+                    f.write(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'.encode('utf-8'))
+                    if table_every and i % table_every == 0:
+                        f.write('<w:tbl><w:tr><w:tc><w:p><w:r><w:t>भारत</w:t></w:r>'
+                                '<w:r><w:tab/><w:t>देश</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'.encode('utf-8'))
+                f.write(b'<w:sectPr/></w:body></w:document>')
+
+    def test_docx_paragraphs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'a.docx')
+            self.write_docx(path, ['मेरा नाम राहुल है।', ''], table_every=1)
+            self.assertEqual(list(iter_docx_paragraphs(path)),
+                             ['मेरा नाम राहुल है।', 'भारत\tदेश', '', 'भारत\tदेश'])
+
+            # Memory stays bounded by one block, not the document
+            self.write_docx(path, ['मेरा नाम राहुल है।'] * 50000, table_every=100)
+            tracemalloc.start()
+            try:
+                count = sum(1 for _ in iter_docx_paragraphs(path))
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(count, 50500)
+            self.assertLess(peak, 1024 * 1024)
+
+    def test_stream_text_document(self):
+        transliterator = get_transliterator('hindi')
+        lines = ['मेरा नाम राहुल है।', '', '  भारत महान है  ']
+        with tempfile.TemporaryDirectory() as tmp:
+            path = spool_upload(io.BytesIO('\n'.join(lines).encode('utf-8')), suffix='.txt',
+                                directory=tmp)
+            output = b''.join(stream_transliterated_document(path, '.txt')).decode('utf-8')
+            self.assertFalse(os.path.exists(path))
+        self.assertEqual(output.split('\n'),
+                         [transliterator.transliterate(lines[0]), '',
+                          transliterator.transliterate(lines[2].strip()), ''])
+
+    def test_rejects_bad_uploads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaisesRegex(ValueError, 'larger than'):
+                spool_upload(io.BytesIO(b'x' * 1000), max_bytes=100, directory=tmp)
+            self.assertEqual(os.listdir(tmp), [])
+
+            path = spool_upload(io.BytesIO(b'not a zip'), suffix='.docx', directory=tmp)
+            with self.assertRaisesRegex(ValueError, 'docx'):
+                check_document(path, '.docx')
+
+            path = spool_upload(io.BytesIO(b'not a pdf'), suffix='.pdf', directory=tmp)
+            with self.assertRaisesRegex(ValueError, 'pdf'):
+                check_document(path, '.pdf')
+
+    def write_pdf(self, path, page_texts):
+        """Minimal PDF with one line of Helvetica text per page"""
+        objects = ['<< /Type /Catalog /Pages 2 0 R >>', None,
+                   '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+        kids = []
+        for text in page_texts:
+            stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'
+            objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+            objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                           f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>')
+            kids.append(f'{len(objects)} 0 R')
+        objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+        data = b'%PDF-1.4\n'
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(len(data))
+            data += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+        xref = len(data)
+        data += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+        data += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+        data += (f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+                 f'startxref\n{xref}\n%%EOF\n').encode('latin-1')
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    def test_pdf_pages_in_order(self):
+        """Pages from the worker pool come back in page order, with timings"""
+        try:
+            import pypdf  # noqa: F401
+        except ImportError:
+            try:
+                import PyPDF2  # noqa: F401
+            except ImportError:
+                self.skipTest('pypdf is not installed')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'a.pdf')
+            self.write_pdf(path, [f'page {number}' for number in range(1, 10)])
+            self.assertEqual(pdf_page_count(path), 9)
+
+            serial = list(iter_pdf_pages(path, workers=1))
+            parallel = list(iter_pdf_pages(path, workers=3, max_in_flight=2))
+            self.assertEqual([page['page'] for page in parallel], list(range(1, 10)))
+            self.assertEqual([page['text'] for page in parallel], [page['text'] for page in serial])
+            self.assertIn('9', parallel[-1]['text'])
+            self.assertGreaterEqual(parallel[0]['extract_seconds'], 0)
+
+            output = b''.join(stream_transliterated_document(path, '.pdf', pdf_workers=2))
+            self.assertEqual(output.decode('utf-8').count('\n\n'), 8)
+            self.assertFalse(os.path.exists(path))
+
+    class TextPagesReader:
+        """PdfReader stand-in: a UTF-8 text file with pages separated by form feeds"""
+
+        class Page:
+            def __init__(self, text):
+                self.text = text
+
+            def extract_text(self):
+                # Give other threads a chance to run between pages
+                time.sleep(0.001)
+                return self.text
+
+        def __init__(self, path):
+            with open(path, encoding='utf-8') as f:
+                self.pages = [self.Page(text) for text in f.read().split('\f')]
+
+    def test_concurrent_pdf_documents(self):
+        """Documents processed at the same time each get their own pages back"""
+        self.addCleanup(shutdown_shared_pools)
+        words = ['नमस्ते', 'भारत', 'पुस्तक']
+        expected = [get_transliterator('hindi').transliterate(word) for word in words]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for number, word in enumerate(words):
+                path = os.path.join(tmp, f'{number}.pdf')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write('\f'.join([word] * 20))
+                paths.append(path)
+
+            # In-process pages, one request thread per document
+            results = {}
+            def run(path):
+                pages = iter_pdf_pages(path, workers=1, reader_class=self.TextPagesReader)
+                results[path] = [page['text'] for page in pages]
+            threads = [threading.Thread(target=run, args=(path,)) for path in paths]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            for path, text in zip(paths, expected):
+                self.assertEqual(results[path], [text] * 20)
+
+            # Pages of two documents interleaved in the shared worker pool
+            first = iter_pdf_pages(paths[0], workers=2, max_in_flight=3,
+                                   reader_class=self.TextPagesReader)
+            second = iter_pdf_pages(paths[1], workers=2, max_in_flight=3,
+                                    reader_class=self.TextPagesReader)
+            pages = list(zip(first, second))
+            self.assertEqual([a['page'] for a, _ in pages], list(range(1, 21)))
+            self.assertEqual({a['text'] for a, _ in pages}, {expected[0]})
+            self.assertEqual({b['text'] for _, b in pages}, {expected[1]})
+
+
+class TestDaemon(unittest.TestCase):
+    """Tests for the Unix-socket transliteration daemon"""
+
+    def test_protocol_round_trip(self):
+        left, right = socket.socketpair()
+        with left, right:
+            send_message(left, {'text': 'नमस्ते', 'texts': ['a'] * 3})
+            self.assertEqual(recv_message(right), {'text': 'नमस्ते', 'texts': ['a'] * 3})
+            left.close()
+            self.assertIsNone(recv_message(right))
+
+    def test_serves_concurrent_clients(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'daemon.sock')
+            process = subprocess.Popen(
+                [sys.executable, '-m', 'custom_indicate.daemon', '--socket', path,
+                 'serve', '--workers', '2', '--language', 'hindi'],
+                cwd=root, stdout=subprocess.DEVNULL)
+            try:
+                deadline = time.monotonic() + 30
+                while not os.path.exists(path) and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                text = 'मेरा नाम राहुल है।'
+                expected = EnhancedTransliterator('hindi').transliterate(text)
+
+                with DaemonClient(path, timeout=30) as first, DaemonClient(path, timeout=30) as second:
+                    self.assertEqual(first.transliterate(text), expected)
+                    self.assertEqual(second.transliterate_many([text, text]), [expected, expected])
+                    # Each worker serves one connection at a time
+                    self.assertNotEqual(first.ping(), second.ping())
+                    with self.assertRaisesRegex(RuntimeError, 'Unsupported language'):
+                        first.transliterate(text, language='tamil')
+                    self.assertEqual(first.transliterate(text), expected)
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+            self.assertFalse(os.path.exists(path))
+
+
+class TestProfiling(unittest.TestCase):
+    """Tests for the pipeline profiler"""
+
+    def test_profile_outputs(self):
+        """A profiled run writes pstats and stage-rooted collapsed stacks"""
+        transliterator = EnhancedTransliterator('hindi')
+        with tempfile.TemporaryDirectory() as tmp:
+            prefix = os.path.join(tmp, 'run')
+            with PipelineProfiler(prefix, interval=0.0005) as profiler:
+                for _ in range(200):
+                    transliterator.transliterate('मेरा नाम राहुल है। मैं भारत से हूँ।')
+            paths = profiler.write()
+
+            self.assertEqual(paths, [prefix + '.pstats', prefix + '.collapsed'])
+            self.assertIn('transliterate', profiler.top_functions(10))
+            with open(prefix + '.collapsed', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            self.assertRegex(stack, r'^\[\w+\];')
+            self.assertGreater(int(count), 0)
+        self.assertTrue(set(profiler.stage_samples()) & {'transliterate', 'schwa', 'postprocess'})
+
+        # Exception lookups are too short to be sampled reliably, so check that the
+        # engine calls the built-in lookups the 'exceptions' stage is keyed on
+        callers = {(os.path.basename(path), name): {caller[2] for caller in stats[4]}
+                   for (path, _, name), stats in pstats.Stats(profiler.profile).stats.items()}
+        for key in [('enhanced_transliteration.py', 'get_exception'),
+                    ('exceptions.py', 'get_named_entity')]:
+            self.assertIn('transliterate_preprocessed', callers.get(key, ()), key)
+        from custom_indicate.exceptions import get_named_entity
+        engine = EnhancedTransliterator.transliterate_preprocessed.__code__
+        self.assertEqual(_stage_of([engine, get_named_entity.__code__]), 'exceptions')
+
+    def test_memory_stage_peaks(self):
+        """Stage wrappers record peaks and are removed afterwards"""
+        from benchmarks.memory import deep_sizeof, stage_peaks
+        import custom_indicate.enhanced_transliteration as engine_module
+
+        transliterator = EnhancedTransliterator('hindi')
+        original = engine_module.preprocess_text
+        tracemalloc.start()
+        try:
+            stages = stage_peaks(transliterator, 'मेरा नाम राहुल है। ' * 200)
+        finally:
+            tracemalloc.stop()
+
+        self.assertIs(engine_module.preprocess_text, original)
+        self.assertEqual(stages['preprocess']['calls'], 1)
+        self.assertGreater(stages['context_aware']['peak'], 0)
+        self.assertGreater(deep_sizeof({'a': ['bc', 'de']}), deep_sizeof({'a': []}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,12 @@ Testing framework for the enhanced transliteration system.
 This implements the concepts described in testing_framework_explanation.py
 """
 
+import argparse
 import unittest
 import json
 import os
+import time
+from collections import deque
 from pathlib import Path
 
 # Import the enhanced transliteration module
@@ -14,6 +17,10 @@ from custom_indicate.enhanced_transliteration import (
     enhanced_hindi2english,
     enhanced_marathi2english
 )
+from custom_indicate.edit_distance import levenshtein, levenshtein_batch
+from custom_indicate.parallel import chunked, imap_bounded
+from custom_indicate.profiling import profile_call
+from custom_indicate.result_cache import engine_fingerprint, result_key
 
 class TransliterationTestDataset:
     """Class to manage test datasets for transliteration testing"""
@@ -30,6 +37,7 @@ class TransliterationTestDataset:
         self.language = language
         self.test_cases = []
         self.metadata = {}
+        self.source_file = None  # JSON Lines file streamed by iter_test_cases()
     
     def add_test_case(self, original, expected_transliteration, category=None, 
                       difficulty=None, tags=None):
@@ -55,9 +63,14 @@ class TransliterationTestDataset:
         """
         Load test cases from a JSON file
         
+        Files ending in .jsonl are streamed instead (see load_from_jsonl).
+        
         Args:
             file_path: Path to the JSON file containing test cases
         """
+        if str(file_path).endswith('.jsonl'):
+            return self.load_from_jsonl(file_path)
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -73,6 +86,77 @@ class TransliterationTestDataset:
             print(f"Error loading test dataset: {e}")
             return False
     
+    def load_from_jsonl(self, file_path):
+        """
+        Use a JSON Lines file as the source of test cases
+        
+        Each line holds one test case object; an optional first line of the form
+        {"metadata": {...}} holds the dataset metadata. Test cases are read lazily
+        by iter_test_cases(), so datasets larger than memory can be run.
+        
+        Args:
+            file_path: Path to the JSONL file
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                first_line = f.readline().strip()
+            if first_line:
+                first = json.loads(first_line)
+                if 'metadata' in first and 'original' not in first:
+                    self.metadata = first['metadata']
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            print(f"Error loading test dataset: {e}")
+            return False
+        
+        self.source_file = file_path
+        return True
+    
+    def iter_test_cases(self):
+        """
+        Iterate over the test cases: those added in memory, then those in the source file
+        
+        Yields:
+            Test case dicts
+        """
+        yield from self.test_cases
+        
+        if self.source_file is None:
+            return
+        
+        with open(self.source_file, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    test_case = json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"Error in test dataset line {line_number}: {e}")
+                    continue
+                if 'original' in test_case:
+                    yield test_case
+    
+    def save_to_jsonl(self, file_path):
+        """
+        Save test cases to a JSON Lines file, one test case per line
+        
+        Args:
+            file_path: Path to save the JSONL file
+        """
+        try:
+            os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+            
+            with open(file_path, 'w', encoding='utf-8') as f:
+                if self.metadata:
+                    f.write(json.dumps({'metadata': self.metadata}, ensure_ascii=False) + '\n')
+                for test_case in self.iter_test_cases():
+                    f.write(json.dumps(test_case, ensure_ascii=False) + '\n')
+                
+            return True
+        except Exception as e:
+            print(f"Error saving test dataset: {e}")
+            return False
+    
     def save_to_file(self, file_path):
         """
         Save test cases to a JSON file
@@ -107,7 +191,7 @@ class TransliterationTestDataset:
         Returns:
             List of filtered test cases
         """
-        return [tc for tc in self.test_cases if tc['category'] == category]
+        return [tc for tc in self.iter_test_cases() if tc.get('category', 'general') == category]
 
 
 class TransliterationEvaluator:
@@ -132,35 +216,36 @@ class TransliterationEvaluator:
             return 0.0
             
         # Calculate Levenshtein distance (character-level edit distance)
-        m, n = len(actual), len(expected)
-        
-        # Create distance matrix
-        distance = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
-        
-        for i in range(m + 1):
-            distance[i][0] = i
-        for j in range(n + 1):
-            distance[0][j] = j
-            
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if actual[i-1] == expected[j-1]:
-                    distance[i][j] = distance[i-1][j-1]
-                else:
-                    distance[i][j] = min(
-                        distance[i-1][j] + 1,    # deletion
-                        distance[i][j-1] + 1,    # insertion
-                        distance[i-1][j-1] + 1   # substitution
-                    )
+        distance = levenshtein(actual, expected)
         
         # Calculate accuracy as 1 - normalized edit distance
-        max_len = max(m, n)
+        max_len = max(len(actual), len(expected))
         if max_len == 0:
             return 1.0
             
-        accuracy = 1.0 - (distance[m][n] / max_len)
+        accuracy = 1.0 - (distance / max_len)
         return accuracy
     
+    def calculate_character_accuracy_batch(self, actuals, expecteds):
+        """
+        Calculate character-level accuracy for many results at once
+        
+        Args:
+            actuals: List of actual transliterations
+            expecteds: List of expected transliterations
+            
+        Returns:
+            List of accuracies, equal to calculate_character_accuracy() for each pair
+        """
+        distances = levenshtein_batch(actuals, expecteds)
+        accuracies = []
+        for actual, expected, distance in zip(actuals, expecteds, distances):
+            if not actual or not expected:
+                accuracies.append(0.0)
+            else:
+                accuracies.append(1.0 - (distance / max(len(actual), len(expected))))
+        return accuracies
+    
     def calculate_word_accuracy(self, actual, expected):
         """
         Calculate word-level accuracy
@@ -215,64 +300,129 @@ class TransliterationTestRunner:
         """
         self.datasets.append(dataset)
     
-    def run_tests(self, dataset_name=None, feature_flags=None):
+    def run_tests(self, dataset_name=None, feature_flags=None, workers=None,
+                  chunk_size=500, keep_results='all', max_failures=1000, progress=False,
+                  cache=None):
         """
         Run tests on specified dataset or all datasets
         
+        Test cases are streamed from each dataset and evaluated in chunks, either
+        in this process or in worker processes. Results come back in dataset
+        order either way, and statistics are accumulated as they arrive.
+        
         Args:
             dataset_name: Optional name of dataset to test
             feature_flags: Dict of feature flags to pass to transliterator
+            workers: Number of worker processes (None or 1 to run in this process)
+            chunk_size: Test cases per chunk
+            keep_results: 'all' to keep every detailed result, or 'failures' to keep
+                only failed cases (for large datasets)
+            max_failures: Maximum failed cases kept when keep_results is 'failures'
+            progress: Whether to print progress and throughput
+            cache: Optional ResultCache; cases whose input, flags and engine
+                fingerprint are unchanged reuse the stored transliteration
             
         Returns:
             Dict of test results
         """
         results = {}
+        keep_all = keep_results == 'all'
+        fingerprint = engine_fingerprint(self.transliterator) if cache is not None else None
         
         for dataset in self.datasets:
             if dataset_name and dataset.name != dataset_name:
                 continue
-                
+            
+            total = passed_count = 0
+            char_sum = word_sum = 0.0
+            dropped_failures = 0
+            cached_count = 0
             dataset_results = []
-            for test_case in dataset.test_cases:
-                # Run the transliteration
-                actual_result = self.transliterator.transliterate(
-                    test_case['original'],
-                    enable_features=feature_flags
-                )
-                
-                # Evaluate results
-                char_accuracy = self.evaluator.calculate_character_accuracy(
-                    actual_result, test_case['expected'])
-                word_accuracy = self.evaluator.calculate_word_accuracy(
-                    actual_result, test_case['expected'])
+            start = time.perf_counter()
+            
+            # Cache keys of chunks in flight, in submission order
+            pending = deque()
+            tasks = self._chunk_tasks(dataset, chunk_size, feature_flags, cache, fingerprint, pending)
+            for chunk_results in self._evaluate_chunks(tasks, feature_flags, keep_all, workers):
+                keys, cached_results = pending.popleft()
+                if keys is not None:
+                    new_results = [(key, result['actual_result'])
+                                   for key, cached, result in zip(keys, cached_results, chunk_results)
+                                   if cached is None]
+                    cache.put_many(new_results)
+                    cached_count += len(keys) - len(new_results)
                 
-                # Determine if test passed (80% word accuracy is passing)
-                passed = word_accuracy >= 0.8
+                for result in chunk_results:
+                    total += 1
+                    char_sum += result['evaluation']['char_accuracy']
+                    word_sum += result['evaluation']['word_accuracy']
+                    if result['passed']:
+                        passed_count += 1
+                    
+                    if 'test_case' not in result:
+                        continue
+                    if keep_all or len(dataset_results) < max_failures:
+                        result['index'] = total - 1
+                        dataset_results.append(result)
+                    else:
+                        dropped_failures += 1
                 
-                dataset_results.append({
-                    'test_case': test_case,
-                    'actual_result': actual_result,
-                    'evaluation': {
-                        'char_accuracy': char_accuracy,
-                        'word_accuracy': word_accuracy
-                    },
-                    'passed': passed
-                })
+                if progress:
+                    elapsed = time.perf_counter() - start
+                    print(f"  {dataset.name}: {total} cases ({total / max(elapsed, 1e-9):.0f} cases/s)")
             
             # Calculate overall statistics
             results[dataset.name] = {
-                'total_cases': len(dataset.test_cases),
-                'passed_cases': sum(1 for r in dataset_results if r['passed']),
+                'total_cases': total,
+                'passed_cases': passed_count,
                 'detailed_results': dataset_results,
-                'average_char_accuracy': sum(r['evaluation']['char_accuracy'] 
-                                         for r in dataset_results) / max(len(dataset_results), 1),
-                'average_word_accuracy': sum(r['evaluation']['word_accuracy'] 
-                                         for r in dataset_results) / max(len(dataset_results), 1),
+                'average_char_accuracy': char_sum / max(total, 1),
+                'average_word_accuracy': word_sum / max(total, 1),
             }
+            if not keep_all:
+                results[dataset.name]['dropped_failures'] = dropped_failures
+            if cache is not None:
+                results[dataset.name]['cached_cases'] = cached_count
+                results[dataset.name]['computed_cases'] = total - cached_count
         
         self.results = results
         return results
     
+    def _chunk_tasks(self, dataset, chunk_size, feature_flags, cache, fingerprint, pending):
+        """
+        Split a dataset into chunks, attaching cached results when a cache is used
+        
+        Yields:
+            (test cases, cached results or None) for each chunk; the cache keys
+            of each chunk are appended to pending
+        """
+        language = self.transliterator.language
+        for chunk in chunked(dataset.iter_test_cases(), chunk_size):
+            keys = cached_results = None
+            if cache is not None:
+                keys = [result_key(fingerprint, language, feature_flags, test_case['original'])
+                        for test_case in chunk]
+                cached_results = cache.get_many(keys)
+            pending.append((keys, cached_results))
+            yield chunk, cached_results
+    
+    def _evaluate_chunks(self, tasks, feature_flags, keep_all, workers):
+        """Evaluate chunks of test cases, yielding each chunk's results in order"""
+        if not workers or workers <= 1:
+            for chunk, cached_results in tasks:
+                yield _evaluate_test_cases(self.transliterator, self.evaluator,
+                                           chunk, cached_results, feature_flags, keep_all)
+            return
+        
+        # Workers build their own transliterator with the same language and flags
+        transliterator = self.transliterator
+        settings = {name: value for name, value in vars(transliterator).items()
+                    if name.startswith('enable_')}
+        initargs = (type(transliterator), transliterator.language, settings)
+        tasks = ((chunk, cached_results, feature_flags, keep_all) for chunk, cached_results in tasks)
+        yield from imap_bounded(_run_test_chunk, tasks, workers=workers,
+                                initializer=_init_test_worker, initargs=initargs)
+    
     def generate_report(self, output_format='text'):
         """
         Generate a detailed test report
@@ -300,10 +450,18 @@ class TransliterationTestRunner:
                 report.append(f"Success rate: {dataset_results['passed_cases'] / max(dataset_results['total_cases'], 1) * 100:.1f}%")
                 report.append(f"Average character accuracy: {dataset_results['average_char_accuracy'] * 100:.1f}%")
                 report.append(f"Average word accuracy: {dataset_results['average_word_accuracy'] * 100:.1f}%")
+                if 'cached_cases' in dataset_results:
+                    report.append(f"Cached results reused: {dataset_results['cached_cases']}, "
+                                  f"recomputed: {dataset_results['computed_cases']}")
                 
-                report.append("\nDetailed Results:")
-                for i, result in enumerate(dataset_results['detailed_results']):
-                    report.append(f"\n  Test Case {i+1}: " + ("PASSED" if result['passed'] else "FAILED"))
+                if 'dropped_failures' in dataset_results:
+                    report.append("\nFailed Cases:")
+                    if dataset_results['dropped_failures']:
+                        report.append(f"  ({dataset_results['dropped_failures']} more failures not shown)")
+                else:
+                    report.append("\nDetailed Results:")
+                for result in dataset_results['detailed_results']:
+                    report.append(f"\n  Test Case {result['index'] + 1}: " + ("PASSED" if result['passed'] else "FAILED"))
                     report.append(f"  Original: {result['test_case']['original']}")
                     report.append(f"  Expected: {result['test_case']['expected']}")
                     report.append(f"  Actual: {result['actual_result']}")
@@ -316,6 +474,64 @@ class TransliterationTestRunner:
             return "HTML report not implemented yet"
 
 
+def _evaluate_test_cases(transliterator, evaluator, test_cases, cached_results, feature_flags, keep_all):
+    """
+    Transliterate and score a chunk of test cases
+    
+    Args:
+        cached_results: Optional list of already known transliterations (None
+            entries are computed)
+    
+    Returns:
+        List of results; results of passed cases only carry the test case when keep_all is set
+    """
+    cached_results = cached_results or [None] * len(test_cases)
+    actual_results = [
+        cached if cached is not None
+        else transliterator.transliterate(test_case['original'], enable_features=feature_flags)
+        for test_case, cached in zip(test_cases, cached_results)
+    ]
+    expected_results = [test_case['expected'] for test_case in test_cases]
+    char_accuracies = evaluator.calculate_character_accuracy_batch(actual_results, expected_results)
+    
+    results = []
+    for test_case, actual_result, char_accuracy in zip(test_cases, actual_results, char_accuracies):
+        word_accuracy = evaluator.calculate_word_accuracy(actual_result, test_case['expected'])
+        
+        # Determine if test passed (80% word accuracy is passing)
+        passed = word_accuracy >= 0.8
+        
+        result = {}
+        if keep_all or not passed:
+            result['test_case'] = test_case
+        result['actual_result'] = actual_result
+        result['evaluation'] = {
+            'char_accuracy': char_accuracy,
+            'word_accuracy': word_accuracy
+        }
+        result['passed'] = passed
+        results.append(result)
+    
+    return results
+
+
+# Per-process state for parallel test runs
+_worker_transliterator = None
+_worker_evaluator = None
+
+def _init_test_worker(transliterator_class, language, settings):
+    global _worker_transliterator, _worker_evaluator
+    _worker_transliterator = transliterator_class(language)
+    for name, value in settings.items():
+        setattr(_worker_transliterator, name, value)
+    _worker_evaluator = TransliterationEvaluator()
+
+def _run_test_chunk(task):
+    test_cases, cached_results, feature_flags, keep_all = task
+    return _evaluate_test_cases(_worker_transliterator, _worker_evaluator,
+                                test_cases, cached_results, feature_flags, keep_all)
+
+
 # Test cases for each feature
 class TestTransliterationFeatures(unittest.TestCase):
     """Unit tests for enhanced transliteration features"""
@@ -501,12 +717,48 @@ def run_sample_tests():
     print(test_runner.generate_report())
 
 
+def run_dataset_file(file_path, language='hindi', workers=None):
+    """Run tests on a dataset file (.json or .jsonl) and print the report"""
+    dataset = TransliterationTestDataset(Path(file_path).stem, language)
+    if not dataset.load_from_file(file_path):
+        return None
+    
+    test_runner = TransliterationTestRunner(EnhancedTransliterator(language))
+    test_runner.add_dataset(dataset)
+    results = test_runner.run_tests(workers=workers, keep_results='failures', progress=True)
+    print(test_runner.generate_report())
+    return results
+
+
 if __name__ == "__main__":
-    # Run the unit tests
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
-    
-    # Run the sample test dataset
-    print("\n" + "=" * 60)
-    print("RUNNING SAMPLE DATASET TESTS")
-    print("=" * 60)
-    run_sample_tests()
+    parser = argparse.ArgumentParser(description='Transliteration tests')
+    parser.add_argument('--dataset', help='Run this dataset file (.json or .jsonl) instead of the unit tests')
+    parser.add_argument('--language', default='hindi', choices=['hindi', 'marathi'])
+    parser.add_argument('--workers', type=int, help='Worker processes for --dataset')
+    parser.add_argument('--profile', metavar='PREFIX',
+                        help='Profile the run, writing PREFIX.pstats and PREFIX.collapsed')
+    parser.add_argument('--top', type=int, default=20, help='Hot functions to list with --profile')
+    args = parser.parse_args()
+    
+    if args.dataset:
+        workers = args.workers
+        if args.profile and workers and workers > 1:
+            # Worker processes are not visible to the profiler
+            print("Profiling runs the tests in this process; ignoring --workers")
+            workers = None
+        run = lambda: run_dataset_file(args.dataset, args.language, workers)
+    else:
+        def run():
+            # Run the unit tests
+            unittest.main(argv=['first-arg-is-ignored'], exit=False)
+            
+            # Run the sample test dataset
+            print("\n" + "=" * 60)
+            print("RUNNING SAMPLE DATASET TESTS")
+            print("=" * 60)
+            run_sample_tests()
+    
+    if args.profile:
+        profile_call(run, args.profile, top=args.top)
+    else:
+        run()
@@ -0,0 +1,148 @@
+"""
+Warm-up for multi-worker deployments.
+Builds the shared engine for every language, runs each pipeline stage once
+so its regular expressions are compiled and its data files are loaded, and
+primes the schwa cache with common words. Called in the master process of a
+pre-forking server (e.g. gunicorn --preload), workers start warm and share
+the warmed pages copy-on-write instead of each building their own.
+"""
+
+import gc
+import os
+import threading
+import time
+
+from .enhanced_transliteration import get_transliterator
+from .schwa_deletion import SCHWA_CACHE_SIZE
+from .schwa_lexicon import read_word_list, transliterate_word
+
+LANGUAGES = ['hindi', 'marathi']
+
+# Texts that reach every stage: exceptions, named entities, context words,
+# sentence ends, quotes, abbreviations, Latin words, digits and nukta forms
+WARMUP_TEXTS = {
+    'hindi': [
+        'नमस्ते दुनिया! मेरा नाम राहुल है। कल मैं दिल्ली गया था, और आज मुंबई में हूँ? '
+        '"भारत" एक देश है। डॉ. शर्मा को ज़रूर email भेजा।',
+        'भारत की कहानी',
+        '2024 में',
+    ],
+    'marathi': [
+        'नमस्कार! माझे नाव राहुल आहे. काल मी मुंबईला गेलो होतो, आणि आज पुण्यात आहे? '
+        '"महाराष्ट्र" हे राज्य आहे। श्री. पाटील आले आणि ळ email पाठवला।',
+        'मराठी भाषा',
+        '2024 मध्ये',
+    ],
+}
+
+# Feature flag sets that together run every optional stage
+WARMUP_FLAGS = [
+    None,
+    {'context_aware': True, 'statistical_schwa': True, 'auto_exceptions': True,
+     'phonetic_refinement': True, 'auto_capitalization': True, 'schwa_model': True},
+    {'context_aware': False, 'statistical_schwa': False, 'auto_exceptions': False,
+     'phonetic_refinement': False, 'auto_capitalization': False, 'schwa_model': False},
+]
+
+_status = {
+    'ready': False,
+    'languages': [],
+    'primed_words': 0,
+    'seconds': None,
+    'frozen': False,
+    'skipped': False,
+    'pid': None,
+}
+
+# Background warm-up started by start_warm_up
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def warm_up(languages=None, word_list=None, word_limit=SCHWA_CACHE_SIZE, freeze=True):
+    """
+    Warm up the engines in this process
+
+    Args:
+        languages: Languages to warm up (default: all)
+        word_list: Optional word list file (one word per line, most frequent
+            first) whose words are run through the schwa engine to fill its cache
+        word_limit: Maximum number of words primed per language
+        freeze: Whether to move everything allocated so far into the
+            garbage collector's permanent generation (gc.freeze), so that
+            collections in forked workers do not write to the shared pages
+
+    Returns:
+        Dict with the warm-up status
+    """
+    start = time.perf_counter()
+    languages = languages or LANGUAGES
+    primed = 0
+
+    for language in languages:
+        transliterator = get_transliterator(language)
+        for text in WARMUP_TEXTS.get(language, []):
+            for flags in WARMUP_FLAGS:
+                transliterator.transliterate(text, flags)
+
+        if word_list:
+            try:
+                words = read_word_list(word_list, word_limit)
+            except OSError as e:
+                print(f"Error reading warm-up word list: {e}")
+                words = []
+            for word in words:
+                transliterate_word(word, language)
+            primed += len(words)
+
+    if freeze and hasattr(gc, 'freeze'):
+        gc.collect()
+        gc.freeze()
+
+    _status.update({
+        'ready': True,
+        'languages': list(languages),
+        'primed_words': primed,
+        'seconds': time.perf_counter() - start,
+        'frozen': freeze,
+        'pid': os.getpid(),
+    })
+    return warmup_status()
+
+
+def start_warm_up(**kwargs):
+    """
+    Warm up in a background thread, unless warm-up has completed or is running
+
+    For servers that load the app without wsgi.py (e.g. flask run or
+    gunicorn app:app), where nothing warms up before requests arrive.
+
+    Args:
+        **kwargs: Arguments for warm_up
+
+    Returns:
+        Whether a warm-up thread was started
+    """
+    global _thread
+    with _thread_lock:
+        if _status['ready'] or (_thread is not None and _thread.is_alive()):
+            return False
+        _thread = threading.Thread(target=warm_up, kwargs=kwargs, name='warm-up', daemon=True)
+        _thread.start()
+        return True
+
+
+def mark_ready():
+    """Report this process as ready without warming up (warm-up disabled)"""
+    _status.update({'ready': True, 'skipped': True, 'pid': os.getpid()})
+    return warmup_status()
+
+
+def warmup_status():
+    """Copy of the warm-up status (inherited by forked workers)"""
+    return dict(_status)
+
+
+def is_ready():
+    """Whether warm-up has completed in this process (or its parent before fork)"""
+    return _status['ready']
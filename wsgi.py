@@ -0,0 +1,27 @@
+"""
+WSGI entry point for production servers.
+Warms up the transliteration engines at import. With a pre-forking server
+that preloads the app, warm-up runs once in the master and the workers are
+forked warm, sharing the engines' memory copy-on-write:
+
+    gunicorn --preload --workers 4 wsgi:app
+
+Set TRANSLITERATE_WARMUP=0 to skip warm-up (/ready then reports ready at
+once), and TRANSLITERATE_WARMUP_WORDS to a word list (one word per line, most
+frequent first) to prime the schwa cache.
+"""
+
+import os
+
+from app import app, db, init_db
+from custom_indicate.warmup import mark_ready, warm_up
+
+init_db()
+# Connections opened in the master must not be shared by the forked workers
+with app.app_context():
+    db.engine.dispose()
+
+if os.environ.get('TRANSLITERATE_WARMUP', '1') != '0':
+    warm_up(word_list=os.environ.get('TRANSLITERATE_WARMUP_WORDS'))
+else:
+    mark_ready()